@@ -1,41 +1,141 @@
 import bpy
 import os
+import sys
 
-SCRIPTS_ROOT = r"C:\rukmini_ai_loop\scripts"
-C_DIR = os.path.join(SCRIPTS_ROOT, "C_series")
+# Shared lorqb package lives at the repo root, next to the open .blend (lorqb.paths)
+if "lorqb" not in sys.modules:
+    sys.path.insert(0, os.path.dirname(bpy.data.filepath))
 
-def run_c_script(filename):
-    import bpy as _bpy
-    globs = {"bpy": _bpy, "_unregister_all_lorqb": lambda: None}
-    with open(os.path.join(C_DIR, filename), "r", encoding="utf-8") as f:
-        exec(f.read(), globs)
+from lorqb import framecache, loader
+from lorqb.ballbake import bake_ball
+from lorqb.canon import COLORS
+from lorqb.compositor import compose
+from lorqb.plans import legs_for, turn_order
+from lorqb.registry import register_classes
+from lorqb.sequence import build_transfer
+
+def run_c_script(key):
+    # Loaded once as a module; re-compiled only when the file changes on disk
+    return loader.run(key)
 
 class LORQB_OT_RunC12(bpy.types.Operator):
     bl_idname = "lorqb.run_c12"
     bl_label  = "Run C12: Blue -> Red"
     def execute(self, context):
-        run_c_script("C12_blue_to_red.py")
+        if not run_c_script("C12"):
+            self.report({'ERROR'}, "C12 failed — check console")
         return {'FINISHED'}
 
 class LORQB_OT_RunC13(bpy.types.Operator):
     bl_idname = "lorqb.run_c13"
     bl_label  = "Run C13: Red -> Green"
     def execute(self, context):
-        run_c_script("C13_red_to_green.py")
+        if not run_c_script("C13"):
+            self.report({'ERROR'}, "C13 failed — check console")
         return {'FINISHED'}
 
 class LORQB_OT_RunC14(bpy.types.Operator):
     bl_idname = "lorqb.run_c14"
     bl_label  = "Run C14: Green -> Yellow"
     def execute(self, context):
-        run_c_script("C14_green_to_yellow.py")
+        if not run_c_script("C14"):
+            self.report({'ERROR'}, "C14 failed — check console")
         return {'FINISHED'}
 
 class LORQB_OT_RunC15(bpy.types.Operator):
     bl_idname = "lorqb.run_c15"
     bl_label  = "Run C15: Yellow -> Blue"
     def execute(self, context):
-        run_c_script("C15_yellow_to_blue.py")
+        if not run_c_script("C15"):
+            self.report({'ERROR'}, "C15 failed — check console")
+        return {'FINISHED'}
+
+COLOR_ITEMS = [(c, c, f"Cube_{c}") for c in COLORS]
+
+class LORQB_OT_ArmTransfer(bpy.types.Operator):
+    """Arm any cube-to-cube transfer from its spec (no script file needed)"""
+    bl_idname  = "lorqb.arm_transfer"
+    bl_label   = "Arm Transfer"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(name="From", items=COLOR_ITEMS, default="Blue")
+    dest:   bpy.props.EnumProperty(name="To",   items=COLOR_ITEMS, default="Red")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        try:
+            # Precomputed plan table first; two-leg fallback for multi-stage plans
+            legs = legs_for(self.source, self.dest)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not build_transfer(legs):
+            self.report({'ERROR'}, "Transfer failed — check console")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{self.source} -> {self.dest} armed ({len(legs[0].stages) or 1} stage(s))")
+        return {'FINISHED'}
+
+class LORQB_OT_ArmLevel(bpy.types.Operator):
+    """Arm a whole level — every turn end to end on one timeline"""
+    bl_idname  = "lorqb.arm_level"
+    bl_label   = "Arm Level"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    order:   bpy.props.StringProperty(name="Order", default="Blue>Red>Green>Yellow")
+    cyclic:  bpy.props.BoolProperty(name="Back to start", default=True)
+    shuffle: bpy.props.BoolProperty(name="Shuffle", default=False)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        order = turn_order() if self.shuffle else [c.strip() for c in self.order.split(">")]
+        try:
+            ok = compose(order, cyclic=self.cyclic)
+        except (KeyError, ValueError) as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if not ok:
+            self.report({'ERROR'}, "Level failed — check console")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Level {' -> '.join(order)} armed — press Play")
+        return {'FINISHED'}
+
+class LORQB_OT_CachedPlayback(bpy.types.Operator):
+    """Scrub from the frame cache (constraints and animation muted) — or back to live"""
+    bl_idname  = "lorqb.cached_playback"
+    bl_label   = "Cached Playback"
+
+    def execute(self, context):
+        if framecache.is_engaged():
+            framecache.release()
+            self.report({'INFO'}, "Live evaluation restored")
+            return {'FINISHED'}
+        if not framecache.engage(context.scene):
+            self.report({'ERROR'}, "Nothing armed — arm a sequence first")
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Cached playback on")
+        return {'FINISHED'}
+
+class LORQB_OT_BakeBall(bpy.types.Operator):
+    """Bake the Ball's latch motion to plain location / rotation keys"""
+    bl_idname  = "lorqb.bake_ball"
+    bl_label   = "Bake Ball"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    strip: bpy.props.BoolProperty(name="Remove latches + seats", default=False)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        result = bake_ball(strip=self.strip, scene=context.scene)
+        if result is None:
+            self.report({'ERROR'}, "No Ball — build the scene with C10 first")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Ball baked: {result['frames']} frames")
         return {'FINISHED'}
 
 class LORQB_PT_MasterPanel(bpy.types.Panel):
@@ -53,20 +153,27 @@ class LORQB_PT_MasterPanel(bpy.types.Panel):
         layout.operator("lorqb.run_c13", icon='PLAY')
         layout.operator("lorqb.run_c14", icon='PLAY')
         layout.operator("lorqb.run_c15", icon='PLAY')
+        layout.separator()
+        layout.operator("lorqb.arm_transfer", icon='CONSTRAINT')
+        layout.operator("lorqb.arm_level", icon='SEQUENCE')
+        layout.separator()
+        engaged = framecache.is_engaged()
+        layout.operator("lorqb.cached_playback", icon='PAUSE' if engaged else 'PLAY',
+                        depress=engaged)
+        layout.operator("lorqb.bake_ball", icon='REC')
 
 classes = [
     LORQB_OT_RunC12,
     LORQB_OT_RunC13,
     LORQB_OT_RunC14,
     LORQB_OT_RunC15,
+    LORQB_OT_ArmTransfer,
+    LORQB_OT_ArmLevel,
+    LORQB_OT_CachedPlayback,
+    LORQB_OT_BakeBall,
     LORQB_PT_MasterPanel,
 ]
 
-for cls in classes:
-    try:
-        bpy.utils.unregister_class(cls)
-    except Exception:
-        pass
-    bpy.utils.register_class(cls)
+register_classes("C01_lorQB_Master_Runner", classes)
 
 print("LorQB Master Panel registered — N-panel > LorQB tab.")
@@ -1,23 +1,42 @@
-# C10_scene_build.py  — v4  (Blender 5.1.0 compatible — Material colors fixed)
+# C10_scene_build.py  — v5  (Blender 5.1.0 compatible — procedural cube mesh)
 import bpy
+import os
+import sys
+
+# Shared lorqb package lives at the repo root, next to the open .blend (lorqb.paths)
+if "lorqb" not in sys.modules:
+    sys.path.insert(0, os.path.dirname(bpy.data.filepath))
+
+from lorqb.latches import ensure_latches
+from lorqb.meshcache import assign_material, hollow_cube_mesh, material, uv_sphere_mesh
+from lorqb.purge import purge_unused
+from lorqb.registry import register_classes, unregister_owner
 
 bpy.context.scene.render.engine = 'BLENDER_WORKBENCH'
 
-for area in bpy.context.screen.areas:
-    if area.type == 'VIEW_3D':
-        space = area.spaces[0]
-        space.shading.type = 'SOLID'
-        space.shading.color_type = 'OBJECT'
-        break
+# No screen in background mode (blender -b / lorqb_batch.py)
+if not bpy.app.background and bpy.context.screen is not None:
+    for area in bpy.context.screen.areas:
+        if area.type == 'VIEW_3D':
+            space = area.spaces[0]
+            space.shading.type = 'SOLID'
+            space.shading.color_type = 'OBJECT'
+            break
 
 
 ################################################################################
 # SECTION 1: Clear scene helper
 ################################################################################
-def clear_scene():
+def clear_scene(release=True):
     for obj in bpy.data.objects:
         bpy.data.objects.remove(obj, do_unlink=True)
     print("=== Scene cleared ===")
+    if release:
+        release_shared_data()
+
+def release_shared_data():
+    # LorQB meshes, materials and actions nobody uses any more (lorqb.purge)
+    return purge_unused()
 
 ################################################################################
 # SECTION 2: Function to create a hollow cube with circular openings
@@ -28,77 +47,8 @@ def clear_scene():
 #   Red    (bottom-right): 1 hole — top only
 #   Green  (bottom-left):  1 hole — top only
 ################################################################################
-def create_hollow_cube(location, color, side_hole_direction=None):
-    """
-    side_hole_direction:
-        None       = no side hole (Red, Green)
-        'left'     = side hole on LEFT face  (Blue — faces Yellow)
-        'right'    = side hole on RIGHT face (Yellow — faces Blue)
-    """
-    # Adjust location so cube bottom face sits on the ground
-    location = (location[0], location[1], location[2] + 0.5)
-
-    # --- Outer cube ---
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    outer_cube = bpy.context.object
-
-    # --- Inner cube for hollow effect ---
-    bpy.ops.mesh.primitive_cube_add(size=0.955, location=location)
-    inner_cube = bpy.context.object
-
-    bool_mod = outer_cube.modifiers.new(name="Boolean", type='BOOLEAN')
-    bool_mod.operation = 'DIFFERENCE'
-    bool_mod.object = inner_cube
-    bpy.context.view_layer.objects.active = outer_cube
-    bpy.ops.object.modifier_apply(modifier="Boolean")
-    bpy.data.objects.remove(inner_cube)
-
-    # --- Top hole ---
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.3, depth=0.6,
-        location=(location[0], location[1], location[2] + 0.5)
-    )
-    top_cylinder = bpy.context.object
-    # Top cylinder is vertical by default — no rotation needed
-
-    bool_mod_top = outer_cube.modifiers.new(name="Boolean_Top_Hole", type='BOOLEAN')
-    bool_mod_top.operation = 'DIFFERENCE'
-    bool_mod_top.object = top_cylinder
-    bpy.context.view_layer.objects.active = outer_cube
-    bpy.ops.object.modifier_apply(modifier="Boolean_Top_Hole")
-    bpy.data.objects.remove(top_cylinder)
-
-    # --- Side hole (Blue and Yellow only) ---
-    if side_hole_direction == 'left':
-        # Blue: side hole on LEFT face (negative X side) — faces Yellow
-        side_location = (location[0] - 0.5, location[1], location[2])
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.3, depth=0.6,
-            location=side_location
-        )
-        side_cylinder = bpy.context.object
-        side_cylinder.rotation_euler[1] = 1.5708  # Rotate 90° around Y — aligns along X axis
-
-    elif side_hole_direction == 'right':
-        # Yellow: side hole on RIGHT face (positive X side) — faces Blue
-        side_location = (location[0] + 0.5, location[1], location[2])
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.3, depth=0.6,
-            location=side_location
-        )
-        side_cylinder = bpy.context.object
-        side_cylinder.rotation_euler[1] = 1.5708  # Rotate 90° around Y — aligns along X axis
-
-    if side_hole_direction in ('left', 'right'):
-        bool_mod_side = outer_cube.modifiers.new(name="Boolean_Side_Hole", type='BOOLEAN')
-        bool_mod_side.operation = 'DIFFERENCE'
-        bool_mod_side.object = side_cylinder
-        bpy.context.view_layer.objects.active = outer_cube
-        bpy.ops.object.modifier_apply(modifier="Boolean_Side_Hole")
-        bpy.data.objects.remove(side_cylinder)
-
-    # --- Material (Blender 5.1.0 compatible) ---
-    mat = bpy.data.materials.new(name=f"Mat_{outer_cube.name}")
+def setup_cube_material(mat, color):
+    """Blender 5.1.0 compatible translucent cube material."""
     mat.use_nodes = True
 
     # Set viewport display color with full opacity for solid mode visibility
@@ -120,7 +70,38 @@ def create_hollow_cube(location, color, side_hole_direction=None):
     if hasattr(mat, "use_backface_culling"):
         mat.use_backface_culling = False
 
-    outer_cube.data.materials.append(mat)
+def create_hollow_cube(location, color, side_hole_direction=None, name="Cube", pivot=None):
+    """
+    side_hole_direction:
+        None       = no side hole (Red, Green)
+        'left'     = side hole on LEFT face  (Blue — faces Yellow)
+        'right'    = side hole on RIGHT face (Yellow — faces Blue)
+    pivot:
+        World point that becomes the object origin (the cube's hinge).
+        None = origin at the cube centre.
+
+    Mesh is generated directly (lorqb.mesh) and cached (lorqb.meshcache) —
+    no boolean modifiers, no bpy.ops, same shell: size 1, inner 0.955,
+    holes r=0.3.
+    """
+    # Adjust location so cube bottom face sits on the ground
+    center = (location[0], location[1], location[2] + 0.5)
+    if pivot is None:
+        pivot = center
+    origin = tuple(pivot[i] - center[i] for i in range(3))
+
+    holes = ["top"]
+    if side_hole_direction in ('left', 'right'):
+        holes.append(side_hole_direction)
+
+    # Cubes with the same holes and pivot offset share one mesh datablock
+    outer_cube = bpy.data.objects.new(name, hollow_cube_mesh(holes=holes, origin=origin))
+    outer_cube.location = pivot
+    bpy.context.collection.objects.link(outer_cube)
+
+    # --- Material (shared per colour, linked to the object) ---
+    mat = material(f"Mat_{name}", color, setup=lambda m: setup_cube_material(m, color))
+    assign_material(outer_cube, mat)
 
     # Set object viewport display color (key for Solid mode)
     outer_cube.color = (*color, 1.0)
@@ -131,7 +112,8 @@ def create_hollow_cube(location, color, side_hole_direction=None):
 # SECTION 3: Build full scene
 ################################################################################
 def build_scene():
-    clear_scene()
+    # Keep cached meshes/materials alive so the rebuild links them again
+    clear_scene(release=False)
 
     locations = [
         (-0.51, -0.51, 0),  # Bottom-left  (Green)
@@ -145,36 +127,43 @@ def build_scene():
     green_color  = (0.0, 1.0, 0.0)  # Green  — bottom-left
     red_color    = (1.0, 0.0, 0.0)  # Red    — bottom-right
 
+    # Cube pivots sit on their hinges (Blue/Red/Green/Yellow → hinge edge)
+    pivots = {
+        'blue':   ( 0.51,  0.0,  1.0),
+        'red':    ( 0.0,  -0.51, 1.0),
+        'green':  (-0.51,  0.0,  1.0),
+        'yellow': (-0.51,  0.0,  1.0),
+    }
+
     cubes = {}
     for location in locations:
         if location[0] > 0 and location[1] > 0:       # Blue — top-right
-            cubes['blue'] = create_hollow_cube(location, blue_color, side_hole_direction='left')
-            cubes['blue'].name = "Cube_Blue"
+            cubes['blue'] = create_hollow_cube(location, blue_color, side_hole_direction='left',
+                                               name="Cube_Blue", pivot=pivots['blue'])
         elif location[0] < 0 and location[1] > 0:     # Yellow — top-left
-            cubes['yellow'] = create_hollow_cube(location, yellow_color, side_hole_direction='right')
-            cubes['yellow'].name = "Cube_Yellow"
+            cubes['yellow'] = create_hollow_cube(location, yellow_color, side_hole_direction='right',
+                                                 name="Cube_Yellow", pivot=pivots['yellow'])
         elif location[0] < 0 and location[1] < 0:     # Green — bottom-left
-            cubes['green'] = create_hollow_cube(location, green_color, side_hole_direction=None)
-            cubes['green'].name = "Cube_Green"
+            cubes['green'] = create_hollow_cube(location, green_color, side_hole_direction=None,
+                                                name="Cube_Green", pivot=pivots['green'])
         elif location[0] > 0 and location[1] < 0:     # Red — bottom-right
-            cubes['red'] = create_hollow_cube(location, red_color, side_hole_direction=None)
-            cubes['red'].name = "Cube_Red"
+            cubes['red'] = create_hollow_cube(location, red_color, side_hole_direction=None,
+                                              name="Cube_Red", pivot=pivots['red'])
 
     # ── Ball ────────────────────────────────────────────────────────────────
     if 'blue' in cubes:
-        cube            = cubes['blue']
-        cube_dimensions = cube.dimensions
-        cube_location   = cube.location
-        ball_radius     = 0.25
+        cube_center = (0.51, 0.51, 0.5)   # Blue's centre (origin is on its hinge)
+        cube_size   = 1.0
+        ball_radius = 0.25
 
         bottom_center = (
-            cube_location.x,
-            cube_location.y,
-            cube_location.z - (cube_dimensions.z / 2) + ball_radius * 0.99
+            cube_center[0],
+            cube_center[1],
+            cube_center[2] - (cube_size / 2) + ball_radius * 0.99
         )
-        bpy.ops.mesh.primitive_uv_sphere_add(radius=ball_radius, location=bottom_center)
-        ball = bpy.context.object
-        ball.name = "Ball"
+        ball = bpy.data.objects.new("Ball", uv_sphere_mesh(radius=ball_radius))
+        ball.location = bottom_center
+        bpy.context.collection.objects.link(ball)
 
     # ── Hinges ──────────────────────────────────────────────────────────────
     bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0.51, 0, 1), scale=(0.1, 0.1, 0.1))
@@ -189,57 +178,19 @@ def build_scene():
     hinge_3 = bpy.context.object
     hinge_3.name = "Hinge_Green_Yellow"
 
-    # ── Cube pivots → hinge locations ───────────────────────────────────────
-    bpy.context.view_layer.objects.active = cubes['blue']
-    cubes['blue'].select_set(True)
-    bpy.context.scene.cursor.location = (0.51, 0, 1)
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    cubes['blue'].select_set(False)
-
-    bpy.context.view_layer.objects.active = cubes['red']
-    cubes['red'].select_set(True)
-    bpy.context.scene.cursor.location = (0, -0.51, 1)
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    cubes['red'].select_set(False)
-
-    bpy.context.view_layer.objects.active = cubes['green']
-    cubes['green'].select_set(True)
-    bpy.context.scene.cursor.location = (-0.51, 0, 1)
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    cubes['green'].select_set(False)
-
-    bpy.context.view_layer.objects.active = cubes['yellow']
-    cubes['yellow'].select_set(True)
-    bpy.context.scene.cursor.location = (-0.51, 0, 1)
-    bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-    cubes['yellow'].select_set(False)
-
-    # ── Seats ───────────────────────────────────────────────────────────────
-    seat_config = {
-        'blue':   ( 0.51,  0.51, 0.0),
-        'red':    ( 0.51, -0.51, 0.0),
-        'green':  (-0.51, -0.51, 0.0),
-        'yellow': (-0.51,  0.51, 0.0),
-    }
-
-    seats = {}
-    for color_key, seat_loc in seat_config.items():
-        bpy.ops.object.select_all(action='DESELECT')
-        bpy.ops.object.empty_add(type='PLAIN_AXES', location=seat_loc, scale=(0.05, 0.05, 0.05))
-        seat = bpy.context.object
-        seat.name = f"Seat_{color_key.capitalize()}"
-        seat.location.x = seat_loc[0]
-        seat.location.y = seat_loc[1]
-        seat.location.z = seat_loc[2]
-        seats[color_key] = seat
-
-    print("Seat empties created:")
-    for key, seat in seats.items():
-        print(f"  {seat.name} @ {tuple(round(v, 4) for v in seat.location)}")
+    # ── Seats + ball latches (persistent — kept by every reset) ────────────
+    bpy.context.view_layer.update()
+    latches = ensure_latches()
+    print("Seat empties + latches created:")
+    for color, con in latches.cons.items():
+        seat = con.target
+        print(f"  {seat.name} @ {tuple(round(v, 4) for v in seat.matrix_world.translation)}"
+              f"  ← {con.name}")
 
     # ── Force viewport shading to show material colors (Blender 5.1.0) ─────────
-    # Set all 3D viewports to show material colors
-    for window in bpy.context.window_manager.windows:
+    # Set all 3D viewports to show material colors (none when headless)
+    windows = [] if bpy.app.background else bpy.context.window_manager.windows
+    for window in windows:
         for area in window.screen.areas:
             if area.type == 'VIEW_3D':
                 for space in area.spaces:
@@ -261,6 +212,7 @@ def build_scene():
     print("  Hinge_Red_Green    @ ( 0,    -0.51, 1) — bottom edge")
     print("  Hinge_Green_Yellow @ (-0.51,  0,    1) — left edge")
     print("Cube pivots set correctly to their respective hinges.")
+    release_shared_data()
 
 ################################################################################
 # SECTION 4: UI Panel
@@ -307,19 +259,11 @@ _classes = [LORQB_OT_reset_c10, LORQB_OT_build_c10, LORQB_PT_c10_panel]
 # SECTION 5: Register / Entry Point
 ################################################################################
 def register():
-    for cls in _classes:
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception:
-            pass
-        bpy.utils.register_class(cls)
+    register_classes("C10_scene_build", _classes)
 
 def unregister():
-    for cls in reversed(_classes):
-        try:
-            bpy.utils.unregister_class(cls)
-        except Exception:
-            pass
-
-register()
-build_scene()
+    unregister_owner("C10_scene_build")
+
+if __name__ == "__main__":
+    register()
+    build_scene()
@@ -0,0 +1,5 @@
+# ============================================================================
+# C_series  (Blender 5.1.1)
+# C-series sequence scripts as importable modules (see lorqb/loader.py).
+# Each file still runs standalone from Blender's Text Editor (Alt+P).
+# ============================================================================
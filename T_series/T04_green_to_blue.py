@@ -1,61 +1,166 @@
+# ============================================================================
+# T04_green_to_blue.py  (Blender 5.1.1)
+# T4 — Green → Blue
+#
+# Two moves, no detachment, each playable on its own from the panel:
+#   Stage 1  (  1– 80): HRG 180°    — Green flips over Red
+#   Stage 2  ( 80–160): HBR 68.43°  — Red tips, Green's seat lands over Blue's
+#   Frame 161:          Ball transfers Green → Blue
+#   Return   (161–200): HBR back to 0°
+#   Return   (200–240): HRG back to 0°
+#
+# Hierarchy:
+#   HBR (root)
+#   └── Red → HRG → Green → HGY → Yellow
+#   Blue (unparented — fixed destination)
+#
+# Stages, frames and signs: lorqb.stages.STAGED["T04"], taken from the
+# solver's plan for Green → Blue (lorqb.plans); built by
+# lorqb.staging.build_staged(). The stage buttons arm T4 if needed and
+# jump to the end of that stage.
+# ============================================================================
+
 import bpy
+import os
+import sys
 
-# Registration for the panel and operators
-def register():
-    bpy.utils.register_class(PanelHBR)
-    bpy.utils.register_class(OperatorGreen)
-    bpy.utils.register_class(OperatorHRG)
-    bpy.utils.register_class(OperatorTransfer)
-    bpy.utils.register_class(OperatorReturn)
-
-# Panel Definition
-class PanelHBR(bpy.types.Panel):
-    bl_label = "HBR Panel"
-    bl_idname = "PT_HBR"
-    bl_space_type = 'VIEW_3D'
-    bl_region_type = 'UI'
-    bl_category = 'HBR'
+# Shared lorqb package lives at the repo root, next to the open .blend (lorqb.paths)
+if "lorqb" not in sys.modules:
+    sys.path.insert(0, os.path.dirname(bpy.data.filepath))
 
-    def draw(self, context):
-        layout = self.layout
-        layout.operator(OperatorGreen.bl_idname)
-        layout.operator(OperatorHRG.bl_idname)
-        layout.operator(OperatorTransfer.bl_idname)
-        layout.operator(OperatorReturn.bl_idname)
+from lorqb.registry import register_classes, unregister_owner
+from lorqb.stages import STAGED
+from lorqb.staging import build_staged, describe, reset_for, step
+
+###############################################################################
+# SECTION 1: Spec
+###############################################################################
+
+SPEC = STAGED["T04"]
+STAGE_1, STAGE_2 = (st.label for st in SPEC.stages[:2])
+
+###############################################################################
+# SECTION 2: Reset
+###############################################################################
 
-# Operator Definitions
-class OperatorGreen(bpy.types.Operator):
-    bl_idname = "object.green_operator"
-    bl_label = "Green Operator"
+def reset_scene_to_canonical():
+    reset_for(SPEC)
+    print("=== T4 reset to canonical ===")
+
+###############################################################################
+# SECTION 3: Animation
+###############################################################################
+
+def run_animation():
+    print("=== T4 Start: Green → Blue ===")
+    if not build_staged(SPEC):
+        return False
+    print("=== T4 Complete: Green → Blue ===")
+    for line in describe(SPEC):
+        print(line)
+    return True
+
+def run_step(operator, label):
+    frame = step(SPEC, label)
+    if frame is None:
+        operator.report({'ERROR'}, "T4 failed — check console")
+    else:
+        operator.report({'INFO'}, f"T4 {label} — frame {frame}")
+    return {'FINISHED'}
+
+###############################################################################
+# SECTION 4: UI Panel
+###############################################################################
+
+class LORQB_OT_reset_t4(bpy.types.Operator):
+    bl_idname      = "lorqb.reset_t4"
+    bl_label       = "Reset to Base"
+    bl_description = "Reset all objects to canonical state"
 
     def execute(self, context):
-        # Logic for Green 90° stage
+        reset_scene_to_canonical()
+        self.report({'INFO'}, "T4 reset to base")
         return {'FINISHED'}
 
-class OperatorHRG(bpy.types.Operator):
-    bl_idname = "object.hrg_operator"
-    bl_label = "HRG Operator"
+class LORQB_OT_run_t4(bpy.types.Operator):
+    bl_idname      = "lorqb.run_t4"
+    bl_label       = "Run T4: Green → Blue"
+    bl_description = "Arm T4 animation: Green transfers ball to Blue"
 
     def execute(self, context):
-        # Logic for HRG 90° stage
+        result = run_animation()
+        if result:
+            self.report({'INFO'}, "T4 armed — press Play to run")
+        else:
+            self.report({'ERROR'}, "T4 failed — check console")
         return {'FINISHED'}
 
-class OperatorTransfer(bpy.types.Operator):
-    bl_idname = "object.transfer_operator"
-    bl_label = "Transfer Operator"
+class LORQB_OT_t4_hrg(bpy.types.Operator):
+    bl_idname      = "lorqb.t4_hrg"
+    bl_label       = STAGE_1
+    bl_description = "Stage 1: HRG flips Green over Red (frame 80)"
 
     def execute(self, context):
-        # Logic for transfer at frame 161
-        return {'FINISHED'}
+        return run_step(self, STAGE_1)
 
-class OperatorReturn(bpy.types.Operator):
-    bl_idname = "object.return_operator"
-    bl_label = "Return Operator"
+class LORQB_OT_t4_hbr(bpy.types.Operator):
+    bl_idname      = "lorqb.t4_hbr"
+    bl_label       = STAGE_2
+    bl_description = "Stage 2: HBR tips Green's seat over Blue's (frame 160)"
 
     def execute(self, context):
-        # Logic for return at frame 161
-        return {'FINISHED'}
+        return run_step(self, STAGE_2)
+
+class LORQB_OT_t4_transfer(bpy.types.Operator):
+    bl_idname      = "lorqb.t4_transfer"
+    bl_label       = "Transfer"
+    bl_description = "Ball transfers Green → Blue (frame 161)"
+
+    def execute(self, context):
+        return run_step(self, "Transfer")
+
+class LORQB_OT_t4_return(bpy.types.Operator):
+    bl_idname      = "lorqb.t4_return"
+    bl_label       = "Return"
+    bl_description = "HBR and HRG back to 0° (frame 240)"
+
+    def execute(self, context):
+        return run_step(self, "Return")
+
+class LORQB_PT_t4_panel(bpy.types.Panel):
+    bl_label       = "LorQB — T4"
+    bl_idname      = "LORQB_PT_t4_panel"
+    bl_space_type  = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category    = "LorQB"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator("lorqb.reset_t4", text="Reset to Base", icon='LOOP_BACK')
+        layout.separator()
+        layout.operator("lorqb.run_t4",   text="Run T4: Green → Blue", icon='PLAY')
+        layout.separator()
+        col = layout.column(align=True)
+        col.operator("lorqb.t4_hrg",      text=STAGE_1)
+        col.operator("lorqb.t4_hbr",      text=STAGE_2)
+        col.operator("lorqb.t4_transfer", text="Transfer")
+        col.operator("lorqb.t4_return",   text="Return")
+
+_classes = [
+    LORQB_OT_reset_t4, LORQB_OT_run_t4,
+    LORQB_OT_t4_hrg, LORQB_OT_t4_hbr, LORQB_OT_t4_transfer, LORQB_OT_t4_return,
+    LORQB_PT_t4_panel,
+]
+
+###############################################################################
+# SECTION 5: Register / Entry Point
+###############################################################################
+
+def register():
+    register_classes("T04_green_to_blue", _classes)
+
+def unregister():
+    unregister_owner("T04_green_to_blue")
 
-# Final registration call
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    register()
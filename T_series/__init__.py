@@ -0,0 +1,5 @@
+# ============================================================================
+# T_series  (Blender 5.1.1)
+# T-series sequence scripts as importable modules (see lorqb/loader.py).
+# Each file still runs standalone from Blender's Text Editor (Alt+P).
+# ============================================================================
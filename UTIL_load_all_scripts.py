@@ -4,26 +4,38 @@
 # What it does:
 #   1. Loads all C and T scripts from disk (linked as external files)
 #      → After this, Blender shows "Text is newer on disk — Reload" when files change.
-#   2. Executes T01, T02, T03 to register their panels immediately.
-#      → All three T panels appear in the LorQB N-panel tab right away.
-#   3. C10–C15 are loaded but NOT auto-executed.
+#   2. Imports T01–T04 as modules (lorqb.loader) and registers their panels.
+#      → All four T panels appear in the LorQB N-panel tab right away.
+#      → Running this again only re-imports scripts whose file changed on disk.
+#   3. Starts the hot-reload watcher (lorqb.watcher).
+#      → Saving a loaded script swaps just that module — no Alt+P needed.
+#   4. Loads the precomputed cube-pair plan table (lorqb/plans.json).
+#      → Any turn order is a table lookup (C01 "Arm Transfer").
+#   5. C10–C15 are loaded but NOT auto-executed.
 #      → Run each C script manually (Alt+P or its panel button) when needed.
 
 import bpy
 import os
+import sys
 
-SCRIPTS_DIR = r"C:\Users\cogas\source\repos\cogaston0\LorQB-Blender"
-C_DIR = os.path.join(SCRIPTS_DIR, "C_series")
-T_DIR = os.path.join(SCRIPTS_DIR, "T_series")
+# Repo root = folder of the open .blend (C17_Master_Runner.blend); see lorqb.paths
+if not bpy.data.filepath:
+    raise RuntimeError("Open C17_Master_Runner.blend from the repo first")
+if "lorqb" not in sys.modules:
+    sys.path.insert(0, os.path.dirname(bpy.data.filepath))
+
+from lorqb import loader, plans, watcher
+from lorqb.paths import script_path
 
 # Load + execute: T scripts coexist safely (each only unregisters its own class)
 EXECUTE = [
     ("T", "T01_blue_to_green.py"),
     ("T", "T02_yellow_to_red.py"),
     ("T", "T03_red_to_yellow.py"),
+    ("T", "T04_green_to_blue.py"),
 ]
 
-# Load only: C scripts use _unregister_all_lorqb() which removes all panels
+# Load only: C scripts run on demand (their own Alt+P / C01 master panel)
 LOAD_ONLY = [
     ("C", "C10_scene_build.py"),
     ("C", "C12_blue_to_red.py"),
@@ -34,12 +46,9 @@ LOAD_ONLY = [
 
 ALL_SCRIPTS = LOAD_ONLY + EXECUTE
 
-def script_path(group, filename):
-    return os.path.join(C_DIR if group == "C" else T_DIR, filename)
-
 print("\n=== Step 1: Loading scripts from disk ===")
 for group, filename in ALL_SCRIPTS:
-    filepath = script_path(group, filename)
+    filepath = script_path(f"{group}_series", filename[:-3])
     if not os.path.exists(filepath):
         print(f"  MISSING: {filepath}")
         continue
@@ -51,15 +60,19 @@ for group, filename in ALL_SCRIPTS:
 
 print("\n=== Step 2: Registering T panels ===")
 for group, filename in EXECUTE:
-    filepath = script_path(group, filename)
+    filepath = script_path(f"{group}_series", filename[:-3])
     if not os.path.exists(filepath):
         print(f"  MISSING: {filepath}")
         continue
-    with open(filepath, 'r', encoding='utf-8') as f:
-        code = f.read()
-    exec(compile(code, filepath, 'exec'), {"__name__": "__main__"})
+    loader.load_module(f"{group}_series", filename[:-3], register=True)
     print(f"  Registered: {filename}")
 
+print("\n=== Step 3: Starting hot-reload watcher ===")
+watcher.start()
+
+print("\n=== Step 4: Loading transfer plan table ===")
+print(f"  {plans.load()} cube-pair plans for geometry {plans.geometry_hash()}")
+
 print("\n=== Done ===")
-print("T01 / T02 / T03 panels active in LorQB N-panel tab.")
+print("T01 / T02 / T03 / T04 panels active in LorQB N-panel tab.")
 print("To activate a C script panel: open it in Text Editor → Alt+P.")
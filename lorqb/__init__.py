@@ -0,0 +1,7 @@
+# ============================================================================
+# lorqb  (Blender 5.1.1)
+# Shared helpers for the LorQB C-series and T-series sequence scripts.
+#
+# The C/T scripts add the repo root to sys.path and import from here, so a
+# helper fixed once is fixed for every sequence.
+# ============================================================================
@@ -0,0 +1,101 @@
+# ============================================================================
+# lorqb/ballbake.py  (Blender 5.1.1)
+# Bake the Ball's constraint-driven motion to plain keyframes.
+#
+# The Ball only moves through keyed influences on its latch constraints,
+# which target seat empties parented deep in the cube / hinge chain — so
+# every frame of playback, render or export evaluates that whole chain.
+# bake_ball() reads the Ball's world matrix over the frame range (from
+# lorqb.framecache, sampled once if not cached), turns it into location +
+# continuous XYZ Euler curves (lorqb.kinematics.to_euler_xyz) and writes
+# them as one Action with KeyBatch (keyframe_points.add + foreach_set).
+#
+# The latches are then switched off (influence 0, curves gone with the
+# old Action); strip=True removes them and their seat empties instead.
+# Re-arming a sequence resets the Ball as usual; after strip=True run C10
+# (or lorqb.latches.ensure_latches()) to get the persistent latches back.
+#
+# Usage (Blender console, after arming a sequence):
+#   from lorqb.ballbake import bake_ball
+#   bake_ball()               # keep latches (off) and seats
+#   bake_ball(strip=True)     # lightest scene for playback / export
+# ============================================================================
+
+import bpy
+
+from lorqb import framecache
+from lorqb.canon import BALL
+from lorqb.keyframes import KeyBatch
+from lorqb.kinematics import to_euler_xyz
+from lorqb.library import clear_track
+from lorqb.purge import track
+from lorqb.sampler import sample
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+ACTION_NAME = "LorQB_Ball_Bake"
+
+def _seats(ball):
+    """Seat empties the ball's latches target."""
+    return list(dict.fromkeys(
+        con.target for con in ball.constraints
+        if getattr(con, "target", None) is not None and con.target.type == 'EMPTY'
+        and con.target.name.startswith("Seat_")))
+
+################################################################################
+# SECTION 2: Bake
+################################################################################
+def bake_ball(strip=False, scene=None):
+    """Replace the Ball's latch motion with keyed location / rotation.
+
+    Returns {"frames", "keys", "removed"} or None when there is no Ball.
+    """
+    scene = scene or bpy.context.scene
+    ball  = scene.objects.get(BALL)
+    if ball is None:
+        print("ballbake: no Ball — build the scene with C10 first.")
+        return None
+
+    # --- 1: Evaluate before anything changes ---
+    entry = framecache.ensure(scene)
+    if entry is not None and BALL in entry.names:
+        traj = entry.traj
+    else:
+        traj = sample((BALL,), scene=scene)   # nothing armed: plain sampling
+    world = traj.matrix(BALL).astype(float)
+    frames    = traj.frames
+    locations = world[:, :3, 3]
+    eulers    = to_euler_xyz(world)
+    framecache.release()
+
+    # --- 2: Detach from the latches ---
+    removed = []
+    if ball.parent is not None:
+        ball.parent = None   # keys are world-space
+    if strip:
+        seats = _seats(ball)
+        for con in list(ball.constraints):
+            ball.constraints.remove(con)
+        for seat in seats:
+            removed.append(seat.name)
+            bpy.data.objects.remove(seat, do_unlink=True)
+    else:
+        for con in ball.constraints:
+            con.influence = 0.0
+
+    # --- 3: One Action, every frame keyed in bulk ---
+    clear_track(ball)
+    ad = ball.animation_data or ball.animation_data_create()
+    ad.action = track(bpy.data.actions.new(ACTION_NAME))
+    ball.rotation_mode = 'XYZ'
+    keys = KeyBatch()
+    for axis in range(3):
+        keys.extend(ball, "location", axis, frames, locations[:, axis])
+        keys.extend(ball, "rotation_euler", axis, frames, eulers[:, axis])
+    written = keys.flush()
+
+    scene.frame_set(scene.frame_current)
+    print(f"ballbake: {len(frames)} frames, {written} keys"
+          + (f", removed {', '.join(removed)}" if removed else "") + ".")
+    return {"frames": len(frames), "keys": written, "removed": removed}
@@ -0,0 +1,181 @@
+# ============================================================================
+# lorqb/batch.py  (Blender 5.1.1)
+# Headless sequence runs: build, arm, evaluate every frame, collect results.
+#
+# Every sequence used to be started from an N-panel button. Here the same
+# entry functions (lorqb.loader.SEQUENCES) are called directly, the armed
+# frame range is sampled once (lorqb.sampler) and the evaluated world
+# position of each LorQB object is recorded per frame. UI-only code is
+# skipped by the scripts themselves when bpy.app.background is set.
+#
+# A key is a catalog entry ("C12", "T01"), a spec-built transfer
+# ("Blue>Green", lorqb.plans.legs_for) — any ordered cube pair — or a
+# whole level on one timeline ("Blue>Red>Green>Yellow>Blue", lorqb.level).
+#
+# Driven from the command line by lorqb_batch.py at the repo root.
+# ============================================================================
+
+import json
+import time
+import traceback
+
+import bpy
+
+from lorqb import framecache, loader
+from lorqb.canon import ALL_NAMES, COLORS
+from lorqb.clearance import check as check_clearance
+from lorqb.compositor import compose
+from lorqb.continuity import check as check_continuity
+from lorqb.diagnostics import diagnose
+from lorqb.expect import for_key, influence_for
+from lorqb.plans import legs_for
+from lorqb.sampler import sample
+from lorqb.sequence import build_transfer
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+BUILD_KEY = "C10"
+DIGITS    = 6
+
+def default_sequences():
+    """Every catalog entry except the scene build, in catalog order."""
+    return [key for key in loader.SEQUENCES if key != BUILD_KEY]
+
+def transfer_key(source, dest):
+    return f"{source}>{dest}"
+
+def all_pairs():
+    """All 12 ordered cube pairs: "Blue>Red", ..."""
+    return [transfer_key(a, b) for a in COLORS for b in COLORS if a != b]
+
+def parse_transfer(key):
+    """(source, dest) for a "Blue>Green" key, else None."""
+    source, sep, dest = key.partition(">")
+    if sep and source in COLORS and dest in COLORS and source != dest:
+        return source, dest
+    return None
+
+def parse_level(key):
+    """[color, ...] for a key with three or more stops, else None."""
+    stops = key.split(">")
+    if (len(stops) > 2 and all(c in COLORS for c in stops)
+            and all(a != b for a, b in zip(stops, stops[1:]))):
+        return stops
+    return None
+
+def missing_objects():
+    return [name for name in ALL_NAMES if name not in bpy.data.objects]
+
+################################################################################
+# SECTION 2: Evaluate
+################################################################################
+def evaluate_frames(names=ALL_NAMES):
+    """{name: [[x, y, z] per frame]} over the scene frame range.
+
+    Read from the frame cache when the armed scene is cached (lorqb.framecache),
+    else sampled (lorqb.sampler).
+    """
+    traj = framecache.trajectory()
+    if traj is None or not set(names) <= set(traj.names):
+        traj = sample(names)
+    locs = traj.locations().round(DIGITS)
+    return {name: locs[:, traj.index(name)].tolist() for name in names
+            if name in bpy.data.objects}
+
+################################################################################
+# SECTION 3: Run
+################################################################################
+def arm(key):
+    """Arm key in the open scene; raises if it is unknown or reports failure."""
+    pair  = parse_transfer(key)
+    stops = parse_level(key)
+    if pair is not None:
+        ok = build_transfer(legs_for(*pair))
+    elif stops is not None:
+        ok = compose(stops)
+    elif key in loader.SEQUENCES:
+        ok = loader.run(key)
+    else:
+        raise KeyError(f"unknown sequence {key!r}")
+    # Entry functions return False on failure (None: nothing to report)
+    if ok is False:
+        raise RuntimeError(f"{key} reported failure — see console")
+
+def diagnose_sequence(key):
+    """Spec-driven checks for key (lorqb.diagnostics), or None without a spec."""
+    try:
+        for_key(key)
+    except KeyError:
+        return None
+    return diagnose(key, quiet=True)
+
+def continuity_sequence(key):
+    """Ball jump across every latch switch of key, or None without a spec."""
+    try:
+        influence_for(key)
+    except KeyError:
+        return None
+    return check_continuity(key, quiet=True)
+
+def run_sequence(key, frames=True, checks=False, continuity=False, clearance=False):
+    """Arm one sequence and evaluate it. Never raises — errors go in the result."""
+    result = {"ok": False, "error": None, "seconds": 0.0, "frame_range": None}
+    t0 = time.perf_counter()
+    try:
+        arm(key)
+        scene = bpy.context.scene
+        result["frame_range"] = [scene.frame_start, scene.frame_end]
+        # One sampling pass; the frame dump and every check read from it
+        if frames or checks or continuity or clearance:
+            framecache.ensure(scene)
+        if frames:
+            result["frames"] = evaluate_frames()
+        diagnosis = diagnose_sequence(key) if checks else None
+        if diagnosis is not None:
+            result["diagnostics"] = diagnosis
+            if not diagnosis["ok"]:
+                failed = diagnosis["total"] - diagnosis["passed"]
+                raise RuntimeError(f"{key}: {failed} diagnostic check(s) failed")
+        jumps = continuity_sequence(key) if continuity else None
+        if jumps is not None:
+            result["continuity"] = jumps
+            if not jumps["ok"]:
+                bad = [j["frame"] for j in jumps["jumps"] if not j["ok"]]
+                raise RuntimeError(f"{key}: ball jumps at latch swap frame(s) {bad} "
+                                   f"(tolerance {jumps['tol']})")
+        if clearance:
+            result["clearance"] = walls = check_clearance()
+            if not walls["ok"]:
+                raise RuntimeError(f"{key}: ball penetrates a cube wall on "
+                                   f"{len(walls['penetrations'])} frame(s), deepest "
+                                   f"{walls['min_clearance']:.4f} m at frame {walls['min_frame']}")
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    result["seconds"] = round(time.perf_counter() - t0, 3)
+    print(f"lorqb.batch: {key} {'ok' if result['ok'] else 'FAILED'} ({result['seconds']}s)")
+    return result
+
+def run_all(keys, build=False, frames=True, checks=False, continuity=False,
+            clearance=False):
+    """Build the scene when asked (or when objects are missing), then run keys."""
+    results = {}
+    if build or missing_objects():
+        results[BUILD_KEY] = run_sequence(BUILD_KEY, frames=False)
+    for key in keys:
+        results[key] = run_sequence(key, frames=frames, checks=checks,
+                                    continuity=continuity, clearance=clearance)
+    return results
+
+def write_results(path, results):
+    report = {
+        "blender":   bpy.app.version_string,
+        "blend":     bpy.data.filepath,
+        "ok":        all(r["ok"] for r in results.values()),
+        "sequences": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    return report
@@ -0,0 +1,93 @@
+# ============================================================================
+# lorqb/canon.py
+# Canonical LorQB scene layout — object names and fixed world positions.
+# Pure Python (no bpy) so it can be shared by Blender and offline tools.
+#
+# Chain: Blue — Red — Green — Yellow (snake chain, hinged on top)
+# ============================================================================
+
+BALL = "Ball"
+
+COLORS = ["Blue", "Red", "Green", "Yellow"]
+
+CUBE_NAMES = ["Cube_Blue", "Cube_Red", "Cube_Green", "Cube_Yellow"]
+
+HINGE_NAMES = ["Hinge_Blue_Red", "Hinge_Red_Green", "Hinge_Green_Yellow"]
+
+# Every object a reset touches (animation, constraints, parenting)
+ALL_NAMES = [BALL] + CUBE_NAMES + HINGE_NAMES
+
+SEAT_NAMES = ["Seat_Blue", "Seat_Red", "Seat_Green", "Seat_Yellow"]
+
+# Chain order, end to end — every hinge sits between its two cubes
+CHAIN_ORDER = [
+    "Cube_Blue", "Hinge_Blue_Red", "Cube_Red", "Hinge_Red_Green",
+    "Cube_Green", "Hinge_Green_Yellow", "Cube_Yellow",
+]
+
+# rotation_euler index of each hinge's axis (0 = X, 1 = Y)
+HINGE_AXIS = {
+    "Hinge_Blue_Red":     0,
+    "Hinge_Red_Green":    1,
+    "Hinge_Green_Yellow": 0,
+}
+
+# Hinge empties sit on the top edge shared by two neighbouring cubes
+HINGE_WORLD = {
+    "Hinge_Blue_Red":     ( 0.51,  0.0,  1.0),
+    "Hinge_Red_Green":    ( 0.0,  -0.51, 1.0),
+    "Hinge_Green_Yellow": (-0.51,  0.0,  1.0),
+}
+
+# Bottom interior center of each cube — where the ball rests
+SEAT_WORLD = {
+    "Cube_Blue":   ( 0.51,  0.51, 0.25),
+    "Cube_Red":    ( 0.51, -0.51, 0.25),
+    "Cube_Green":  (-0.51, -0.51, 0.25),
+    "Cube_Yellow": (-0.51,  0.51, 0.25),
+}
+
+# Canonical WORLD positions, two conventions in use:
+#   SEATED_LAYOUT — cube origins at their seats (C12–C14, C14_DIAG)
+#   PIVOT_LAYOUT  — cube origins at their pivot hinges, as C10 builds them
+#                   (C15, T01, T03)
+SEATED_LAYOUT = {
+    "Cube_Blue":          ( 0.51,  0.51, 0.25),
+    "Cube_Red":           ( 0.51, -0.51, 0.25),
+    "Cube_Green":         (-0.51, -0.51, 0.25),
+    "Cube_Yellow":        (-0.51,  0.51, 0.25),
+    "Hinge_Blue_Red":     ( 0.51,  0.0,  1.0),
+    "Hinge_Red_Green":    ( 0.0,  -0.51, 1.0),
+    "Hinge_Green_Yellow": (-0.51,  0.0,  1.0),
+}
+
+PIVOT_LAYOUT = {
+    "Cube_Blue":          ( 0.51,  0.0,  1.0),
+    "Cube_Red":           ( 0.0,  -0.51, 1.0),
+    "Cube_Green":         (-0.51,  0.0,  1.0),
+    "Cube_Yellow":        (-0.51,  0.0,  1.0),
+    "Hinge_Blue_Red":     ( 0.51,  0.0,  1.0),
+    "Hinge_Red_Green":    ( 0.0,  -0.51, 1.0),
+    "Hinge_Green_Yellow": (-0.51,  0.0,  1.0),
+}
+
+LAYOUTS = {
+    "SEATED": SEATED_LAYOUT,
+    "PIVOT":  PIVOT_LAYOUT,
+}
+
+# Canonical parent chain, root first (Rule 2 + Rule 6)
+# Hinge_GY → Cube_Green → Hinge_RG → Cube_Red → Hinge_BR → Cube_Blue
+CANONICAL_CHAIN = [
+    ("Cube_Green",      "Hinge_Green_Yellow"),
+    ("Hinge_Red_Green", "Cube_Green"),
+    ("Cube_Red",        "Hinge_Red_Green"),
+    ("Hinge_Blue_Red",  "Cube_Red"),
+    ("Cube_Blue",       "Hinge_Blue_Red"),
+]
+
+def cube_name(color):
+    return f"Cube_{color}"
+
+def seat_name(color):
+    return f"Seat_{color}"
@@ -0,0 +1,107 @@
+# ============================================================================
+# lorqb/chain.py  (Blender 5.1.1)
+# Closed-form parent-chain solver.
+#
+# Blender evaluates   world = parent_world @ parent_inverse @ basis
+#
+# Rebuilding a chain link-by-link with parent_preserve_world() needs a
+# view_layer.update() after every link so the next link reads a fresh
+# matrix_world. When every world matrix is already known (canonical rest
+# pose) the parent inverse of each link is just inv(parent_world), so the
+# whole chain can be assigned in one pass and evaluated once.
+#
+# Transfers arm their carry links on top of the canonical chain the reset
+# rebuilt (apply_over): links whose parent moves with the carry but whose
+# child does not are detached first, so the carry never closes a loop or
+# drags a fixed cube along.
+# ============================================================================
+
+import bpy
+
+################################################################################
+# SECTION 1: Solver — pure mathutils
+################################################################################
+def solve_chain(chain, worlds):
+    """Solve every link of chain against known world matrices.
+
+    chain  — ((child, parent), ...) root first
+    worlds — {name: world Matrix} the pose the chain must preserve
+
+    Returns [(child, parent, parent_inverse, basis), ...]. Links whose
+    child or parent has no known world are skipped.
+    """
+    links = []
+    for child, parent in chain:
+        if child not in worlds or parent not in worlds:
+            continue
+        parent_world   = worlds[parent]
+        parent_inverse = parent_world.inverted_safe()
+        # Same as assigning matrix_world after parenting: world is unchanged
+        basis = (parent_world @ parent_inverse).inverted_safe() @ worlds[child]
+        links.append((child, parent, parent_inverse, basis))
+    return links
+
+def detached(base, carry):
+    """Links of base to drop before carry: the parent moves, the child does not."""
+    moving   = {name for link in carry for name in link}
+    children = {child for child, _ in carry}
+    return tuple((child, parent) for child, parent in base
+                 if parent in moving and child not in children)
+
+################################################################################
+# SECTION 2: Apply — one pass, one depsgraph update
+################################################################################
+def current_worlds(names):
+    """World matrices read without a depsgraph update.
+
+    Unparented objects use matrix_basis (built straight from loc/rot/scale);
+    parented ones fall back to matrix_world, which must already be current.
+    """
+    worlds = {}
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        worlds[name] = (obj.matrix_basis if obj.parent is None
+                        else obj.matrix_world).copy()
+    return worlds
+
+def apply_chain(chain, worlds=None, update=True):
+    """Parent every link of chain while keeping world transforms.
+
+    worlds defaults to current_worlds() of every name in chain.
+    Returns the number of links assigned.
+    """
+    if worlds is None:
+        names = []
+        for child, parent in chain:
+            for name in (child, parent):
+                if name not in names:
+                    names.append(name)
+        worlds = current_worlds(names)
+
+    links = solve_chain(chain, worlds)
+    for child_name, parent_name, parent_inverse, basis in links:
+        child = bpy.data.objects[child_name]
+        child.parent = bpy.data.objects[parent_name]
+        child.matrix_parent_inverse = parent_inverse
+        child.matrix_basis = basis
+
+    if update and links:
+        bpy.context.view_layer.update()
+    return len(links)
+
+def apply_over(base, carry, update=True):
+    """Re-parent carry on top of a scene parented by base (lorqb.reset).
+
+    Returns the number of carry links assigned.
+    """
+    names = list(dict.fromkeys(name for link in (*base, *carry) for name in link))
+    worlds = current_worlds(names)
+    for child_name, _ in detached(base, carry):
+        child = bpy.data.objects.get(child_name)
+        if child is not None and child.parent is not None:
+            child.parent = None
+            child.matrix_parent_inverse.identity()
+            child.matrix_basis = worlds[child_name]
+    return apply_chain(carry, worlds, update)
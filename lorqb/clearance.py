@@ -0,0 +1,116 @@
+# ============================================================================
+# lorqb/clearance.py  (Blender 5.1.1)
+# Ball vs. hollow-cube clearance along the trajectory.
+#
+# Nothing checked that the 0.25-radius ball stays inside the 0.955 cavity
+# or threads the 0.3-radius holes during a flip. Cubes are only ever moved
+# as rigid objects, so each cube mesh gets one BVHTree in its own local
+# space — built once per mesh (four meshes, one BVH each: every cube has
+# its own meshcache key) and reused for every frame and every sequence.
+# Per sampled frame the ball centre is taken into each cube's local frame
+# and find_nearest() gives the distance to that cube's walls;
+# clearance = distance - radius.
+#
+# Negative clearance is penetration. The ball rests 0.0225 into the floor
+# (C10 seats it on the outer bottom, the wall is 0.0225 thick), so TOL
+# lets resting contact pass and flags anything deeper.
+#
+# Usage (Blender console, after arming a sequence):
+#   from lorqb.clearance import check
+#   check()                     # scene frame range
+# Bulk: lorqb_batch.py -- --clearance, lorqb_validate.py --clearance
+# ============================================================================
+
+import bpy
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from lorqb import framecache
+from lorqb.canon import BALL, CUBE_NAMES
+from lorqb.mesh import BALL_RADIUS
+from lorqb.meshcache import TAG
+from lorqb.sampler import sample
+
+################################################################################
+# SECTION 1: Constants + BVH cache
+################################################################################
+TOL    = 0.03   # metres of penetration allowed (resting contact)
+DIGITS = 4
+
+# mesh key -> BVHTree in mesh-local space
+_trees = {}
+
+def _mesh_key(mesh):
+    """Generated meshes are tagged with their shape; others by name + size."""
+    return mesh.get(TAG) or (mesh.name, len(mesh.vertices), len(mesh.polygons))
+
+def tree_for(obj, depsgraph=None):
+    """Local-space BVHTree of obj's mesh (shared by every object using it)."""
+    key = _mesh_key(obj.data)
+    tree = _trees.get(key)
+    if tree is None:
+        depsgraph = depsgraph or bpy.context.evaluated_depsgraph_get()
+        tree = BVHTree.FromObject(obj, depsgraph)
+        _trees[key] = tree
+    return tree
+
+def clear_cache():
+    _trees.clear()
+
+################################################################################
+# SECTION 2: Clearance
+################################################################################
+def clearance(traj, cubes=CUBE_NAMES, radius=BALL_RADIUS):
+    """(F, C) clearance of the ball to each cube's walls over a Trajectory.
+
+    traj must include the Ball and the cubes (lorqb.sampler.sample()).
+    Missing cubes (or frames) come back as NaN.
+    """
+    objs  = bpy.data.objects
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    ball  = traj.location(BALL)
+    out   = np.full((len(traj.frames), len(cubes)), np.nan)
+    for j, name in enumerate(cubes):
+        obj = objs.get(name)
+        if obj is None or name not in traj.names:
+            continue
+        tree = tree_for(obj, depsgraph)
+        world = traj.matrix(name).astype(np.float64)
+        # Ball centre in cube-local space, all frames at once
+        local = np.linalg.solve(world, np.c_[ball, np.ones(len(ball))][..., None])[..., :3, 0]
+        # Rigid motion: local distances scale by the object's uniform scale
+        scale = np.cbrt(np.abs(np.linalg.det(world[:, :3, :3])))
+        for i, point in enumerate(local):
+            if np.isnan(point).any():
+                continue
+            hit = tree.find_nearest(Vector(point))
+            if hit[0] is not None:
+                out[i, j] = hit[3] * scale[i] - radius
+    return out
+
+def check(traj=None, tol=TOL, cubes=CUBE_NAMES, radius=BALL_RADIUS):
+    """Per-frame clearance report for the armed scene (JSON-ready)."""
+    traj = traj if traj is not None else framecache.trajectory()
+    traj = traj if traj is not None else sample((BALL, *cubes))
+    table = clearance(traj, cubes, radius)
+    table = np.where(np.isnan(table), np.inf, table)
+    nearest = table.argmin(axis=1)
+    worst   = table.min(axis=1)
+
+    frames = [{
+        "frame":     int(f),
+        "cube":      cubes[nearest[i]] if np.isfinite(worst[i]) else None,
+        "clearance": round(float(worst[i]), DIGITS) if np.isfinite(worst[i]) else None,
+    } for i, f in enumerate(traj.frames)]
+    known  = [row for row in frames if row["clearance"] is not None]
+    hits   = [row["frame"] for row in known if row["clearance"] < -tol]
+    lowest = min(known, key=lambda row: row["clearance"], default=None)
+    return {
+        "ok":            not hits,
+        "tol":           tol,
+        "min_clearance": lowest["clearance"] if lowest else None,
+        "min_frame":     lowest["frame"] if lowest else None,
+        "penetrations":  hits,
+        "frames":        frames,
+    }
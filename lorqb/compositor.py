@@ -0,0 +1,116 @@
+# ============================================================================
+# lorqb/compositor.py  (Blender 5.1.1)
+# Arms a whole level (lorqb.level) in the open scene — one timeline, one
+# playback, no re-arming between turns.
+#
+# build_level(level) resets once, leaves every cube and hinge free-standing
+# at the level's layout and sets the frame range to cover every turn. The
+# motion itself is NLA strips of the turns' library Actions (lorqb.library,
+# baked once per turn); strips=False writes the same curves as plain keys
+# in one KeyBatch flush instead. compose(order) goes straight from a cube
+# order.
+# ============================================================================
+
+import bpy
+import mathutils
+
+from lorqb.canon import BALL
+from lorqb.framecache import mark_armed
+from lorqb.keyframes import KeyBatch
+from lorqb.latches import LatchSet
+from lorqb.level import compile_order, format_level
+from lorqb.library import place_level
+from lorqb.reset import layout_profile, reset_scene
+from lorqb.sequence import create_seat, remove_rigid_body
+
+# Scene property holding the armed level ("Blue>Red>Green>Yellow>Blue")
+ARMED = "lorqb_level"
+
+################################################################################
+# SECTION 1: Reset profile
+################################################################################
+def reset_profile(level):
+    # No chain: every turn's carry is baked into world-space keys, which
+    # only play back right on free-standing objects
+    return layout_profile(level.layout, tuple(seat for seat, _, _ in level.seats), chain=())
+
+def reset_for(level):
+    bpy.context.scene.pop(ARMED, None)
+    return reset_scene(reset_profile(level))
+
+################################################################################
+# SECTION 2: Build
+################################################################################
+def _write_keys(level, objs):
+    keys = KeyBatch()
+    keys.key_location(objs[BALL], level.frame_range[0], objs[BALL].location)
+    for name, frames, locations, eulers in level.transform_keys:
+        obj = objs[name]
+        for axis in range(3):
+            keys.extend(obj, "location", axis, frames, locations[:, axis])
+            keys.extend(obj, "rotation_euler", axis, frames, eulers[:, axis])
+    for con_name, frame, value in level.influence_keys:
+        keys.key_influence(objs[BALL], con_name, frame, value)
+    return keys.flush()
+
+def build_level(level, strips=True):
+    """Arm a CompiledLevel in the open scene. Returns True on success."""
+    scene = bpy.context.scene
+    start = level.frame_range[0]
+
+    # --- 2A: One reset for the whole level ---
+    reset_for(level)
+
+    # --- 2B: Validate all required objects ---
+    objs = {name: bpy.data.objects.get(name) for name in level.objects}
+    missing = [name for name, obj in objs.items() if obj is None]
+    if missing:
+        print("ERROR: Missing objects:", missing)
+        return False
+    ball = objs[BALL]
+
+    scene.frame_set(start)
+    remove_rigid_body(ball)
+    ball.location = mathutils.Vector(level.ball_start)
+    bpy.context.view_layer.update()
+
+    # --- 2C: One seat + latch per visited cube, kept for the whole level ---
+    latches = LatchSet(ball)
+    seats = {}
+    for name, cube, world in level.seats:
+        seats[name] = (latches.seat_for(name, world)
+                       or create_seat(name, objs[cube], mathutils.Vector(world)))
+    bpy.context.view_layer.update()
+    for con_name, seat in level.latches:
+        con = latches.latch_for(con_name, seats[seat])
+        if con is None:
+            con = ball.constraints.new(type='COPY_TRANSFORMS')
+            con.name   = con_name
+            con.target = seats[seat]
+        # Strips key only their own two latches; the rest stay off
+        con.influence = 0.0
+    latches.hold(None)
+
+    # --- 2D: Cube / hinge motion + latch switches ---
+    for name, *_ in level.transform_keys:
+        objs[name].rotation_mode = 'XYZ'
+    if strips:
+        placed = place_level(level, objs)
+        written = f"{placed} NLA strips placed"
+    else:
+        written = f"{_write_keys(level, objs)} keys written"
+
+    # --- 2E: Frame range covers every turn ---
+    scene.frame_start, scene.frame_end = level.frame_range
+    scene.frame_set(start)
+    scene[ARMED] = ">".join(level.stops)
+    # Arrays make CompiledLevel's repr lossy — hash what it was built from
+    mark_armed((level.layout, level.frame_range, tuple(t.legs for t in level.turns)))
+    for line in format_level(level):
+        print(line)
+    print(f"{written}.")
+    return True
+
+def compose(order, cyclic=False, **options):
+    """Compile and arm the level for a cube order (see lorqb.level.compile_order)."""
+    return build_level(compile_order(order, cyclic, **options))
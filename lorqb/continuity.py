@@ -0,0 +1,118 @@
+# ============================================================================
+# lorqb/continuity.py  (Blender 5.1.1)
+# Transfer continuity — does the ball pop when its latches swap?
+#
+# Every transfer swaps latch influence with CONSTANT keys (120→121, or
+# 160→161 in the T series). If the source and destination seats are not
+# coincident on that frame the ball teleports, which so far was only
+# caught by scrubbing the viewport (C15's notes worry about exactly this).
+# Here the switch frames come from the armed key's spec (lorqb.expect) and
+# the ball's world position is evaluated on both sides of each one.
+#
+# Across a switch frame the whole jump (delta.length) must stay within TOL.
+# A transfer swap is the exception: it is designed as a straight drop
+# (lorqb.solver: the source seat ends above the destination seat), and
+# max_drop gives its height per switch frame from the closed-form seats
+# (lorqb.expect.drops_for). There the lateral offset must stay within TOL
+# and the ball may fall no further than max_drop + TOL.
+#
+# Usage (Blender console, after arming a sequence):
+#   from lorqb.continuity import check
+#   check("C15")
+# Bulk (headless, every sequence and all 12 cube pairs / every cube order):
+#   blender -b C17_Master_Runner.blend --python lorqb_batch.py -- --pairs --continuity
+#   python lorqb_validate.py --permutations --continuity
+# ============================================================================
+
+from typing import NamedTuple
+
+import bpy
+from mathutils import Vector
+
+from lorqb import framecache
+from lorqb.canon import BALL
+from lorqb.expect import drops_for, influence_for, switch_frames
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+TOL = 0.005   # metres the ball may move sideways across one switch frame
+
+class Jump(NamedTuple):
+    frame: int          # first frame on the new latch
+    before: tuple       # ball world location at frame - 1
+    after: tuple        # ball world location at frame
+    distance: float     # full jump
+    offset: float       # lateral (XY) part — the pop
+    drop: float         # height lost
+    max_drop: float     # designed drop on this frame (0 = none)
+    ok: bool
+
+def _ball_at(scene, ball, frame):
+    """Ball world location at frame — from the frame cache when it has it."""
+    entry = framecache.get()
+    if entry is not None and BALL in entry.names:
+        m = entry.world(BALL, frame)
+        if m is not None:
+            return Vector(m[:3, 3].tolist())
+    scene.frame_set(frame)
+    return ball.matrix_world.translation.copy()
+
+################################################################################
+# SECTION 2: Check
+################################################################################
+def jumps(frames, tol=TOL, max_drop=None):
+    """Ball jump across each switch frame (frame cache, else the open scene).
+
+    max_drop maps a switch frame to its designed drop; other frames get none.
+    """
+    max_drop = max_drop or {}
+    scene = bpy.context.scene
+    ball  = bpy.data.objects.get(BALL)
+    if ball is None:
+        raise RuntimeError("Ball not found — build the scene with C10 first")
+    current = scene.frame_current
+    found = []
+    try:
+        for frame in frames:
+            before = _ball_at(scene, ball, frame - 1)
+            after  = _ball_at(scene, ball, frame)
+            delta  = after - before
+            offset = delta.xy.length
+            drop   = -delta.z
+            limit  = max_drop.get(frame, 0.0)
+            if limit > 0.0:
+                ok = offset <= tol and -tol <= drop <= limit + tol
+            else:
+                ok = delta.length <= tol
+            found.append(Jump(frame,
+                              tuple(round(v, 4) for v in before),
+                              tuple(round(v, 4) for v in after),
+                              round(delta.length, 6), round(offset, 6), round(drop, 6),
+                              round(limit, 6), ok))
+    finally:
+        scene.frame_set(current)
+    return found
+
+def check(key, tol=TOL, max_drop=None, quiet=False):
+    """Continuity of the armed key; returns the JSON-ready result.
+
+    max_drop defaults to the key's designed drops (lorqb.expect.drops_for).
+    """
+    if max_drop is None:
+        max_drop = drops_for(key)
+    found = jumps(switch_frames(influence_for(key)), tol, max_drop)
+    result = {
+        "key":        key,
+        "ok":         all(j.ok for j in found),
+        "tol":        tol,
+        "max_offset": max((j.offset for j in found), default=0.0),
+        "jumps":      [j._asdict() for j in found],
+    }
+    if not quiet:
+        for j in found:
+            mark = "✓" if j.ok else "✗"
+            print(f"  {mark} {key} frame {j.frame - 1}→{j.frame}: "
+                  f"offset {j.offset:.4f} m, drop {j.drop:.4f} m (max {j.max_drop:.4f})  "
+                  f"{j.before} → {j.after}")
+    return result
@@ -0,0 +1,192 @@
+# ============================================================================
+# lorqb/diagnostics.py  (Blender 5.1.1)
+# Diagnostics engine — checks the armed scene against its spec
+# (lorqb.expect) for any C or T sequence.
+#
+# C14_DIAG.py checked one sequence at frame 1 and called view_layer.update()
+# for every position it read. Here the static checks (objects, parent
+# chain, latches, animated / inert hinges, frame range) read the scene
+# once, then the scene is evaluated once per checked frame (start, every
+# swap, end) and every position on that frame is read from the evaluated
+# matrices — or read straight from lorqb.framecache when the armed scene
+# is cached. Results come back as Check rows: printed as the familiar ✓/✗
+# view and returned (or written) as JSON.
+#
+# Usage (Blender console, after arming a sequence):
+#   from lorqb.diagnostics import diagnose
+#   diagnose("C14")                      # console + dict
+#   diagnose("T01", output="t01.json")   # also writes JSON
+# ============================================================================
+
+import json
+import math
+import time
+from typing import NamedTuple
+
+import bpy
+import mathutils
+
+from lorqb import framecache
+from lorqb.canon import BALL, HINGE_NAMES
+from lorqb.expect import for_key
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+PASS = "✓"
+FAIL = "✗"
+TOL  = 0.02
+
+class Check(NamedTuple):
+    section: str
+    label: str
+    ok: bool
+    got: object = None
+    expected: object = None
+
+def _round(v, digits=3):
+    return tuple(round(float(x), digits) for x in v)
+
+def _animated(obj):
+    ad = obj.animation_data
+    return ad is not None and (ad.action is not None or len(ad.nla_tracks) > 0)
+
+################################################################################
+# SECTION 2: Checks
+################################################################################
+def _static(expect, objs):
+    checks = []
+
+    for name in expect.objects:
+        ok = objs.get(name) is not None
+        checks.append(Check("objects", name, ok, None if ok else "MISSING"))
+
+    for child, parent in expect.chain:
+        obj = objs.get(child)
+        actual = obj.parent.name if obj and obj.parent else None
+        checks.append(Check("parent chain", f"{child}.parent == {parent}",
+                            actual == parent, actual, parent))
+
+    ball = objs.get(BALL)
+    for con_name, con_type in expect.latches:
+        con = ball.constraints.get(con_name) if ball else None
+        actual = con.type if con else None
+        checks.append(Check("latches", f"{con_name} is {con_type}",
+                            actual == con_type and con.target is not None,
+                            actual, con_type))
+
+    for name in expect.animated:
+        obj = objs.get(name)
+        ok = obj is not None and _animated(obj)
+        checks.append(Check("animation", f"{name} is animated", ok,
+                            None if ok else "NO animation"))
+    for name in expect.inert:
+        obj = objs.get(name)
+        ok = obj is None or not _animated(obj)
+        checks.append(Check("animation", f"{name} is inert", ok,
+                            None if ok else "HAS animation"))
+
+    scene = bpy.context.scene
+    actual = (scene.frame_start, scene.frame_end)
+    checks.append(Check("frame range", f"frame range == {expect.frame_range}",
+                        actual == tuple(expect.frame_range), actual, expect.frame_range))
+    return checks
+
+def _reader(objs, frame):
+    """name -> (world location, XYZ Euler) at frame: cached, else one frame_set."""
+    entry = framecache.get()
+    if entry is not None and entry.index(frame) is not None:
+        i = entry.index(frame)
+
+        def read(name):
+            if name not in entry.names:
+                return None
+            j = entry.names.index(name)
+            basis = mathutils.Matrix(entry.basis[i, j].tolist())
+            return entry.traj.matrices[i, j, :3, 3], basis.to_euler('XYZ')
+        return read
+
+    bpy.context.scene.frame_set(frame)
+
+    def read(name):
+        obj = objs.get(name)
+        return None if obj is None else (obj.matrix_world.translation, obj.rotation_euler)
+    return read
+
+def _frames(expect, objs):
+    """Every position on a checked frame from one read (cache or frame_set)."""
+    checks = []
+    first = expect.positions[0][0] if expect.positions else None
+    for frame, positions in expect.positions:
+        read = _reader(objs, frame)
+        section = f"frame {frame}"
+        for name, exp in positions:
+            pose = read(name)
+            actual = _round(pose[0]) if pose else None
+            ok = actual is not None and all(abs(a - e) < TOL for a, e in zip(actual, exp))
+            checks.append(Check(section, f"{name} at {_round(exp)}", ok, actual, _round(exp)))
+        if frame == first:
+            for name in HINGE_NAMES:
+                pose = read(name)
+                if pose is None:
+                    continue
+                rot = tuple(round(math.degrees(v), 1) for v in pose[1])
+                checks.append(Check(section, f"{name} rotation == (0,0,0)",
+                                    all(abs(v) < 0.05 for v in rot), rot, (0.0, 0.0, 0.0)))
+    return checks
+
+def run(expect):
+    """Every Check for expect against the open scene (frame restored after)."""
+    objs  = bpy.data.objects
+    scene = bpy.context.scene
+    current = scene.frame_current
+    try:
+        return _static(expect, objs) + _frames(expect, objs)
+    finally:
+        scene.frame_set(current)
+
+################################################################################
+# SECTION 3: Report
+################################################################################
+def print_report(key, checks):
+    print("\n" + "=" * 60)
+    print(f"{key} DIAGNOSTIC")
+    print("=" * 60)
+    section = None
+    for check in checks:
+        if check.section != section:
+            section = check.section
+            print(f"\n[{section.upper()}]")
+        print(f"  {PASS if check.ok else FAIL} {check.label}")
+        if not check.ok and check.got is not None:
+            print(f"       got={check.got}  expected={check.expected}")
+    passed = sum(c.ok for c in checks)
+    print("\n" + "=" * 60)
+    print(f"RESULT: {passed}/{len(checks)} checks passed")
+    if passed == len(checks):
+        print(f"ALL CHECKS PASSED — {key} ready to test in viewport")
+    else:
+        print(f"FAILED: {len(checks) - passed} issue(s) need fixing before testing")
+    print("=" * 60 + "\n")
+
+def to_dict(key, checks, seconds=None):
+    return {
+        "key":     key,
+        "ok":      all(c.ok for c in checks),
+        "passed":  sum(c.ok for c in checks),
+        "total":   len(checks),
+        "seconds": seconds,
+        "checks":  [c._asdict() for c in checks],
+    }
+
+def diagnose(key, output=None, quiet=False):
+    """Check the armed scene for key; returns the JSON-ready result."""
+    t0 = time.perf_counter()
+    checks = run(for_key(key))
+    result = to_dict(key, checks, round(time.perf_counter() - t0, 4))
+    if not quiet:
+        print_report(key, checks)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=1, default=str)
+    return result
@@ -0,0 +1,180 @@
+# ============================================================================
+# lorqb/expect.py
+# What an armed sequence should look like — read from its spec.
+# Pure Python + NumPy (no bpy); lorqb.diagnostics checks a scene against it.
+#
+# C14_DIAG.py hard-coded C14's parent chain, positions, latches and inert
+# hinges. Every one of those follows from the spec: the carry chain, seats
+# and latches from compile_transfer() / compile_stages(), hinges nobody
+# keys are inert, and for transfers the world position of every object at
+# any frame comes from the closed-form kinematics (lorqb.kinematics) —
+# so the swap and end frames are checked too, not just frame 1.
+# drops_for() gives lorqb.continuity the height the ball is meant to fall
+# at each latch switch, from the same closed-form seat positions.
+# ============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+
+from lorqb.canon import BALL, COLORS, HINGE_NAMES, LAYOUTS
+from lorqb.kinematics import solve, solve_stages
+from lorqb.level import compile_order
+from lorqb.plans import legs_for
+from lorqb.specs import TRANSFERS, TransferSpec, compile_transfer
+from lorqb.stages import SEAT_TOL, STAGED, compile_stages
+
+################################################################################
+# SECTION 1: Expectation
+################################################################################
+class Expectation(NamedTuple):
+    key: str
+    objects: tuple       # names that must exist
+    chain: tuple         # ((child, parent), ...)
+    latches: tuple       # ((constraint, type), ...) on the ball
+    animated: tuple      # objects that must carry animation
+    inert: tuple         # hinges that must not
+    frame_range: tuple
+    positions: tuple     # ((frame, ((name, (x, y, z)), ...)), ...)
+
+def _at(worlds, names, i):
+    return tuple((name, tuple(round(float(v), 6) for v in worlds[name][i][:3, 3]))
+                 for name in names if name in worlds)
+
+################################################################################
+# SECTION 2: From specs
+################################################################################
+def from_transfer(spec, key=None):
+    """Expectation for a TransferSpec (or tuple of legs)."""
+    legs = (spec,) if isinstance(spec, TransferSpec) else tuple(spec)
+    c = compile_transfer(legs)
+    start, end = c.frame_range
+    keyed = tuple(dict.fromkeys(h for h, *_ in c.hinge_keys))
+
+    # Start, every swap (a latch switching on), end — in closed form
+    frames = sorted({start, end, *switch_frames(c.influence_keys, rising=True)})
+    worlds = solve(c, frames)
+    names  = [*LAYOUTS[c.layout], *(seat for seat, _, _ in c.seats), BALL]
+    positions = tuple((f, _at(worlds, names, i)) for i, f in enumerate(frames))
+
+    return Expectation(
+        key=key or legs[0].name,
+        objects=c.objects + tuple(seat for seat, _, _ in c.seats),
+        chain=c.carry,
+        latches=tuple((con, latch) for con, _, latch in c.latches),
+        animated=keyed + (BALL,),
+        inert=tuple(h for h in HINGE_NAMES if h not in keyed),
+        frame_range=c.frame_range,
+        positions=positions,
+    )
+
+def switch_frames(influence_keys, rising=False):
+    """Frames where a latch's (CONSTANT-keyed) influence changes.
+
+    rising=True keeps only the frames where a latch switches on.
+    """
+    curves = {}
+    for con, frame, value in influence_keys:
+        curves.setdefault(con, []).append((frame, value))
+    frames = set()
+    for keys in curves.values():
+        keys.sort()
+        for (_, a), (f, b) in zip(keys, keys[1:]):
+            if (a < 0.5 <= b) or (a != b and not rising):
+                frames.add(f)
+    return tuple(sorted(frames))
+
+def from_staged(spec):
+    """Expectation for a StagedSpec (T series).
+
+    Raises ValueError if the source seat does not end up over the
+    destination seat on the frame before the swap.
+    """
+    c = compile_stages(spec)
+    start, end = c.frame_range
+    targets = tuple(dict.fromkeys(t for t, *_ in c.rot_keys))
+    # Everything is at rest on the first frame (T02 keeps the scene's layout)
+    first = list(LAYOUTS[spec.layout].items()) if spec.layout is not None else []
+    if spec.ball_start is not None:
+        first.append((BALL, tuple(spec.ball_start)))
+        first.append((spec.source_seat, tuple(spec.ball_start)))
+    dest_world = next(world for seat, _, world in c.seats if seat == spec.dest_seat)
+    first.append((spec.dest_seat, dest_world))
+
+    # Hold, swap and end in closed form; only seats and the ball when the
+    # spec keeps the scene's layout (its cubes are not known offline)
+    frames = (spec.swap - 1, spec.swap, end)
+    worlds = solve_stages(spec, frames)
+    names  = [*(LAYOUTS[spec.layout] if spec.layout is not None else ()),
+              spec.source_seat, spec.dest_seat, BALL]
+    held = worlds[spec.source_seat][0][:2, 3]
+    off  = float(np.hypot(*(held - worlds[spec.dest_seat][0][:2, 3])))
+    if off > SEAT_TOL:
+        raise ValueError(f"{spec.name}: {spec.source_seat} misses "
+                         f"{spec.dest_seat} by {off:.3f} at frame {spec.swap - 1}")
+    positions = ((start, tuple(first)),
+                 *((f, _at(worlds, names, i)) for i, f in enumerate(frames)))
+
+    return Expectation(
+        key=spec.name,
+        objects=c.objects + (spec.source_seat, spec.dest_seat),
+        chain=tuple(spec.hierarchy),
+        latches=tuple((con, 'COPY_TRANSFORMS') for con, _ in c.latches),
+        animated=targets + (BALL,),
+        inert=tuple(h for h in HINGE_NAMES if h not in targets),
+        frame_range=c.frame_range,
+        positions=positions,
+    )
+
+def for_key(key):
+    """Expectation for a catalog key ("C14", "T01") or a "Blue>Green" pair."""
+    if key in TRANSFERS:
+        return from_transfer(TRANSFERS[key], key)
+    if key in STAGED:
+        return from_staged(STAGED[key])
+    source, sep, dest = key.partition(">")
+    if sep and source in COLORS and dest in COLORS:
+        return from_transfer(legs_for(source, dest), key)
+    raise KeyError(f"no spec for {key!r}")
+
+def influence_for(key):
+    """Latch influence keys of what arming key writes (C, T, pair or level)."""
+    if key in TRANSFERS:
+        return compile_transfer(TRANSFERS[key]).influence_keys
+    if key in STAGED:
+        return compile_stages(STAGED[key]).influence_keys
+    stops = key.split(">")
+    if len(stops) == 2 and all(c in COLORS for c in stops):
+        return compile_transfer(legs_for(*stops)).influence_keys
+    if len(stops) > 2 and all(c in COLORS for c in stops):
+        return compile_order(stops).influence_keys
+    raise KeyError(f"no spec for {key!r}")
+
+################################################################################
+# SECTION 4: Designed drops
+################################################################################
+def _drops(influence_keys, solved, shift=0):
+    """{switch frame + shift: metres the ball falls onto it} from solved(frames)."""
+    frames = switch_frames(influence_keys)
+    both   = sorted({*frames, *(f - 1 for f in frames)})
+    z = dict(zip(both, solved(both)[BALL][:, 2, 3]))
+    return {f + shift: max(float(z[f - 1] - z[f]), 0.0) for f in frames}
+
+def drops_for(key):
+    """{switch frame: designed drop} for key: source seat height over the dest seat."""
+    if key in STAGED:
+        spec = STAGED[key]
+        return _drops(compile_stages(spec).influence_keys,
+                      lambda frames: solve_stages(spec, frames))
+    stops = key.split(">")
+    if key in TRANSFERS or (len(stops) == 2 and all(c in COLORS for c in stops)):
+        c = compile_transfer(TRANSFERS[key] if key in TRANSFERS else legs_for(*stops))
+        return _drops(c.influence_keys, lambda frames: solve(c, frames))
+    if len(stops) > 2 and all(c in COLORS for c in stops):
+        drops = {}
+        for turn in compile_order(stops).turns:
+            c = compile_transfer(turn.legs)
+            drops.update(_drops(c.influence_keys, lambda frames, c=c: solve(c, frames),
+                                turn.start - turn.bake.frame_range[0]))
+        return drops
+    raise KeyError(f"no spec for {key!r}")
@@ -0,0 +1,244 @@
+# ============================================================================
+# lorqb/framecache.py  (Blender 5.1.1)
+# Frame-evaluation cache — an armed sequence's world matrices, baked once.
+#
+# Scrubbing re-evaluates the ball's COPY_TRANSFORMS / CHILD_OF latches, the
+# hinge F-curves (or NLA strips) and the five-deep parent chain on every
+# frame, and the checks (lorqb.diagnostics / continuity / clearance, the
+# batch frame dump) each stepped the timeline again. Here, after arming,
+# the frame range is sampled once (lorqb.sampler) into a float32
+# (frames, objects, 4, 4) array plus each object's local basis for that
+# world pose.
+#
+# Entries are keyed by a hash of the armed spec (written to the scene by
+# the builders via mark_armed) plus a stamp of the scene geometry: parent
+# links, parent inverses, latch targets, meshes, frame range and
+# plans.geometry_hash(). Arming something else, a reset, or editing the
+# rig changes the key, so a stale entry is never returned.
+#
+# engage() switches the scene to cached playback: constraints and
+# animation are muted and a frame_change_pre handler writes every cached
+# object's basis — only the plain parent chain is left to evaluate.
+# release() (and every reset) restores the live rig.
+#
+# Usage (Blender console, after arming a sequence):
+#   from lorqb import framecache
+#   framecache.engage()     # smooth scrubbing
+#   framecache.release()
+# ============================================================================
+
+import hashlib
+
+import bpy
+import mathutils
+import numpy as np
+
+from lorqb.meshcache import TAG
+from lorqb.plans import geometry_hash
+from lorqb.sampler import sample
+from lorqb.trajectory import SAMPLE_NAMES
+
+################################################################################
+# SECTION 1: Keys
+################################################################################
+SPEC_KEY    = "lorqb_spec_hash"   # scene property: hash of the armed spec
+MAX_ENTRIES = 8
+DIGITS      = 5
+
+# (spec hash, scene stamp) -> FrameCache, oldest first
+_entries = {}
+# Cached playback state while engaged (None otherwise)
+_engaged = None
+
+def spec_hash(spec):
+    """Short hash of a spec (anything with a deterministic repr)."""
+    blob = f"{spec!r}|{geometry_hash()}".encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:12]
+
+def mark_armed(spec, scene=None):
+    """Record what was just armed; called by the builders."""
+    scene = scene or bpy.context.scene
+    scene[SPEC_KEY] = spec_hash(spec)
+
+def clear_armed(scene=None):
+    (scene or bpy.context.scene).pop(SPEC_KEY, None)
+
+def _names(objects, names=SAMPLE_NAMES):
+    """names present in the scene plus every parent they hang from."""
+    found = [n for n in names if n in objects]
+    for name in found:
+        parent = objects[name].parent
+        if parent is not None and parent.name not in found:
+            found.append(parent.name)
+    return tuple(found)
+
+def scene_stamp(scene=None, names=SAMPLE_NAMES):
+    """Hash of the rig the cached matrices depend on."""
+    scene   = scene or bpy.context.scene
+    objects = scene.objects
+    parts   = [scene.frame_start, scene.frame_end]
+    for name in _names(objects, names):
+        obj = objects[name]
+        parts.append((
+            name,
+            obj.parent.name if obj.parent else None,
+            tuple(round(v, DIGITS) for row in obj.matrix_parent_inverse for v in row),
+            tuple((c.name, c.type, c.target.name if getattr(c, "target", None) else None)
+                  for c in obj.constraints),
+            (obj.data.get(TAG) or obj.data.name) if obj.data is not None else None,
+        ))
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:12]
+
+def current_key(scene=None):
+    """(spec hash, scene stamp) of the armed scene, or None if nothing is armed."""
+    scene = scene or bpy.context.scene
+    spec = scene.get(SPEC_KEY)
+    return None if spec is None else (spec, scene_stamp(scene))
+
+################################################################################
+# SECTION 2: Bake + lookup
+################################################################################
+class FrameCache:
+    """World matrices (and the matching local bases) of one armed sequence."""
+
+    def __init__(self, key, traj, basis):
+        self.key   = key
+        self.traj  = traj      # lorqb.trajectory.Trajectory (world, float32)
+        self.basis = basis     # (F, N, 4, 4) local matrix_basis per frame
+        self.start = int(traj.frames[0])
+
+    @property
+    def frames(self):
+        return self.traj.frames
+
+    @property
+    def names(self):
+        return self.traj.names
+
+    def index(self, frame):
+        i = int(frame) - self.start
+        return i if 0 <= i < len(self.frames) else None
+
+    def world(self, name, frame):
+        i = self.index(frame)
+        return None if i is None else self.traj.matrices[i, self.traj.index(name)]
+
+def _basis(objects, traj):
+    """Local basis per frame: inv(parent world @ parent inverse) @ world."""
+    world = traj.matrices.astype(np.float64)
+    basis = world.copy()
+    for j, name in enumerate(traj.names):
+        obj = objects[name]
+        if obj.parent is None:
+            continue
+        inverse = np.array(obj.matrix_parent_inverse, dtype=np.float64)
+        parent  = world[:, traj.index(obj.parent.name)] @ inverse
+        basis[:, j] = np.linalg.solve(parent, world[:, j])
+    return basis.astype(np.float32)
+
+def bake(scene=None, names=SAMPLE_NAMES):
+    """Sample the armed scene once and cache it. None if nothing is armed."""
+    scene = scene or bpy.context.scene
+    key = current_key(scene)
+    if key is None:
+        return None
+    release()
+    traj  = sample(_names(scene.objects, names), scene=scene)
+    entry = FrameCache(key, traj, _basis(scene.objects, traj))
+    _entries.pop(key, None)
+    _entries[key] = entry
+    while len(_entries) > MAX_ENTRIES:
+        _entries.pop(next(iter(_entries)))
+    return entry
+
+def get(scene=None):
+    """The entry for the armed scene as it is now, or None."""
+    if _engaged is not None:
+        return _engaged["entry"]
+    key = current_key(scene)
+    return None if key is None else _entries.get(key)
+
+def ensure(scene=None):
+    """get(), baking first on a miss."""
+    return get(scene) or bake(scene)
+
+def trajectory(scene=None):
+    """Cached Trajectory of the armed scene, or None (callers then sample)."""
+    entry = get(scene)
+    return None if entry is None else entry.traj
+
+def invalidate():
+    """Drop every entry (the scene key changing is usually enough)."""
+    release()
+    _entries.clear()
+
+################################################################################
+# SECTION 3: Cached playback
+################################################################################
+def _apply(scene, depsgraph=None):
+    state = _engaged
+    if state is None:
+        return
+    entry = state["entry"]
+    i = entry.index(scene.frame_current)
+    if i is None:
+        return
+    for obj, j in state["objects"]:
+        obj.matrix_basis = mathutils.Matrix(entry.basis[i, j].tolist())
+
+def is_engaged():
+    return _engaged is not None
+
+def engage(scene=None):
+    """Play back from the cache: mute constraints and animation, drive bases."""
+    global _engaged
+    scene = scene or bpy.context.scene
+    entry = ensure(scene)
+    if entry is None:
+        print("framecache: nothing armed — arm a sequence first.")
+        return False
+    release()
+    objects = [(scene.objects[name], j) for j, name in enumerate(entry.names)]
+    saved = []
+    for obj, _ in objects:
+        ad = obj.animation_data
+        saved.append((
+            obj,
+            [(con, con.enabled) for con in obj.constraints],
+            (ad.action, ad.action_slot, ad.use_nla) if ad is not None else None,
+        ))
+        for con in obj.constraints:
+            con.enabled = False
+        if ad is not None:
+            ad.action  = None
+            ad.use_nla = False
+    _engaged = {"entry": entry, "objects": objects, "saved": saved}
+    bpy.app.handlers.frame_change_pre.append(_apply)
+    _apply(scene)
+    bpy.context.view_layer.update()
+    print(f"framecache: cached playback of {len(objects)} objects, "
+          f"{len(entry.frames)} frames.")
+    return True
+
+def release():
+    """Back to live evaluation (no-op unless engaged)."""
+    global _engaged
+    state, _engaged = _engaged, None
+    if state is None:
+        return
+    if _apply in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(_apply)
+    for obj, constraints, anim in state["saved"]:
+        try:
+            for con, enabled in constraints:
+                con.enabled = enabled
+            if anim is not None:
+                action, slot, use_nla = anim
+                ad = obj.animation_data_create()
+                ad.use_nla = use_nla
+                ad.action  = action
+                if action is not None and slot is not None:
+                    ad.action_slot = slot
+        except ReferenceError:
+            continue   # removed while engaged
+    bpy.context.scene.frame_set(bpy.context.scene.frame_current)
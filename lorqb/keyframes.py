@@ -0,0 +1,123 @@
+# ============================================================================
+# lorqb/keyframes.py  (Blender 5.1.1)
+# Batched keyframe writer for sequence scripts.
+#
+# The old per-key helpers (key_rot_x / key_rot / key_influence) called
+# scene.frame_set() before every keyframe_insert() and then rescanned every
+# F-curve to fix interpolation — ~20 full depsgraph evaluations per arm.
+#
+# KeyBatch collects (object, data_path, index, frame, value, interpolation)
+# tuples for a whole sequence, then flush() creates each F-curve once and
+# fills it with keyframe_points.add(n) + foreach_set(). No frame changes.
+# ============================================================================
+
+import math
+
+import bpy
+
+from lorqb.purge import track
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+# RNA enum values of Keyframe.interpolation (raw ints for foreach_set)
+INTERPOLATION = {
+    'CONSTANT': 0,
+    'LINEAR':   1,
+    'BEZIER':   2,
+}
+
+################################################################################
+# SECTION 2: Helpers — action / F-curve access
+################################################################################
+def ensure_action(obj, name=None):
+    """Return obj's action, creating animation data and the action if needed."""
+    ad = obj.animation_data or obj.animation_data_create()
+    if ad.action is None:
+        ad.action = track(bpy.data.actions.new(name=name or f"{obj.name}Action"))
+    return ad.action
+
+def ensure_fcurve(obj, data_path, index):
+    action = ensure_action(obj)
+    return action.fcurve_ensure_for_datablock(obj, data_path, index=index)
+
+def write_fcurve(fc, keys):
+    """Replace fc's keyframes with keys: [(frame, value, interp), ...].
+
+    Existing keys on other frames are kept, matching keyframe_insert().
+    """
+    merged = {}
+    count = len(fc.keyframe_points)
+    if count:
+        co = [0.0] * (count * 2)
+        ipo = [0] * count
+        fc.keyframe_points.foreach_get("co", co)
+        fc.keyframe_points.foreach_get("interpolation", ipo)
+        for i in range(count):
+            merged[co[i * 2]] = (co[i * 2 + 1], ipo[i])
+        fc.keyframe_points.clear()
+    for frame, value, interp in keys:
+        merged[float(frame)] = (float(value), INTERPOLATION[interp])
+
+    frames = sorted(merged)
+    co  = []
+    ipo = []
+    for frame in frames:
+        value, interp = merged[frame]
+        co.extend((frame, value))
+        ipo.append(interp)
+
+    fc.keyframe_points.add(len(frames))
+    fc.keyframe_points.foreach_set("co", co)
+    fc.keyframe_points.foreach_set("handle_left", co)
+    fc.keyframe_points.foreach_set("handle_right", co)
+    fc.keyframe_points.foreach_set("interpolation", ipo)
+    fc.update()
+
+################################################################################
+# SECTION 3: KeyBatch
+################################################################################
+class KeyBatch:
+    """Collects keyframes for a sequence and writes them in one pass."""
+
+    def __init__(self):
+        # (obj, data_path, index) -> [(frame, value, interp), ...]
+        self.curves = {}
+
+    def __len__(self):
+        return sum(len(keys) for keys in self.curves.values())
+
+    def add(self, obj, data_path, index, frame, value, interp='LINEAR'):
+        self.curves.setdefault((obj, data_path, index), []).append(
+            (frame, value, interp))
+
+    def key_rot(self, obj, axis, sign, frame, degrees, interp='LINEAR'):
+        obj.rotation_mode = 'XYZ'
+        self.add(obj, "rotation_euler", axis, frame,
+                 sign * math.radians(degrees), interp)
+
+    def key_influence(self, obj, constraint_name, frame, value):
+        if not obj.constraints.get(constraint_name):
+            print(f"WARNING: Constraint '{constraint_name}' not found on {obj.name}")
+            return
+        data_path = f'constraints["{constraint_name}"].influence'
+        self.add(obj, data_path, 0, frame, value, 'CONSTANT')
+
+    def key_location(self, obj, frame, location, interp='LINEAR'):
+        for axis, value in enumerate(location):
+            self.add(obj, "location", axis, frame, value, interp)
+
+    def extend(self, obj, data_path, index, frames, values, interp='LINEAR'):
+        """Add one key per (frame, value) pair — baked curves."""
+        self.curves.setdefault((obj, data_path, index), []).extend(
+            (float(f), float(v), interp) for f, v in zip(frames, values))
+
+    def flush(self):
+        """Write every collected curve. Returns the number of keys written."""
+        written = 0
+        for (obj, data_path, index), keys in self.curves.items():
+            fc = ensure_fcurve(obj, data_path, index)
+            write_fcurve(fc, keys)
+            written += len(keys)
+        self.curves.clear()
+        return written
@@ -0,0 +1,288 @@
+# ============================================================================
+# lorqb/kinematics.py
+# Closed-form forward kinematics for a compiled transfer — no bpy.
+# Pure Python + NumPy: runs in plain Python, outside Blender.
+#
+# Everything a transfer animates is a rigid rotation about one hinge axis,
+# keyed LINEAR, plus ball latches keyed CONSTANT (lorqb.specs). So every
+# world matrix follows from the rest layout, the carry chain and the keys:
+#
+#   rest      W0(x)     = translation to its layout position
+#   animated  W(x, t)   = W(parent, t) @ inv(W0(parent)) @ W0(x) @ R(x, t)
+#   seat      W(s, t)   = W(cube, t) @ inv(W0(cube)) @ T(seat world)
+#   ball      last latch with influence 1 wins (COPY_TRANSFORMS: the seat;
+#             CHILD_OF, identity inverse: seat @ ball basis)
+#
+# which is what build_transfer() sets up and Blender evaluates. Frames are
+# vectorised, so one configuration costs a handful of (F, 4, 4) matmuls —
+# enough to sweep ROT_SIGN (C14's "verify empirically") in plain Python.
+# ============================================================================
+
+import itertools
+from dataclasses import replace
+
+import numpy as np
+
+from lorqb.canon import BALL, CUBE_NAMES, LAYOUTS, SEAT_WORLD, cube_name
+from lorqb.mesh import CUBE_SIZE
+from lorqb.specs import TransferSpec, compile_transfer
+from lorqb.stages import compile_stages
+from lorqb.trajectory import SAMPLE_NAMES, Trajectory
+
+################################################################################
+# SECTION 1: Matrix helpers (stacks of 4×4, row-major like mathutils)
+################################################################################
+def translation(location):
+    m = np.eye(4)
+    m[:3, 3] = location
+    return m
+
+def euler_xyz(angles):
+    """(F, 4, 4) rotations for (F, 3) XYZ Euler angles (Blender 'XYZ': Rz·Ry·Rx)."""
+    angles = np.asarray(angles, dtype=float)
+    cx, cy, cz = np.cos(angles).T
+    sx, sy, sz = np.sin(angles).T
+    m = np.zeros((len(angles), 4, 4))
+    m[:, 0, 0] = cy * cz
+    m[:, 0, 1] = sx * sy * cz - cx * sz
+    m[:, 0, 2] = cx * sy * cz + sx * sz
+    m[:, 1, 0] = cy * sz
+    m[:, 1, 1] = sx * sy * sz + cx * cz
+    m[:, 1, 2] = cx * sy * sz - sx * cz
+    m[:, 2, 0] = -sy
+    m[:, 2, 1] = sx * cy
+    m[:, 2, 2] = cx * cy
+    m[:, 3, 3] = 1.0
+    return m
+
+def _wrap(angle, ref):
+    """angle shifted by whole turns to lie within π of ref."""
+    return angle + 2.0 * np.pi * np.round((ref - angle) / (2.0 * np.pi))
+
+def to_euler_xyz(m, compat=(0.0, 0.0, 0.0), tol=1e-9):
+    """(F, 3) XYZ Euler angles for (F, 4, 4) rotations, continuous over F.
+
+    Each frame picks the solution closest to the previous one (the first
+    to compat), like mathutils' to_euler('XYZ', compat), so keyed Euler
+    curves interpolate without 180°/360° jumps.
+    """
+    m = np.asarray(m, dtype=float)
+    out  = np.zeros((len(m), 3))
+    prev = np.asarray(compat, dtype=float)
+    for i, r in enumerate(m):
+        cy = np.hypot(r[0, 0], r[1, 0])
+        if cy > tol:
+            y = np.arctan2(-r[2, 0], cy)
+            x = np.arctan2(r[2, 1], r[2, 2])
+            z = np.arctan2(r[1, 0], r[0, 0])
+            options = ((x, y, z), (x + np.pi, np.pi - y, z + np.pi))
+        elif r[2, 0] < 0.0:   # y = +90°: only x - z is defined
+            z = prev[2]
+            options = ((z + np.arctan2(r[0, 1], r[0, 2]), np.pi / 2.0, z),)
+        else:                 # y = -90°: only x + z is defined
+            z = prev[2]
+            options = ((np.arctan2(-r[0, 1], -r[0, 2]) - z, -np.pi / 2.0, z),)
+        best = None
+        for option in options:
+            e = np.array([_wrap(a, p) for a, p in zip(option, prev)])
+            if best is None or np.abs(e - prev).sum() < np.abs(best - prev).sum():
+                best = e
+        out[i] = prev = best
+    return out
+
+################################################################################
+# SECTION 2: Keys → per-frame values
+################################################################################
+def _compiled(spec):
+    if isinstance(spec, TransferSpec):
+        return compile_transfer((spec,))
+    if isinstance(spec, tuple) and spec and isinstance(spec[0], TransferSpec):
+        return compile_transfer(spec)
+    return spec   # already a CompiledTransfer
+
+def hinge_angles(c, frames):
+    """{hinge: (F, 3) Euler angles} — LINEAR keys, constant extrapolation."""
+    return rotation_angles(c.hinge_keys, frames)
+
+def rotation_angles(keys, frames):
+    """{target: (F, 3)} for ((target, axis, sign, frame, degrees), ...) keys."""
+    keyed = {}
+    for hinge, axis, sign, frame, degrees in keys:
+        # Same frame keyed twice: the later key wins (as in KeyBatch)
+        keyed.setdefault((hinge, axis), {})[float(frame)] = sign * np.radians(degrees)
+    angles = {}
+    for (hinge, axis), keys in keyed.items():
+        xs = sorted(keys)
+        rot = angles.setdefault(hinge, np.zeros((len(frames), 3)))
+        rot[:, axis] = np.interp(frames, xs, [keys[x] for x in xs])
+    return angles
+
+def influences(c, frames):
+    """{constraint: (F,) influence} — CONSTANT keys (step, hold the last)."""
+    keyed = {}
+    for con, frame, value in c.influence_keys:
+        keyed.setdefault(con, {})[float(frame)] = value
+    values = {}
+    for con, keys in keyed.items():
+        xs = np.array(sorted(keys))
+        ys = np.array([keys[x] for x in xs])
+        i  = np.clip(np.searchsorted(xs, frames, side="right") - 1, 0, len(xs) - 1)
+        values[con] = ys[i]
+    return values
+
+################################################################################
+# SECTION 3: Evaluate
+################################################################################
+def rest_worlds(c, ball=None):
+    """{name: (4, 4)} rest pose: layout positions, ball at its start."""
+    worlds = {name: translation(loc) for name, loc in LAYOUTS[c.layout].items()}
+    if ball is None:
+        ball = c.ball_start or SEAT_WORLD[cube_name(c.legs[0].source)]
+    worlds[BALL] = translation(ball)
+    return worlds
+
+def chain_worlds(rest, parents, angles, count):
+    """{name: (F, 4, 4)} for every name in rest.
+
+    W(x) = W(parent) @ inv(W0(parent)) @ W0(x) @ R(x); parents maps
+    child → parent, angles maps name → (F, 3) Euler angles.
+    """
+    worlds = {}
+
+    def world(name):
+        if name in worlds:
+            return worlds[name]
+        basis = np.broadcast_to(rest[name], (count, 4, 4))
+        if name in angles:
+            basis = basis @ euler_xyz(angles[name])
+        parent = parents.get(name)
+        if parent is not None:
+            basis = world(parent) @ np.linalg.inv(rest[parent]) @ basis
+        worlds[name] = basis
+        return basis
+
+    for name in rest:
+        world(name)
+    return worlds
+
+def solve(spec, frames=None, ball=None):
+    """{name: (F, 4, 4)} world matrices of every object the transfer moves.
+
+    frames defaults to the transfer's frame range; ball is the ball's start
+    location when the transfer does not place it (capture_source specs).
+    """
+    c = _compiled(spec)
+    if frames is None:
+        frames = np.arange(c.frame_range[0], c.frame_range[1] + 1)
+    frames = np.asarray(frames, dtype=float)
+    rest   = rest_worlds(c, ball)
+    count  = len(frames)
+    layout = {name: rest[name] for name in LAYOUTS[c.layout]}
+    worlds = chain_worlds(layout, dict(c.carry), hinge_angles(c, frames), count)
+
+    # Seats ride their cubes; a captured seat starts where the ball is
+    for seat, cube, location in c.seats:
+        if seat == c.capture_seat:
+            location = rest[BALL][:3, 3]
+        worlds[seat] = worlds[cube] @ np.linalg.inv(rest[cube]) @ translation(location)
+
+    # Ball: latches in constraint order, influences are 0/1 (lorqb.specs)
+    ball_world = np.broadcast_to(rest[BALL], (count, 4, 4)).copy()
+    infl = influences(c, frames)
+    for con, seat, latch in c.latches:
+        on = infl.get(con, np.zeros(count)) >= 0.5
+        if latch == 'CHILD_OF':
+            target = worlds[seat] @ ball_world
+        else:
+            target = worlds[seat]
+        ball_world[on] = target[on]
+    worlds[BALL] = ball_world
+    return worlds
+
+def solve_stages(spec, frames=None):
+    """{name: (F, 4, 4)} for a StagedSpec (T series), like solve().
+
+    A spec that keeps the scene's layout (T02) is evaluated on the seated
+    one; hinge stages carry their cubes rigidly, so seats come out the same.
+    """
+    c = compile_stages(spec)
+    if frames is None:
+        frames = np.arange(c.frame_range[0], c.frame_range[1] + 1)
+    frames = np.asarray(frames, dtype=float)
+    count  = len(frames)
+    rest   = {name: translation(loc) for name, loc in LAYOUTS[spec.layout or "SEATED"].items()}
+    worlds = chain_worlds(rest, dict(spec.hierarchy),
+                          rotation_angles(c.rot_keys, frames), count)
+
+    ball = translation(spec.ball_start or SEAT_WORLD[cube_name(spec.source)])
+    for seat, cube, location in c.seats:
+        seat_rest = ball if location is None else translation(location)
+        worlds[seat] = worlds[cube] @ np.linalg.inv(rest[cube]) @ seat_rest
+
+    ball_world = np.broadcast_to(ball, (count, 4, 4)).copy()
+    infl = influences(c, frames)
+    for con, seat in c.latches:   # COPY_TRANSFORMS, source first
+        on = infl.get(con, np.zeros(count)) >= 0.5
+        ball_world[on] = worlds[seat][on]
+    worlds[BALL] = ball_world
+    return worlds
+
+def evaluate(spec, frames=None, ball=None, names=SAMPLE_NAMES):
+    """Trajectory like lorqb.sampler.sample(), computed without Blender.
+
+    Objects the transfer does not create (other seats) get NaN columns.
+    """
+    c = _compiled(spec)
+    if frames is None:
+        frames = np.arange(c.frame_range[0], c.frame_range[1] + 1)
+    frames = np.asarray(frames)
+    worlds = solve(c, frames, ball)
+    names  = tuple(names)
+    out = np.full((len(frames), len(names), 4, 4), np.nan)
+    for i, name in enumerate(names):
+        if name in worlds:
+            out[:, i] = worlds[name]
+    return Trajectory(frames, names, out)
+
+################################################################################
+# SECTION 4: ROT_SIGN checks
+################################################################################
+def cube_corners(cube):
+    """(8, 4) homogeneous rest corners of a cube's box (bottom on the floor)."""
+    x, y, _ = SEAT_WORLD[cube]
+    h = CUBE_SIZE / 2.0
+    return np.array([(x + dx, y + dy, h + dz, 1.0)
+                     for dx, dy, dz in itertools.product((-h, h), repeat=3)])
+
+def lowest_point(spec, frames=None, cubes=CUBE_NAMES):
+    """Lowest z any corner of cubes reaches during the transfer."""
+    c = _compiled(spec)
+    worlds = solve(c, frames)
+    rest   = rest_worlds(c)
+    lowest = np.inf
+    for cube in cubes:
+        if cube not in worlds:
+            continue
+        motion = worlds[cube] @ np.linalg.inv(rest[cube])
+        z = (motion @ cube_corners(cube).T)[:, 2, :]
+        lowest = min(lowest, float(z.min()))
+    return lowest
+
+def clears_floor(spec, floor=0.0, tol=1e-6, cubes=CUBE_NAMES):
+    """True when none of cubes dips below the floor at any frame."""
+    return lowest_point(spec, cubes=cubes) >= floor - tol
+
+def sign_options(spec):
+    """{sign: source cubes clear the floor} for ±1 on every leg of spec.
+
+    Only the flipped (source) cubes decide the sign; the rest of the carried
+    chain may still swing low — see clears_floor().
+    """
+    legs    = (spec,) if isinstance(spec, TransferSpec) else tuple(spec)
+    sources = tuple(dict.fromkeys(cube_name(leg.source) for leg in legs))
+    options = {}
+    for signs in itertools.product((1.0, -1.0), repeat=len(legs)):
+        flipped = tuple(replace(leg, sign=s) for leg, s in zip(legs, signs))
+        key = signs if len(legs) > 1 else signs[0]
+        options[key] = clears_floor(flipped, cubes=sources)
+    return options
@@ -0,0 +1,137 @@
+# ============================================================================
+# lorqb/latches.py  (Blender 5.1.1)
+# Persistent ball latches — one seat + one COPY_TRANSFORMS per cube, made
+# once at scene build (C10) and kept across resets.
+#
+# Every arm used to clear the ball's constraints, delete the Seat_* empties
+# and create them again, and each add/remove rebuilt the depsgraph
+# relations. Here Seat_<Color> (parented to its cube, tagged PERSISTENT)
+# and Latch_<Color> on the ball stay put; lorqb.reset skips them. Arming a
+# turn only moves a seat if it has to and keys the influence curves of the
+# source and destination latches; LatchSet.hold() keeps the others at 0.
+# ============================================================================
+
+import bpy
+import mathutils
+
+from lorqb.canon import BALL, COLORS, SEAT_WORLD, cube_name, seat_name
+
+################################################################################
+# SECTION 1: Names + tags
+################################################################################
+PERSISTENT = "lorqb_persistent"
+PREFIX     = "Latch"
+ACTIVE     = "lorqb_latch"     # ball custom property: color held at rest
+SEAT_TOL   = 1e-5
+
+def latch_name(color):
+    return f"{PREFIX}_{color}"
+
+LATCH_NAMES = tuple(latch_name(c) for c in COLORS)
+
+def is_persistent(obj):
+    return obj is not None and obj.get(PERSISTENT) is not None
+
+def is_persistent_latch(con):
+    """True for a Latch_<Color> that targets its persistent seat."""
+    return (con.name in LATCH_NAMES and con.type == 'COPY_TRANSFORMS'
+            and is_persistent(con.target))
+
+################################################################################
+# SECTION 2: Build (once, from C10)
+################################################################################
+def _seat(color):
+    name = seat_name(color)
+    cube = bpy.data.objects.get(cube_name(color))
+    seat = bpy.data.objects.get(name)
+    if seat is not None and not is_persistent(seat):
+        bpy.data.objects.remove(seat, do_unlink=True)   # a per-run leftover
+        seat = None
+    if seat is None:
+        seat = bpy.data.objects.new(name, None)
+        seat.empty_display_type = 'SPHERE'
+        seat.empty_display_size = 0.08
+        seat[PERSISTENT] = 1
+        bpy.context.scene.collection.objects.link(seat)
+    seat.parent = cube
+    seat.matrix_parent_inverse = mathutils.Matrix.Identity(4)
+    seat.location = cube.matrix_world.inverted() @ mathutils.Vector(SEAT_WORLD[cube.name])
+    return seat
+
+def ensure_latches():
+    """Create (or repair) every persistent seat and latch. Returns a LatchSet."""
+    ball = bpy.data.objects.get(BALL)
+    if ball is None:
+        return LatchSet(None)
+    bpy.context.view_layer.update()
+    for color in COLORS:
+        seat = _seat(color)
+        con = ball.constraints.get(latch_name(color))
+        if con is not None and con.type != 'COPY_TRANSFORMS':
+            ball.constraints.remove(con)
+            con = None
+        if con is None:
+            con = ball.constraints.new(type='COPY_TRANSFORMS')
+            con.name = latch_name(color)
+        con.target = seat
+        con.influence = 0.0
+    ball.pop(ACTIVE, None)
+    bpy.context.view_layer.update()
+    return LatchSet(ball)
+
+################################################################################
+# SECTION 3: LatchSet — the state machine
+################################################################################
+class LatchSet:
+    """The ball's persistent latches; at most one is on at any frame.
+
+    Empty when the scene was built before persistent latches existed —
+    callers then fall back to creating per-run seats and constraints.
+    """
+
+    def __init__(self, ball=None):
+        self.ball = ball or bpy.data.objects.get(BALL)
+        self.cons = {}
+        if self.ball is not None:
+            for color in COLORS:
+                con = self.ball.constraints.get(latch_name(color))
+                if con is not None and is_persistent_latch(con):
+                    self.cons[color] = con
+
+    def __contains__(self, color):
+        return color in self.cons
+
+    @property
+    def active(self):
+        return self.ball.get(ACTIVE) if self.ball is not None else None
+
+    def seat_for(self, name, world):
+        """Persistent seat called name, moved to world if needed; else None."""
+        seat = bpy.data.objects.get(name)
+        if not is_persistent(seat):
+            return None
+        world = mathutils.Vector(world)
+        if (seat.matrix_world.translation - world).length > SEAT_TOL:
+            seat.location = seat.parent.matrix_world.inverted() @ world
+        return seat
+
+    def latch_for(self, con_name, seat, con_type='COPY_TRANSFORMS'):
+        """Persistent latch con_name on seat, or None if a new one is needed."""
+        for con in self.cons.values():
+            if con.name == con_name and con.type == con_type and con.target == seat:
+                return con
+        return None
+
+    def hold(self, color=None):
+        """Static state: color's latch on, every other off (None = all off).
+
+        Only the latches whose influence actually changes are written.
+        """
+        for c, con in self.cons.items():
+            value = 1.0 if c == color else 0.0
+            if con.influence != value:
+                con.influence = value
+        if color is None:
+            self.ball.pop(ACTIVE, None)
+        else:
+            self.ball[ACTIVE] = color
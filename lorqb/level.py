@@ -0,0 +1,203 @@
+# ============================================================================
+# lorqb/level.py
+# Full-level compositor — N transfers end to end on one timeline.
+# Pure Python + NumPy (no bpy); lorqb.compositor writes the result.
+#
+# Every C script keys frames 1–240 and its reset wipes the previous turn,
+# so Blue → Red → Green → Yellow → Blue took four runs. Turns cannot simply
+# share one parent tree either: C14 swings Hinge_Red_Green under Green,
+# C15 swings Green under Hinge_Red_Green. So a level is composed from the
+# closed-form kinematics instead (lorqb.kinematics):
+#
+#   - turn n plays on frames offset by the length of turns 0..n-1
+#   - every cube / hinge is free-standing; the frames where it moves are
+#     keyed as world location + continuous XYZ Euler, one F-curve per
+#     channel for the whole level (rest poses between turns hold by
+#     themselves — every turn starts and ends at rest)
+#   - the ball keeps one seat and one COPY_TRANSFORMS latch per cube for
+#     the whole level; a turn's destination latch is the next turn's
+#     source latch, so the ball's state carries over without re-arming
+#
+# Usage (plain Python or Blender console):
+#   from lorqb.level import compile_order
+#   level = compile_order(["Blue", "Red", "Green", "Yellow"], cyclic=True)
+#   level.turns, level.frame_range
+# ============================================================================
+
+from dataclasses import replace
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from lorqb.canon import BALL, LAYOUTS, SEAT_WORLD, cube_name, seat_name
+from lorqb.kinematics import solve, to_euler_xyz, translation
+from lorqb.plans import legs_for
+from lorqb.specs import TransferSpec, compile_transfer
+
+################################################################################
+# SECTION 1: Constants + compiled form
+################################################################################
+LATCH_PREFIX = "Latch"
+MOTION_TOL   = 1e-6
+
+class TurnBake(NamedTuple):
+    legs: tuple             # (TransferSpec, ...) as played (normalized)
+    frame_range: tuple      # turn-local, as compiled (1–240 per leg)
+    transform_keys: tuple   # ((name, frames (K,), locations (K, 3), eulers (K, 3)), ...)
+    influence_keys: tuple   # ((constraint, frame, value), ...) source + dest latch
+    swap: int               # ball latches into the destination (turn-local)
+
+class Turn(NamedTuple):
+    source: str
+    dest: str
+    legs: tuple        # (TransferSpec, ...) as played (normalized)
+    start: int         # level frames
+    swap: int          # ball latches into the destination
+    end: int
+    bake: TurnBake
+
+class CompiledLevel(NamedTuple):
+    stops: tuple            # ("Blue", "Red", ...) colors the ball visits
+    layout: str
+    turns: tuple            # (Turn, ...)
+    frame_range: tuple
+    transform_keys: tuple   # ((name, frames (K,), locations (K, 3), eulers (K, 3)), ...)
+    seats: tuple            # ((seat, cube, (x, y, z)), ...)
+    latches: tuple          # ((constraint, seat), ...)
+    influence_keys: tuple   # ((constraint, frame, value), ...)
+    ball_start: tuple
+    objects: tuple
+
+def latch_name(color):
+    return f"{LATCH_PREFIX}_{color}"
+
+################################################################################
+# SECTION 2: Turns
+################################################################################
+def turn_legs(source, dest):
+    """Legs for one turn, straight from the plan table (as C01 does)."""
+    return legs_for(source, dest)
+
+def _normalize(legs, layout):
+    """Legs with the level's layout and its persistent seats / latches."""
+    if isinstance(legs, TransferSpec):
+        legs = (legs,)
+    return tuple(replace(leg, layout=layout, latch='COPY_TRANSFORMS',
+                         latch_prefix=LATCH_PREFIX, capture_source=False,
+                         ball_start=True)
+                 for leg in legs)
+
+def _motion(worlds, rest, step):
+    """Indices of the frames to key for one object, or None if it never moves."""
+    moved = np.abs(worlds - rest).max(axis=(1, 2)) > MOTION_TOL
+    if not moved.any():
+        return None
+    first = max(int(np.argmax(moved)) - 1, 0)
+    last  = min(len(moved) - int(np.argmax(moved[::-1])), len(moved) - 1)
+    idx = list(range(first, last + 1, step))
+    if idx[-1] != last:
+        idx.append(last)
+    return np.array(idx)
+
+################################################################################
+# SECTION 3: Bake one turn
+################################################################################
+@lru_cache(maxsize=None)
+def bake_turn(legs, layout, step=1):
+    """TurnBake for legs played from rest at layout (cached per turn).
+
+    Frames stay turn-local; compile_level() and lorqb.library shift them.
+    """
+    legs = _normalize(legs, layout)
+    rest = {name: translation(loc) for name, loc in LAYOUTS[layout].items()}
+    c = compile_transfer(legs)
+    local  = np.arange(c.frame_range[0], c.frame_range[1] + 1)
+    worlds = solve(c, local)
+
+    keys = []
+    for name in LAYOUTS[layout]:
+        idx = _motion(worlds[name], rest[name], step)
+        if idx is not None:
+            m = worlds[name][idx]
+            # Every turn starts at rest, so Euler curves unwrap from zero
+            keys.append((name, local[idx], m[:, :3, 3].copy(), to_euler_xyz(m)))
+
+    dest = latch_name(legs[-1].dest)
+    swap = min(frame for con, frame, value in c.influence_keys
+               if con == dest and value == 1.0)
+    return TurnBake(legs, c.frame_range, tuple(keys), c.influence_keys, swap)
+
+################################################################################
+# SECTION 4: Compile a level
+################################################################################
+def compile_level(turns, layout=None, start=1, step=1):
+    """Compose turns (each a TransferSpec or tuple of legs) onto one timeline.
+
+    layout defaults to the first turn's; step keys every step-th frame of
+    a moving object (its first and last moving frame are always keyed).
+    """
+    turns = [(t,) if isinstance(t, TransferSpec) else tuple(t) for t in turns]
+    if not turns:
+        raise ValueError("A level needs at least one turn")
+    layout = layout or turns[0][0].layout
+
+    stops   = [turns[0][0].source]
+    played  = []
+    infl    = []
+    motion  = {}   # name -> [(frames, locations, eulers), ...]
+    offset  = start
+    for legs in turns:
+        if legs[0].source != stops[-1]:
+            raise ValueError(f"Turn {legs[0].name} starts at {legs[0].source}, "
+                             f"the ball is in {stops[-1]}")
+        bake  = bake_turn(legs, layout, step)
+        shift = offset - bake.frame_range[0]
+        for name, frames, locations, eulers in bake.transform_keys:
+            motion.setdefault(name, []).append((frames + shift, locations, eulers))
+        for con, frame, value in bake.influence_keys:
+            infl.append((con, frame + shift, value))
+
+        end = bake.frame_range[1] + shift
+        played.append(Turn(legs[0].source, legs[-1].dest, bake.legs,
+                           offset, bake.swap + shift, end, bake))
+        stops.append(legs[-1].dest)
+        offset = end + 1
+
+    # One seat + latch per cube the ball visits; all off except the first
+    colors = tuple(dict.fromkeys(stops))
+    first  = [(latch_name(color), start, 1.0 if color == stops[0] else 0.0)
+              for color in colors]
+
+    keys = tuple((name, *(np.concatenate(parts) for parts in zip(*segments)))
+                 for name, segments in motion.items())
+
+    return CompiledLevel(
+        stops=tuple(stops),
+        layout=layout,
+        turns=tuple(played),
+        frame_range=(start, offset - 1),
+        transform_keys=keys,
+        seats=tuple((seat_name(c), cube_name(c), SEAT_WORLD[cube_name(c)]) for c in colors),
+        latches=tuple((latch_name(c), seat_name(c)) for c in colors),
+        influence_keys=tuple(first + infl),
+        ball_start=SEAT_WORLD[cube_name(stops[0])],
+        objects=(BALL, *LAYOUTS[layout]),
+    )
+
+def compile_order(order, cyclic=False, layout=None, start=1, step=1):
+    """Level for a cube order: one turn per consecutive pair."""
+    stops = list(order) + list(order[:1]) if cyclic else list(order)
+    if len(stops) < 2:
+        raise ValueError("A level needs at least two stops")
+    turns = [turn_legs(a, b) for a, b in zip(stops, stops[1:])]
+    return compile_level(turns, layout, start, step)
+
+def format_level(level):
+    lines = [f"Level {' → '.join(level.stops)} ({level.layout}, frames "
+             f"{level.frame_range[0]}–{level.frame_range[1]})"]
+    for turn in level.turns:
+        hinges = " + ".join(leg.hinge for leg in turn.legs)
+        lines.append(f"  {turn.source:6} → {turn.dest:6} {turn.start:5}–{turn.end:<5} "
+                     f"swap {turn.swap:5}  {hinges}")
+    return lines
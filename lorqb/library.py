@@ -0,0 +1,137 @@
+# ============================================================================
+# lorqb/library.py  (Blender 5.1.1)
+# Turn library — each transfer baked once into a named, slotted Action.
+#
+# lorqb.compositor used to re-key every cube, hinge and ball latch for a
+# whole level on every arm. Here a turn (lorqb.level.bake_turn) becomes one
+# Action "LorQB_Blue_to_Red" with a slot per object it moves plus one for
+# the Ball's latches, tagged with its turn key and kept with a fake user,
+# so it is stored in the .blend and found again after reopening.
+#
+# A level is then just NLA strips on a "LorQB Level" track per object,
+# each pointing at a turn's Action + slot at that turn's frame offset.
+# Re-ordering the level moves strips: no keyframes are written and the
+# Actions are never orphaned (lorqb.purge skips fake users).
+# ============================================================================
+
+import bpy
+
+from lorqb.canon import BALL
+from lorqb.keyframes import write_fcurve
+from lorqb.plans import geometry_hash
+from lorqb.purge import track
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+TAG   = "lorqb_turn"
+TRACK = "LorQB Level"
+
+# turn key -> Action (validated on every hit — the file may have changed)
+_actions = {}
+
+def turn_key(bake, layout):
+    """Source>dest, leg route, layout and geometry hash — one Action each."""
+    legs  = bake.legs
+    route = "+".join(f"{leg.hinge}{leg.sign:+.0f}x{leg.degrees:g}" for leg in legs)
+    return f"{legs[0].source}>{legs[-1].dest}|{route}|{layout}|{geometry_hash()}"
+
+def action_name(bake):
+    return f"LorQB_{bake.legs[0].source}_to_{bake.legs[-1].dest}"
+
+################################################################################
+# SECTION 2: Bake a turn into an Action
+################################################################################
+def _alive(idblock):
+    try:
+        idblock.name
+        return True
+    except ReferenceError:
+        return False
+
+def _create(bake, key):
+    action = track(bpy.data.actions.new(action_name(bake)))
+    action[TAG] = key
+    action.use_fake_user  = True
+    action.use_frame_range = True
+    action.frame_start, action.frame_end = bake.frame_range
+
+    strip = action.layers.new("Layer").strips.new(type='KEYFRAME')
+
+    def channelbag(name):
+        return strip.channelbags.new(action.slots.new(id_type='OBJECT', name=name))
+
+    for name, frames, locations, eulers in bake.transform_keys:
+        bag = channelbag(name)
+        for data_path, values in (("location", locations), ("rotation_euler", eulers)):
+            for axis in range(3):
+                fc = bag.fcurves.new(data_path, index=axis)
+                write_fcurve(fc, [(f, v, 'LINEAR') for f, v in zip(frames, values[:, axis])])
+
+    bag = channelbag(BALL)
+    curves = {}
+    for con, frame, value in bake.influence_keys:
+        curves.setdefault(con, []).append((frame, value, 'CONSTANT'))
+    for con, keys in curves.items():
+        write_fcurve(bag.fcurves.new(f'constraints["{con}"].influence', index=0), keys)
+    return action
+
+def turn_action(bake, layout):
+    """The library Action for bake, created on first use."""
+    key = turn_key(bake, layout)
+    action = _actions.get(key)
+    if action is None or not _alive(action):
+        action = next((a for a in bpy.data.actions if a.get(TAG) == key), None)
+        if action is None:
+            action = _create(bake, key)
+            print(f"Library: baked {action.name} ({len(action.slots)} slots).")
+        _actions[key] = action
+    return action
+
+def slot_for(action, name):
+    return next(slot for slot in action.slots if slot.name_display == name)
+
+################################################################################
+# SECTION 3: Place strips
+################################################################################
+def clear_track(obj):
+    ad = obj.animation_data
+    if ad is not None:
+        old = ad.nla_tracks.get(TRACK)
+        if old is not None:
+            ad.nla_tracks.remove(old)
+
+def _track(obj):
+    ad = obj.animation_data or obj.animation_data_create()
+    ad.action = None
+    nla = ad.nla_tracks.get(TRACK)
+    if nla is None:
+        nla = ad.nla_tracks.new()
+        nla.name = TRACK
+    return nla
+
+def place_level(level, objs):
+    """One NLA strip per turn per object it moves. Returns the strip count.
+
+    objs maps every name in level.objects to its object. Between strips an
+    object holds the previous strip's last pose (rest: turns end at rest).
+    """
+    for obj in objs.values():
+        clear_track(obj)
+    placed = 0
+    for turn in level.turns:
+        action = turn_action(turn.bake, level.layout)
+        names  = [name for name, *_ in turn.bake.transform_keys] + [BALL]
+        for name in names:
+            nla   = _track(objs[name])
+            first = len(nla.strips) == 0
+            strip = nla.strips.new(f"{action.name}:{name}", turn.start, action)
+            strip.action_slot   = slot_for(action, name)
+            strip.extrapolation = 'HOLD' if first else 'HOLD_FORWARD'
+            strip.blend_type    = 'REPLACE'
+            placed += 1
+    return placed
+
+def library_actions():
+    """Every library Action in the file, by turn key."""
+    return {a[TAG]: a for a in bpy.data.actions if a.get(TAG) is not None}
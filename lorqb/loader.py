@@ -0,0 +1,127 @@
+# ============================================================================
+# lorqb/loader.py  (Blender 5.1.1)
+# Persistent module registry for the C and T scripts.
+#
+# The master runner used to open, read and exec() a whole script on every
+# button press — re-parsing it, redefining its classes and re-registering
+# its panels each time. Here each script is loaded once as a real module
+# (C_series.C12_blue_to_red, ...) and kept, together with its compiled
+# code object, keyed by the file's mtime. Later runs call the already
+# loaded setup function; the file is only recompiled when it changes.
+#
+# Registration is per module (lorqb.registry, owner = file stem): only the
+# classes a module defines are (re)registered, so reloading one script
+# never touches another's panels.
+# ============================================================================
+
+import os
+import sys
+import types
+
+import bpy
+
+from lorqb import registry
+from lorqb.paths import script_path
+
+
+################################################################################
+# SECTION 1: Sequence catalog — key → (package, module, entry function)
+################################################################################
+SEQUENCES = {
+    "C10": ("C_series", "C10_scene_build",     "build_scene"),
+    "C12": ("C_series", "C12_blue_to_red",     "setup_blue_to_red"),
+    "C13": ("C_series", "C13_red_to_green",    "setup_red_to_green"),
+    "C14": ("C_series", "C14_green_to_yellow", "setup_green_to_yellow"),
+    "C15": ("C_series", "C15_yellow_to_blue",  "setup_yellow_to_blue"),
+    "T01": ("T_series", "T01_blue_to_green",   "run_animation"),
+    "T02": ("T_series", "T02_yellow_to_red",   "run_animation"),
+    "T03": ("T_series", "T03_red_to_yellow",   "run_animation"),
+    "T04": ("T_series", "T04_green_to_blue",   "run_animation"),
+}
+
+# "C_series.C12_blue_to_red" -> {"path", "mtime", "code", "module", "owner", "classes"}
+_registry = {}
+
+################################################################################
+# SECTION 2: Load / reload
+################################################################################
+def _compile(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return compile(f.read(), path, "exec")
+
+def module_classes(module):
+    """bpy classes defined by module itself, in definition order."""
+    return [obj for obj in vars(module).values()
+            if isinstance(obj, type)
+            and issubclass(obj, bpy.types.bpy_struct)
+            and obj.__module__ == module.__name__]
+
+def _register(entry):
+    classes = module_classes(entry["module"])
+    entry["classes"] = registry.register_classes(entry["owner"], classes)
+
+def _unregister(entry):
+    registry.unregister_owner(entry["owner"])
+    entry["classes"] = []
+
+def load_module(package, stem, register=False):
+    """Return the loaded module for package/stem.py.
+
+    Compiles and executes the file only when it is new or its mtime
+    changed. With register=True the module's own classes are registered;
+    a reload swaps only that module's classes and keeps them registered
+    if they were before.
+    """
+    name  = f"{package}.{stem}"
+    path  = script_path(package, stem)
+    mtime = os.stat(path).st_mtime_ns
+    entry = _registry.get(name)
+
+    if entry is None or entry["mtime"] != mtime:
+        code = _compile(path)
+        if entry is not None:
+            register = register or bool(entry["classes"])
+            _unregister(entry)
+        module = types.ModuleType(name)
+        module.__file__    = path
+        module.__package__ = package
+        sys.modules[name] = module
+        try:
+            exec(code, module.__dict__)
+        except Exception:
+            sys.modules.pop(name, None)
+            _registry.pop(name, None)
+            raise
+        entry = {"path": path, "mtime": mtime, "code": code,
+                 "module": module, "owner": stem, "classes": []}
+        _registry[name] = entry
+        print(f"lorqb.loader: loaded {name}")
+
+    if register and not entry["classes"]:
+        _register(entry)
+    return entry["module"]
+
+def is_loaded(name):
+    return name in _registry
+
+def load_sequence(key, register=False):
+    package, stem, _ = SEQUENCES[key]
+    return load_module(package, stem, register=register)
+
+################################################################################
+# SECTION 3: Run
+################################################################################
+def run(key):
+    """Call the entry function of catalog entry key (e.g. "C12")."""
+    package, stem, func = SEQUENCES[key]
+    module = load_module(package, stem)
+    return getattr(module, func)()
+
+def forget(name=None):
+    """Drop a loaded module (all of them when name is None)."""
+    names = list(_registry) if name is None else [name]
+    for n in names:
+        entry = _registry.pop(n, None)
+        if entry is not None:
+            _unregister(entry)
+            sys.modules.pop(n, None)
@@ -0,0 +1,152 @@
+# ============================================================================
+# lorqb/mesh.py
+# Procedural hollow-cube geometry — replaces the boolean build in C10.
+# Pure Python (no bpy): returns (verts, faces) ready for Mesh.from_pydata().
+#
+# The shell is an outer box (normals out) and an inner box (normals in,
+# wall = inner size / outer size). A face with a hole becomes a ring of
+# quads between the hole circle and the face square, and a tube of quads
+# joins the outer and inner circles. With segments a multiple of 8 the
+# square's corners fall exactly on circle directions (45°, 135°, ...), so
+# every ring quad is planar and the neighbouring faces share the ring's
+# edge vertices — the result is closed and manifold, no boolean solver.
+# ============================================================================
+
+import math
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+CUBE_SIZE   = 1.0
+WALL        = 0.955   # inner cube size (C10's boolean inner cube)
+HOLE_RADIUS = 0.3
+SEGMENTS    = 32
+BALL_RADIUS = 0.25
+
+# Face name -> (axis, sign); "left" is -X, "right" is +X (as in C10)
+FACES = {
+    "right":  (0, +1), "left":  (0, -1),
+    "back":   (1, +1), "front": (1, -1),
+    "top":    (2, +1), "bottom": (2, -1),
+}
+
+KEY_DIGITS = 6
+
+################################################################################
+# SECTION 2: Helpers
+################################################################################
+def _frame(axis, sign):
+    """(U, V, N) unit axes of a box face with U × V = N (N points out)."""
+    e = [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+    n = tuple(sign * c for c in e[axis])
+    u, v = e[(axis + 1) % 3], e[(axis + 2) % 3]
+    if sign < 0:
+        u, v = v, u
+    return u, v, n
+
+def _point(frame, u, v, w):
+    U, V, N = frame
+    return tuple(u * U[i] + v * V[i] + w * N[i] for i in range(3))
+
+class _Builder:
+    """Deduplicating vertex store + face list."""
+
+    def __init__(self, offset):
+        self.offset = offset
+        self.verts  = []
+        self.index  = {}
+        self.faces  = []
+
+    def vert(self, p):
+        key = tuple(round(c, KEY_DIGITS) for c in p)
+        i = self.index.get(key)
+        if i is None:
+            i = len(self.verts)
+            self.index[key] = i
+            self.verts.append(tuple(p[k] - self.offset[k] for k in range(3)))
+        return i
+
+    def face(self, idx, flip=False):
+        self.faces.append(tuple(reversed(idx)) if flip else tuple(idx))
+
+def _ring(half, radius, segments):
+    """Circle points and their projections onto the square, face-local (u, v)."""
+    circle, square = [], []
+    for k in range(segments):
+        a = 2.0 * math.pi * k / segments
+        c, s = math.cos(a), math.sin(a)
+        circle.append((radius * c, radius * s))
+        m = max(abs(c), abs(s))
+        square.append((half * c / m, half * s / m))
+    return circle, square
+
+################################################################################
+# SECTION 3: Generator
+################################################################################
+def hollow_cube_geometry(size=CUBE_SIZE, wall=WALL, hole_radius=HOLE_RADIUS,
+                         segments=SEGMENTS, holes=("top",), origin=(0.0, 0.0, 0.0)):
+    """Vertices and faces of a hollow cube centred on (0, 0, 0).
+
+    holes  — face names from FACES that get a round hole through the wall
+    origin — point (cube-centred) that becomes the object origin, e.g. the
+             hinge the cube pivots on
+    """
+    if segments % 8:
+        raise ValueError(f"segments must be a multiple of 8, got {segments}")
+    half_out = size / 2.0
+    half_in  = size * wall / 2.0
+    if hole_radius >= half_in:
+        raise ValueError(f"hole radius {hole_radius} does not fit inside the wall")
+
+    holed = {FACES[name] for name in holes}
+    b = _Builder(origin)
+
+    # --- 3A: Rings on holed faces (registers the shared edge vertices) ---
+    circles = {}
+    for axis, sign in sorted(holed):
+        frame = _frame(axis, sign)
+        for half, flip in ((half_out, False), (half_in, True)):
+            circle, square = _ring(half, hole_radius, segments)
+            c_idx = [b.vert(_point(frame, u, v, half)) for u, v in circle]
+            s_idx = [b.vert(_point(frame, u, v, half)) for u, v in square]
+            for k in range(segments):
+                j = (k + 1) % segments
+                b.face((c_idx[k], s_idx[k], s_idx[j], c_idx[j]), flip)
+            circles[(axis, sign, half)] = c_idx
+
+        # Tube through the wall, normals toward the hole axis
+        outer = circles[(axis, sign, half_out)]
+        inner = circles[(axis, sign, half_in)]
+        for k in range(segments):
+            j = (k + 1) % segments
+            b.face((outer[k], outer[j], inner[j], inner[k]))
+
+    # --- 3B: Plain faces — corners plus any ring vertices on their edges ---
+    for axis, sign in FACES.values():
+        if (axis, sign) in holed:
+            continue
+        frame = _frame(axis, sign)
+        for half, flip in ((half_out, False), (half_in, True)):
+            corners = [(half, -half), (half, half), (-half, half), (-half, -half)]
+            loop = []
+            for c in range(4):
+                (u0, v0), (u1, v1) = corners[c], corners[(c + 1) % 4]
+                loop.append(b.vert(_point(frame, u0, v0, half)))
+                # Vertices a neighbouring ring already put on this edge
+                a = _point(frame, u0, v0, half)
+                z = _point(frame, u1, v1, half)
+                d = [z[i] - a[i] for i in range(3)]
+                length2 = sum(x * x for x in d)
+                between = []
+                for i, p in enumerate(b.verts):
+                    q = tuple(p[k] + origin[k] for k in range(3))
+                    t = sum((q[k] - a[k]) * d[k] for k in range(3)) / length2
+                    if not 1e-6 < t < 1.0 - 1e-6:
+                        continue
+                    off = [q[k] - a[k] - t * d[k] for k in range(3)]
+                    if sum(x * x for x in off) < 1e-10:
+                        between.append((t, i))
+                loop.extend(i for _, i in sorted(between))
+            b.face(loop, flip)
+
+    return b.verts, b.faces
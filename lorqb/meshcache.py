@@ -0,0 +1,104 @@
+# ============================================================================
+# lorqb/meshcache.py  (Blender 5.1.1)
+# Shared mesh / material datablocks for scene builds.
+#
+# build_scene() used to create four cube meshes, a UV sphere and four
+# Mat_* materials on every run, and clear_scene() only removed objects —
+# the orphaned data piled up in bpy.data and in the saved .blend.
+#
+# Here every generated datablock is keyed by its shape (or colour) and
+# tagged with that key as a custom property, so a rebuild — even after the
+# file was saved and reopened — links the existing datablock instead of
+# making a new one. Objects with the same shape share one mesh; colour is
+# linked per object so shared meshes can still differ in material.
+# Tagged datablocks left with no users are removed by lorqb.purge.
+# ============================================================================
+
+import bmesh
+import bpy
+
+from lorqb.mesh import BALL_RADIUS, CUBE_SIZE, HOLE_RADIUS, SEGMENTS, WALL, hollow_cube_geometry
+
+################################################################################
+# SECTION 1: Cache core
+################################################################################
+TAG = "lorqb_shape"
+
+# key -> datablock (validated on every hit — lorqb.purge may have removed it)
+_meshes    = {}
+_materials = {}
+
+def _alive(idblock):
+    try:
+        idblock.name
+        return True
+    except ReferenceError:
+        return False
+
+def _cached(cache, collection, key, create):
+    block = cache.get(key)
+    if block is not None and _alive(block):
+        return block
+    tag = repr(key)
+    block = next((b for b in collection if b.get(TAG) == tag), None)
+    if block is None:
+        block = create()
+        block[TAG] = tag
+    cache[key] = block
+    return block
+
+################################################################################
+# SECTION 2: Meshes
+################################################################################
+def hollow_cube_mesh(holes=("top",), origin=(0.0, 0.0, 0.0), size=CUBE_SIZE,
+                     wall=WALL, hole_radius=HOLE_RADIUS, segments=SEGMENTS):
+    """Shared hollow-cube mesh for this hole set and pivot offset."""
+    holes  = tuple(sorted(holes))
+    origin = tuple(round(c, 6) for c in origin)
+    key = ("hollow_cube", size, wall, hole_radius, segments, holes, origin)
+
+    def create():
+        verts, faces = hollow_cube_geometry(size, wall, hole_radius, segments, holes, origin)
+        mesh = bpy.data.meshes.new("LorQB_Cube_" + "_".join(holes))
+        mesh.from_pydata(verts, [], faces)
+        mesh.update()
+        return mesh
+
+    return _cached(_meshes, bpy.data.meshes, key, create)
+
+def uv_sphere_mesh(radius=BALL_RADIUS, segments=32, rings=16):
+    """Shared UV-sphere mesh (same topology as primitive_uv_sphere_add)."""
+    key = ("uv_sphere", radius, segments, rings)
+
+    def create():
+        mesh = bpy.data.meshes.new("LorQB_Ball")
+        bm = bmesh.new()
+        bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=radius)
+        bm.to_mesh(mesh)
+        bm.free()
+        return mesh
+
+    return _cached(_meshes, bpy.data.meshes, key, create)
+
+################################################################################
+# SECTION 3: Materials
+################################################################################
+def material(name, color, setup=None):
+    """Shared material for color (r, g, b); setup(mat) runs once on creation."""
+    key = ("material", name, tuple(round(c, 6) for c in color))
+
+    def create():
+        mat = bpy.data.materials.new(name=name)
+        if setup is not None:
+            setup(mat)
+        return mat
+
+    return _cached(_materials, bpy.data.materials, key, create)
+
+def assign_material(obj, mat):
+    """Link mat to obj itself, leaving a possibly shared mesh untouched."""
+    if not obj.data.materials:
+        obj.data.materials.append(None)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
@@ -0,0 +1,23 @@
+# ============================================================================
+# lorqb/paths.py
+# Where the repo lives on disk — one place for every script and tool.
+#
+# The C/T scripts and UTIL_load_all_scripts.py each hard-coded one
+# machine's checkout. The repo root is the folder holding lorqb/ and
+# C17_Master_Runner.blend: inside the package it follows from this file.
+# Before lorqb can be imported (a script run with Alt+P, or UTIL pasted
+# into the Text Editor) Blender only knows the open .blend, so those
+# scripts start with the same guard:
+#
+#   if "lorqb" not in sys.modules:   # repo root = folder of the open .blend
+#       sys.path.insert(0, os.path.dirname(bpy.data.filepath))
+# ============================================================================
+
+import os
+
+REPO_ROOT  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BLEND_FILE = os.path.join(REPO_ROOT, "C17_Master_Runner.blend")
+
+def script_path(package, stem):
+    """C_series / T_series script file for stem."""
+    return os.path.join(REPO_ROOT, package, stem + ".py")
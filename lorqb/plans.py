@@ -0,0 +1,188 @@
+# ============================================================================
+# lorqb/plans.py
+# Precomputed transfer plans for all 12 ordered cube pairs, cached on disk.
+# Pure Python (no bpy); the solver (NumPy) is only needed to regenerate.
+#
+# The README's shuffle "can select any cube order", but only the C12–C15
+# transfers exist as specs. Here lorqb.solver solves every pair once and
+# the result is stored in plans.json next to this file, keyed by
+# (source, destination, geometry hash): hinge stages with axes, signs,
+# angles and frames, the swap frame and the latch seats. Pairs no 90° / 180°
+# plan lands exactly get their angles refined (lorqb.solver.refine), so
+# every entry's source seat ends over its destination seat. At runtime a turn
+# is a dictionary lookup; when the scene geometry (lorqb.canon, lorqb.mesh)
+# or the solver settings change, the hash changes and the pair is solved
+# again on first use.
+#
+# Regenerate (plain Python, from the repo root):
+#   python -m lorqb.plans
+# ============================================================================
+
+import hashlib
+import json
+import os
+import random
+
+from lorqb.canon import (
+    CHAIN_ORDER, COLORS, HINGE_AXIS, HINGE_WORLD, LAYOUTS, SEAT_WORLD, seat_name,
+)
+from lorqb.mesh import CUBE_SIZE, HOLE_RADIUS, WALL
+from lorqb.specs import DEFAULT_FRAMES, TransferSpec, stage_frames
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+PLAN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plans.json")
+VERSION   = 1
+
+# Solver settings baked into the table (part of the hash)
+MAX_STAGES = 2
+ANGLES     = (90.0, 180.0)
+REFINED    = True
+
+# Timeline: stages play one after another up to F_HOLD, the ball swaps at
+# F_SWAP, then the stages return in reverse order up to F_END
+F_START, _, F_HOLD, F_SWAP, _, F_END = DEFAULT_FRAMES
+
+# geometry hash -> {"Blue>Red": entry}
+_table = {}
+_loaded = False
+
+################################################################################
+# SECTION 2: Keys
+################################################################################
+def geometry_hash():
+    """Short hash of everything a plan depends on."""
+    geometry = {
+        "chain":   CHAIN_ORDER,
+        "hinges":  {h: [HINGE_WORLD[h], HINGE_AXIS[h]] for h in sorted(HINGE_WORLD)},
+        "seats":   {c: SEAT_WORLD[c] for c in sorted(SEAT_WORLD)},
+        "layouts": {k: sorted(v.items()) for k, v in sorted(LAYOUTS.items())},
+        "cube":    [CUBE_SIZE, WALL, HOLE_RADIUS],
+        "solver":  [MAX_STAGES, list(ANGLES), REFINED],
+        "frames":  list(DEFAULT_FRAMES),
+    }
+    blob = json.dumps(geometry, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:12]
+
+def pair_key(source, dest):
+    return f"{source}>{dest}"
+
+################################################################################
+# SECTION 3: Entries
+################################################################################
+def entry_from_plan(plan):
+    """JSON-ready table entry for a lorqb.solver.Plan."""
+    frames = stage_frames(len(plan.stages))
+    return {
+        "source": plan.source,
+        "dest":   plan.dest,
+        "stages": [{"hinge": s.hinge, "axis": s.axis, "sign": s.sign,
+                    "degrees": s.degrees, "frames": list(f)}
+                   for s, f in zip(plan.stages, frames)],
+        "swap_frame":  F_SWAP,
+        "frame_range": [F_START, F_END],
+        "seats":  {"source": seat_name(plan.source), "dest": seat_name(plan.dest)},
+        "error":  round(plan.error, 6),
+        "drop":   round(plan.drop, 6),
+        "lowest": round(plan.lowest, 6),
+    }
+
+def as_legs(entry, **overrides):
+    """(TransferSpec,) playing every stage of entry; None for no entry."""
+    if entry is None:
+        return None
+    stages = tuple((st["hinge"], st["axis"], st["sign"], st["degrees"])
+                   for st in entry["stages"])
+    stage = entry["stages"][0]
+    fields = {
+        "name":    f"{entry['source']}_to_{entry['dest']}",
+        "source":  entry["source"],
+        "dest":    entry["dest"],
+        "hinge":   stage["hinge"],
+        "axis":    stage["axis"],
+        "sign":    stage["sign"],
+        "degrees": stage["degrees"],
+        "stages":  stages if len(stages) > 1 else (),
+    }
+    fields.update(overrides)
+    return (TransferSpec(**fields),)
+
+def legs_for(source, dest, **overrides):
+    """as_legs() of the plan for source → dest; ValueError if there is none."""
+    legs = as_legs(plan_for(source, dest), **overrides)
+    if legs is None:
+        raise ValueError(f"No plan from {source} to {dest}")
+    return legs
+
+################################################################################
+# SECTION 4: Solve / load / save
+################################################################################
+def solve(source, dest):
+    """Fresh entry from the solver (imports NumPy), or None."""
+    from lorqb.solver import best_plan
+    plan = best_plan(source, dest, max_stages=MAX_STAGES, angles=ANGLES, refined=REFINED)
+    return entry_from_plan(plan) if plan is not None else None
+
+def load(path=PLAN_FILE):
+    """Read the table once; entries for other geometry hashes are kept too."""
+    global _loaded
+    _loaded = True
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if data.get("version") != VERSION:
+        return 0
+    for geo, entries in data.get("plans", {}).items():
+        _table.setdefault(geo, {}).update(entries)
+    return len(_table.get(geometry_hash(), {}))
+
+def save(path=PLAN_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": VERSION, "plans": _table}, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+def generate(path=PLAN_FILE):
+    """Solve every ordered pair for the current geometry and write the table."""
+    geo = geometry_hash()
+    _table[geo] = {}
+    for source in COLORS:
+        for dest in COLORS:
+            if source != dest:
+                _table[geo][pair_key(source, dest)] = solve(source, dest)
+    save(path)
+    return _table[geo]
+
+################################################################################
+# SECTION 5: Lookup
+################################################################################
+def plan_for(source, dest):
+    """Table entry for source → dest (solved and cached if missing), or None."""
+    if not _loaded:
+        load()
+    entries = _table.setdefault(geometry_hash(), {})
+    key = pair_key(source, dest)
+    if key not in entries:
+        entries[key] = solve(source, dest)
+    return entries[key]
+
+def turn_order(rng=random):
+    """A shuffled cube order (README: "shuffle can select any cube order")."""
+    order = list(COLORS)
+    rng.shuffle(order)
+    return order
+
+def level_plan(order, cyclic=True):
+    """[entry, ...] for consecutive turns of order (back to the start if cyclic)."""
+    stops = list(order) + list(order[:1]) if cyclic else list(order)
+    return [plan_for(a, b) for a, b in zip(stops, stops[1:])]
+
+if __name__ == "__main__":
+    table = generate()
+    for key, entry in table.items():
+        stages = " then ".join(f"{s['hinge']} {s['sign']:+.0f}×{s['degrees']:g}°"
+                               for s in entry["stages"]) if entry else "no plan"
+        print(f"{key:14} {stages}")
+    print(f"Wrote {PLAN_FILE} ({geometry_hash()})")
@@ -0,0 +1,107 @@
+# ============================================================================
+# lorqb/purge.py  (Blender 5.1.1)
+# Orphan-data purge + memory accounting for LorQB-created datablocks.
+#
+# clear_scene() removes objects and every reset calls animation_data_clear(),
+# but the meshes, Mat_* materials and actions behind them stay in bpy.data
+# with zero users and are written into the .blend on every save.
+#
+# Every datablock LorQB creates is tagged (track()), and purge_unused()
+# removes the tagged ones nobody references any more, reporting counts and
+# an estimate of the bytes freed. Data made before tagging existed is
+# matched by the names the old scripts gave it (LEGACY_PATTERNS).
+# ============================================================================
+
+import re
+
+import bpy
+
+from lorqb.canon import ALL_NAMES
+
+################################################################################
+# SECTION 1: Tracking
+################################################################################
+TRACK_TAG  = "lorqb"
+SHAPE_TAG  = "lorqb_shape"   # lorqb.meshcache keys count as tracked too
+
+COLLECTIONS = ("meshes", "materials", "actions")
+
+# Untagged leftovers from earlier script versions, by collection
+_objects = "|".join(re.escape(n) for n in ALL_NAMES)
+LEGACY_PATTERNS = {
+    "meshes":    re.compile(r"^(Cube|Cylinder|Sphere)(\.\d+)?$"),
+    "materials": re.compile(r"^Mat_Cube.*$"),
+    "actions":   re.compile(rf"^({_objects})Action(\.\d+)?$"),
+}
+
+def track(idblock):
+    """Mark idblock as LorQB-created so purge_unused() may remove it."""
+    idblock[TRACK_TAG] = 1
+    return idblock
+
+def is_tracked(idblock):
+    return idblock.get(TRACK_TAG) is not None or idblock.get(SHAPE_TAG) is not None
+
+################################################################################
+# SECTION 2: Memory estimate (rough — DNA struct sizes, not allocator truth)
+################################################################################
+def estimate_bytes(kind, idblock):
+    if kind == "meshes":
+        return (1024
+                + 32 * len(idblock.vertices)
+                + 16 * len(idblock.edges)
+                + 16 * len(idblock.loops)
+                + 24 * len(idblock.polygons))
+    if kind == "materials":
+        nodes = len(idblock.node_tree.nodes) if idblock.node_tree else 0
+        return 2048 + 1024 * nodes
+    if kind == "actions":
+        keys = 0
+        for layer in idblock.layers:
+            for strip in layer.strips:
+                for bag in strip.channelbags:
+                    for fc in bag.fcurves:
+                        keys += len(fc.keyframe_points)
+        return 1024 + 72 * keys
+    return 1024
+
+################################################################################
+# SECTION 3: Purge
+################################################################################
+def _orphans(kind, legacy):
+    pattern = LEGACY_PATTERNS.get(kind)
+    for block in getattr(bpy.data, kind):
+        if block.users or block.use_fake_user:
+            continue
+        if is_tracked(block) or (legacy and pattern and pattern.match(block.name)):
+            yield block
+
+def purge_unused(kinds=COLLECTIONS, legacy=True, quiet=False):
+    """Remove unreferenced LorQB datablocks.
+
+    Repeats until nothing is left to remove (freeing a mesh can orphan its
+    materials). Returns {kind: (count, estimated_bytes)}.
+    """
+    report = {kind: [0, 0] for kind in kinds}
+    while True:
+        removed = 0
+        for kind in kinds:
+            collection = getattr(bpy.data, kind)
+            for block in list(_orphans(kind, legacy)):
+                report[kind][0] += 1
+                report[kind][1] += estimate_bytes(kind, block)
+                collection.remove(block)
+                removed += 1
+        if not removed:
+            break
+
+    report = {kind: tuple(v) for kind, v in report.items()}
+    if not quiet:
+        print(format_report(report))
+    return report
+
+def format_report(report):
+    total_n = sum(n for n, _ in report.values())
+    total_b = sum(b for _, b in report.values())
+    parts = ", ".join(f"{n} {kind}" for kind, (n, _) in report.items())
+    return f"LorQB purge: {total_n} datablocks ({parts}) ≈ {total_b / 1024:.1f} KiB freed"
@@ -0,0 +1,73 @@
+# ============================================================================
+# lorqb/registry.py  (Blender 5.1.1)
+# Central LorQB class registry — who registered what.
+#
+# _unregister_all_lorqb() used to walk dir(bpy.types) (thousands of names)
+# on every register and tore down every LorQB panel, including the T01–T03
+# panels UTIL_load_all_scripts.py keeps alive. Here each owner (one per
+# script, keyed by its file stem) records exactly the classes it
+# registered, so unregistering costs O(own classes) and never touches
+# another script's panels.
+# ============================================================================
+
+import bpy
+
+# owner -> [classes] in registration order
+_owners = {}
+
+################################################################################
+# SECTION 1: Register / unregister per owner
+################################################################################
+def rna_id(cls):
+    """Name cls is registered under in bpy.types.
+
+    Operators map "lorqb.blue_to_red" → "LORQB_OT_blue_to_red"; panels and
+    other types use bl_idname as is, or the class name when there is none.
+    """
+    idname = getattr(cls, "bl_idname", None)
+    if not idname:
+        return cls.__name__
+    if issubclass(cls, bpy.types.Operator) and "." in idname:
+        prefix, name = idname.split(".", 1)
+        return f"{prefix.upper()}_OT_{name}"
+    return idname
+
+def register_classes(owner, classes):
+    """Register classes for owner, replacing whatever owner had before."""
+    unregister_owner(owner)
+    registered = []
+    for cls in classes:
+        # Same RNA id from a run that predates the registry (Alt+P)
+        stale = getattr(bpy.types, rna_id(cls), None)
+        if stale is not None and stale is not cls:
+            try:
+                bpy.utils.unregister_class(stale)
+            except Exception:
+                pass
+        bpy.utils.register_class(cls)
+        registered.append(cls)
+    _owners[owner] = registered
+    return registered
+
+def unregister_owner(owner):
+    """Unregister only the classes owner registered."""
+    for cls in reversed(_owners.pop(owner, [])):
+        try:
+            bpy.utils.unregister_class(cls)
+        except Exception:
+            pass
+
+def unregister_all():
+    for owner in list(_owners):
+        unregister_owner(owner)
+
+################################################################################
+# SECTION 2: Queries
+################################################################################
+def owners():
+    """{owner: [bl_idname or class name, ...]} for the console / debugging."""
+    return {owner: [getattr(cls, "bl_idname", cls.__name__) for cls in classes]
+            for owner, classes in _owners.items()}
+
+def owned(owner):
+    return list(_owners.get(owner, []))
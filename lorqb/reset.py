@@ -0,0 +1,278 @@
+# ============================================================================
+# lorqb/reset.py  (Blender 5.1.1)
+# Incremental canonical reset shared by every C and T script.
+#
+# The first reset for a profile does the full legacy procedure (clear
+# animation + constraints, zero hinges, remove seats, unparent, restore
+# positions, rebuild chain in closed form, one update) and then snapshots
+# the result per object: parent, matrix_parent_inverse, matrix_basis,
+# matrix_world, constraint names and animation presence.
+#
+# Every later reset compares the scene against that snapshot and rewrites
+# only the objects that diverged. All matrix fixes are local (parent,
+# parent inverse, basis), so one view_layer.update() at the end is enough.
+# Persistent seats and latches (lorqb.latches) survive every reset.
+# ============================================================================
+
+from functools import lru_cache
+from typing import NamedTuple
+
+import bpy
+import mathutils
+
+from lorqb.canon import (
+    ALL_NAMES, BALL, CANONICAL_CHAIN, CUBE_NAMES, HINGE_NAMES, LAYOUTS, SEAT_NAMES,
+)
+from lorqb import framecache
+from lorqb.chain import apply_chain
+from lorqb.latches import is_persistent, is_persistent_latch
+from lorqb.purge import purge_unused
+
+################################################################################
+# SECTION 1: Profile — what "canonical" means for one script
+################################################################################
+class ResetProfile(NamedTuple):
+    # ((name, (x, y, z)), ...) world positions; None = leave transforms alone
+    positions: tuple = None
+    # ((child, parent), ...) rebuilt root-first after positions are set
+    chain: tuple = ()
+    # Seat empties from prior runs — removed on every reset
+    seats: tuple = tuple(SEAT_NAMES)
+    # Objects whose constraints are cleared
+    clear_constraints: tuple = (BALL,)
+    # Ball world location when it is unparented; None = leave it alone
+    ball_location: tuple = None
+
+MATRIX_TOL = 1e-5
+
+@lru_cache(maxsize=None)
+def layout_profile(layout, seats=(), chain=tuple(CANONICAL_CHAIN)):
+    """Profile for a transfer or level: layout positions, chain rebuilt on top.
+
+    Cached, so every arm of the same layout / seats resets incrementally.
+    """
+    return ResetProfile(
+        positions=tuple(LAYOUTS[layout].items()),
+        chain=tuple(chain),
+        seats=tuple(dict.fromkeys((*seats, *SEAT_NAMES))),
+        clear_constraints=(BALL, *CUBE_NAMES),
+    )
+
+# ResetProfile -> {"uids": {...}, "objects": {name: {...}}}
+_snapshots = {}
+
+################################################################################
+# SECTION 2: Helpers
+################################################################################
+def _tracked(profile):
+    """Names whose transforms are part of the canonical state."""
+    if profile.positions is None:
+        return []
+    names = [name for name, _ in profile.positions]
+    for child, parent in profile.chain:
+        for name in (child, parent):
+            if name not in names:
+                names.append(name)
+    return names
+
+def _matrix_close(a, b, tol=MATRIX_TOL):
+    return all(abs(a[r][c] - b[r][c]) <= tol for r in range(4) for c in range(4))
+
+def _uids():
+    uids = {}
+    for name in ALL_NAMES:
+        obj = bpy.data.objects.get(name)
+        uids[name] = obj.session_uid if obj else None
+    return uids
+
+def _remove_seats(profile):
+    removed = []
+    for seat_name in profile.seats:
+        seat = bpy.data.objects.get(seat_name)
+        if seat and not is_persistent(seat):
+            bpy.data.objects.remove(seat, do_unlink=True)
+            removed.append(seat_name)
+    return removed
+
+def _zero_hinges():
+    changed = []
+    for hinge_name in HINGE_NAMES:
+        hinge = bpy.data.objects.get(hinge_name)
+        if hinge is None:
+            continue
+        if hinge.rotation_mode != 'XYZ' or any(abs(v) > MATRIX_TOL for v in hinge.rotation_euler):
+            hinge.rotation_mode = 'XYZ'
+            hinge.rotation_euler = (0.0, 0.0, 0.0)
+            changed.append(hinge_name)
+    return changed
+
+################################################################################
+# SECTION 3: Full reset + snapshot
+################################################################################
+def _full_reset(profile):
+    # 1. Clear ALL animation data from every relevant object
+    for name in ALL_NAMES:
+        obj = bpy.data.objects.get(name)
+        if obj and obj.animation_data:
+            obj.animation_data_clear()
+
+    # 2. Clear constraints (Ball always; cubes for profiles that ask),
+    #    keeping the persistent latches
+    for name in profile.clear_constraints:
+        obj = bpy.data.objects.get(name)
+        if obj:
+            for con in [c for c in obj.constraints if not is_persistent_latch(c)]:
+                obj.constraints.remove(con)
+
+    # 3. Reset ALL hinges to 0 rotation
+    _zero_hinges()
+
+    # 4. Remove stale Seat empties from prior runs
+    removed = _remove_seats(profile)
+
+    if profile.positions is not None:
+        # 5. Unparent all objects so .location = world position
+        for name in ALL_NAMES:
+            obj = bpy.data.objects.get(name)
+            if obj and obj.parent:
+                obj.parent = None
+
+        # 6. Set canonical WORLD positions at rest rotation
+        for name, pos in profile.positions:
+            obj = bpy.data.objects.get(name)
+            if obj:
+                obj.location       = mathutils.Vector(pos)
+                obj.rotation_mode  = 'XYZ'
+                obj.rotation_euler = (0.0, 0.0, 0.0)
+
+        # 7. Rebuild canonical parent chain — closed form, no per-link update
+        apply_chain(profile.chain, update=False)
+
+    # 8. Ball start location (only when it is free-standing)
+    ball = bpy.data.objects.get(BALL)
+    if ball and profile.ball_location is not None and ball.parent is None:
+        ball.location = mathutils.Vector(profile.ball_location)
+    bpy.context.view_layer.update()
+    return removed
+
+def _snapshot(profile):
+    tracked = _tracked(profile)
+    objects = {}
+    for name in ALL_NAMES:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        state = {
+            "constraints": [con.name for con in obj.constraints],
+            "animated":    obj.animation_data is not None,
+        }
+        if name in tracked:
+            state.update({
+                "parent":         obj.parent.name if obj.parent else None,
+                "parent_inverse": obj.matrix_parent_inverse.copy(),
+                "basis":          obj.matrix_basis.copy(),
+                "world":          obj.matrix_world.copy(),
+                "rotation_mode":  obj.rotation_mode,
+            })
+        objects[name] = state
+    return {"uids": _uids(), "objects": objects}
+
+################################################################################
+# SECTION 4: Incremental reset
+################################################################################
+def _restore_diverged(profile, snapshot):
+    """Rewrite only objects that differ from the snapshot.
+
+    Returns the names of the objects that were touched.
+    """
+    touched  = []
+    reparent = []   # (obj, state) whose parent / matrices are restored
+
+    for name, state in snapshot["objects"].items():
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        dirty = False
+
+        if obj.animation_data is not None and not state["animated"]:
+            obj.animation_data_clear()
+            dirty = True
+
+        extra = [con for con in obj.constraints
+                 if con.name not in state["constraints"] and not is_persistent_latch(con)]
+        for con in extra:
+            obj.constraints.remove(con)
+            dirty = True
+
+        if "basis" in state:
+            parent_name = obj.parent.name if obj.parent else None
+            if (parent_name != state["parent"]
+                    or obj.rotation_mode != state["rotation_mode"]
+                    or not _matrix_close(obj.matrix_parent_inverse, state["parent_inverse"])
+                    or not _matrix_close(obj.matrix_basis, state["basis"])):
+                reparent.append((obj, state))
+                dirty = True
+
+        if dirty:
+            touched.append(name)
+
+    # Unparent first: a carry chain can invert canonical links (Hinge_BR
+    # carrying Red), and re-linking one by one would close a loop
+    for obj, _ in reparent:
+        obj.parent = None
+    for obj, state in reparent:
+        obj.parent = bpy.data.objects.get(state["parent"]) if state["parent"] else None
+        obj.rotation_mode = state["rotation_mode"]
+        obj.matrix_parent_inverse = state["parent_inverse"]
+        obj.matrix_basis = state["basis"]
+
+    # Hinges are zeroed in every profile, tracked or not
+    for name in _zero_hinges():
+        if name not in touched:
+            touched.append(name)
+
+    ball = bpy.data.objects.get(BALL)
+    if ball and profile.ball_location is not None and ball.parent is None:
+        target = mathutils.Vector(profile.ball_location)
+        if (ball.location - target).length > MATRIX_TOL:
+            ball.location = target
+            if BALL not in touched:
+                touched.append(BALL)
+
+    return touched
+
+################################################################################
+# SECTION 5: Entry point
+################################################################################
+def reset_scene(profile):
+    """Reset the scene to profile's canonical state.
+
+    Returns {"full": bool, "touched": [names], "removed": [seat names]},
+    plus "purged" (lorqb.purge report) when orphaned actions were removed.
+    """
+    # Cached playback mutes the rig; nothing is armed until a builder says so
+    framecache.release()
+    framecache.clear_armed()
+    snapshot = _snapshots.get(profile)
+    if snapshot is None or snapshot["uids"] != _uids():
+        removed = _full_reset(profile)
+        _snapshots[profile] = _snapshot(profile)
+        result = {"full": True, "touched": list(ALL_NAMES), "removed": removed}
+    else:
+        removed = _remove_seats(profile)
+        touched = _restore_diverged(profile, snapshot)
+        if touched or removed:
+            bpy.context.view_layer.update()
+        result = {"full": False, "touched": touched, "removed": removed}
+
+    # Actions dropped by animation_data_clear() (and nothing else) go now
+    if result["touched"]:
+        result["purged"] = purge_unused(("actions",), quiet=True)
+    return result
+
+def invalidate(profile=None):
+    """Drop cached snapshots (all of them when profile is None)."""
+    if profile is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(profile, None)
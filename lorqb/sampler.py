@@ -0,0 +1,60 @@
+# ============================================================================
+# lorqb/sampler.py  (Blender 5.1.1)
+# One-pass trajectory sampler — every frame, every LorQB object, one array.
+#
+# C14_DIAG.py looked at frame 1 only and its wpos() ran view_layer.update()
+# for every single query. Here the frame range is stepped once: frame_set()
+# evaluates the depsgraph (which writes evaluated matrix_world back to the
+# scene objects), then one foreach_get() per frame copies every object's
+# matrix_world into a preallocated NumPy buffer. The result is a
+# (frames, objects, 4, 4) array, so continuity / penetration / seat checks
+# become array operations instead of per-frame, per-object RNA calls.
+# ============================================================================
+
+import bpy
+import numpy as np
+
+from lorqb.trajectory import SAMPLE_NAMES, Trajectory
+
+################################################################################
+# SECTION 1: Sample
+################################################################################
+def _read_all(objects, buf):
+    """Every object's matrix_world into buf as (count, 4, 4), row-major."""
+    try:
+        objects.foreach_get("matrix_world", buf)
+    except (TypeError, AttributeError, RuntimeError):
+        # Slow path: older builds without foreach_get on matrix properties
+        for i, obj in enumerate(objects):
+            buf[i * 16:(i + 1) * 16] = np.asarray(obj.matrix_world, dtype=buf.dtype).T.ravel()
+    # Blender stores matrices column-major
+    return buf.reshape(-1, 4, 4).transpose(0, 2, 1)
+
+def sample(names=SAMPLE_NAMES, frame_range=None, scene=None):
+    """Trajectory of names over frame_range (default: the scene range).
+
+    Objects missing from the scene get NaN columns so indices stay stable.
+    The current frame is restored afterwards.
+    """
+    scene   = scene or bpy.context.scene
+    start, end = frame_range or (scene.frame_start, scene.frame_end)
+    frames  = np.arange(start, end + 1)
+    names   = tuple(names)
+
+    objects = scene.objects
+    lookup  = {name: i for i, name in enumerate(objects.keys())}
+    cols    = np.array([lookup.get(n, -1) for n in names], dtype=np.intp)
+    present = cols >= 0
+    source  = cols[present]
+
+    buf = np.empty(len(objects) * 16, dtype=np.float32)
+    out = np.full((len(frames), len(names), 4, 4), np.nan, dtype=np.float32)
+
+    current = scene.frame_current
+    try:
+        for i, frame in enumerate(frames):
+            scene.frame_set(int(frame))
+            out[i, present] = _read_all(objects, buf)[source]
+    finally:
+        scene.frame_set(current)
+    return Trajectory(frames, names, out)
@@ -0,0 +1,129 @@
+# ============================================================================
+# lorqb/sequence.py  (Blender 5.1.1)
+# Sequence engine — arms any compiled transfer in the open scene.
+#
+# build_transfer(spec) takes a TransferSpec (or a tuple of legs from
+# lorqb.plans.legs_for) and does what each C script used to do by hand:
+#   reset → carry chain → seats → ball latches → hinge + influence keys.
+# Specs compile once (lorqb.specs.compile_transfer is cached), so arming
+# a transfer never re-executes a script file.
+# ============================================================================
+
+import bpy
+import mathutils
+
+from lorqb.canon import BALL
+from lorqb.chain import apply_over
+from lorqb.framecache import mark_armed
+from lorqb.keyframes import KeyBatch
+from lorqb.latches import LatchSet
+from lorqb.reset import layout_profile, reset_scene
+from lorqb.specs import TransferSpec, compile_transfer
+
+################################################################################
+# SECTION 1: Compile + reset profile
+################################################################################
+def compiled(spec):
+    """CompiledTransfer for a TransferSpec or a tuple of legs."""
+    legs = (spec,) if isinstance(spec, TransferSpec) else tuple(spec)
+    return compile_transfer(legs)
+
+def reset_profile(spec):
+    """ResetProfile a transfer starts from: its layout with the canonical chain."""
+    c = compiled(spec)
+    return layout_profile(c.layout, tuple(seat for seat, _, _ in c.seats))
+
+def reset_for(spec):
+    return reset_scene(reset_profile(spec))
+
+################################################################################
+# SECTION 2: Helpers
+################################################################################
+def remove_rigid_body(ball):
+    if ball.rigid_body:
+        bpy.context.view_layer.objects.active = ball
+        try:
+            bpy.ops.rigidbody.object_remove()
+        except Exception:
+            try:
+                ball.rigid_body.kinematic = True
+            except Exception:
+                pass
+
+def create_seat(name, cube, world):
+    seat = bpy.data.objects.new(name, None)
+    seat.empty_display_type = 'SPHERE'
+    seat.empty_display_size = 0.08
+    bpy.context.scene.collection.objects.link(seat)
+    seat.parent = cube
+    seat.location = cube.matrix_world.inverted() @ world
+    return seat
+
+################################################################################
+# SECTION 3: Build
+################################################################################
+def build_transfer(spec):
+    """Arm spec in the open scene. Returns True on success."""
+    c = compiled(spec)
+    scene = bpy.context.scene
+
+    # --- 3A: Standalone reset (independence guarantee) ---
+    reset_for(spec)
+
+    # --- 3B: Validate all required objects ---
+    objs = {name: bpy.data.objects.get(name) for name in c.objects}
+    missing = [name for name, obj in objs.items() if obj is None]
+    if missing:
+        print("ERROR: Missing objects:", missing)
+        return False
+    ball = objs[BALL]
+
+    scene.frame_set(c.frame_range[0])
+    if c.ball_start is not None:
+        ball.location = mathutils.Vector(c.ball_start)
+    remove_rigid_body(ball)
+
+    # --- 3C: Carry chain on top of the canonical one — closed form, one update ---
+    apply_over(reset_profile(spec).chain, c.carry, update=False)
+    bpy.context.view_layer.update()
+    for child, parent in c.carry:
+        print(f"{child} parented to {parent}.")
+
+    # --- 3D: Seats inside source / destination cubes (persistent when built) ---
+    latches = LatchSet(ball)
+    latches.hold(None)
+    seats = {}
+    for name, cube_name, world in c.seats:
+        if name == c.capture_seat:
+            world = ball.matrix_world.translation.copy()
+        seats[name] = (latches.seat_for(name, world)
+                       or create_seat(name, objs[cube_name], mathutils.Vector(world)))
+        print(f"{name} inside {cube_name} at {tuple(world)}.")
+    bpy.context.view_layer.update()
+
+    # --- 3E: Ball latches — only missing ones are created ---
+    for con_name, seat, latch_type in c.latches:
+        if latches.latch_for(con_name, seats[seat], latch_type) is not None:
+            continue
+        con = ball.constraints.new(type=latch_type)
+        con.name = con_name
+        con.target = seats[seat]
+        if latch_type == 'CHILD_OF':
+            # Identity inverse = ball tracks the seat exactly
+            con.inverse_matrix = mathutils.Matrix.Identity(4)
+        print(f"{con_name} ({latch_type}) → {seat}.")
+
+    # --- 3F: Hinge rotation (LINEAR) + latch influences (CONSTANT) ---
+    keys = KeyBatch()
+    for hinge, axis, sign, frame, degrees in c.hinge_keys:
+        keys.key_rot(objs[hinge], axis, sign, frame, degrees)
+    for con_name, frame, value in c.influence_keys:
+        keys.key_influence(ball, con_name, frame, value)
+    written = keys.flush()
+    print(f"{written} keys written.")
+
+    # --- 3G: Frame range ---
+    scene.frame_start, scene.frame_end = c.frame_range
+    scene.frame_set(c.frame_range[0])
+    mark_armed(spec)
+    return True
@@ -0,0 +1,244 @@
+# ============================================================================
+# lorqb/solver.py
+# ROT_SIGN / transfer-plan solver on top of the closed-form kinematics.
+# Pure Python + NumPy (no bpy).
+#
+# Every sign in C12–C14 and T01–T03 was found by trial in the viewport
+# ("flip sign if wrong", "verify in Blender"). Here a source → destination
+# pair is searched instead: each candidate is one or more stages
+# (hinge, axis, sign, degrees) held in turn, like T01's HBR 180° then
+# HRG 90°. Each stage swings the source side of its hinge (carry_links),
+# the final pose is evaluated in closed form and scored by how far the
+# source seat ends up from the point above the destination seat.
+#
+# A candidate only counts when
+#   - the source seat ends above the destination seat (the ball drops in)
+#   - the source cube never passes through the floor on the way (each
+#     stage is swept, earlier stages held); the lowest point of the whole
+#     carried chain is kept and breaks ties
+#   - its carry links form one tree (no child with two parents) and leave
+#     the destination cube where it is
+# The ~100 candidates of a pair evaluate in a few milliseconds (tens when
+# only two-stage plans fit); best_plan() caches per pair.
+#
+# Diagonal pairs (Blue → Green, ...) cannot land with 90° / 180° stages:
+# the best of them stays 0.24 off. refine() then tunes one stage's angle
+# (coarse sweep, golden-section search to 0.01°) until the source seat is
+# over the destination seat, e.g. T01: HBR 180° then HRG 68.43°.
+#
+# Usage (plain Python or Blender console):
+#   from lorqb.solver import best_plan, format_plan
+#   print(format_plan(best_plan("Green", "Yellow")))
+# ============================================================================
+
+import itertools
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from lorqb.canon import (
+    CUBE_NAMES, HINGE_AXIS, HINGE_NAMES, SEATED_LAYOUT, SEAT_WORLD, cube_name,
+)
+from lorqb.kinematics import chain_worlds, cube_corners, translation
+from lorqb.specs import TransferSpec, carry_links
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+ANGLES     = (90.0, 180.0)
+SIGNS      = (1.0, -1.0)
+MAX_STAGES = 2
+SWEEP      = 12      # samples per stage when checking the floor
+FLOOR      = 0.0
+TOL        = 1e-6
+MATCH_TOL  = 1e-3    # plans closer than this count as exact
+GOLDEN     = (np.sqrt(5.0) - 1.0) / 2.0
+REFINE_STEP   = 2.0  # degrees between coarse samples when refining an angle
+REFINE_DIGITS = 2    # refined angles are rounded to 0.01°
+
+class Stage(NamedTuple):
+    hinge: str
+    axis: int
+    sign: float
+    degrees: float
+
+class Plan(NamedTuple):
+    source: str
+    dest: str
+    stages: tuple     # (Stage, ...) in the order they are played
+    error: float      # horizontal distance source seat → destination seat
+    drop: float       # source seat height above the destination seat
+    lowest: float     # lowest corner of any cube during the swing
+
+    @property
+    def exact(self):
+        return self.error < MATCH_TOL
+
+    def as_spec(self, **overrides):
+        """TransferSpec for a single-stage plan (None for multi-stage)."""
+        if len(self.stages) != 1:
+            return None
+        stage = self.stages[0]
+        fields = {
+            "name": f"{self.source}_to_{self.dest}", "source": self.source,
+            "dest": self.dest, "hinge": stage.hinge, "axis": stage.axis,
+            "sign": stage.sign, "degrees": stage.degrees,
+        }
+        fields.update(overrides)
+        return TransferSpec(**fields)
+
+################################################################################
+# SECTION 2: Candidates
+################################################################################
+def _carry(stages, source):
+    """Merged carry links of every stage, or None if two stages disagree."""
+    parents = {}
+    for stage in stages:
+        for child, parent in carry_links(stage.hinge, source):
+            if parents.setdefault(child, parent) != parent:
+                return None
+    return parents
+
+def candidates(source, max_stages=MAX_STAGES, angles=ANGLES, axes=None):
+    """Every stage sequence to try; axes=None uses each hinge's own axis."""
+    singles = [Stage(h, axis, sign, deg)
+               for h in HINGE_NAMES
+               for axis in (axes if axes is not None else (HINGE_AXIS[h],))
+               for sign in SIGNS
+               for deg in angles]
+    for n in range(1, max_stages + 1):
+        for stages in itertools.permutations(singles, n):
+            if len({s.hinge for s in stages}) < n:
+                continue   # one hinge per stage
+            if _carry(stages, source) is None:
+                continue
+            yield stages
+
+################################################################################
+# SECTION 3: Score
+################################################################################
+def _sweep(stages):
+    """(F, 3) angles per hinge: each stage eases 0 → target, earlier held."""
+    count  = SWEEP * len(stages) + 1
+    angles = {s.hinge: np.zeros((count, 3)) for s in stages}
+    t = np.linspace(0.0, 1.0, SWEEP + 1)[1:]
+    for i, stage in enumerate(stages):
+        target = stage.sign * np.radians(stage.degrees)
+        column = angles[stage.hinge][:, stage.axis]
+        column[1 + i * SWEEP:1 + (i + 1) * SWEEP] = t * target
+        column[1 + (i + 1) * SWEEP:] = target
+    return angles, count
+
+_REST     = {name: translation(loc) for name, loc in SEATED_LAYOUT.items()}
+_REST_INV = {name: np.linalg.inv(m) for name, m in _REST.items()}
+
+def _seat(worlds, cube):
+    """Seat of cube at the last evaluated pose."""
+    return (worlds[cube][-1] @ _REST_INV[cube] @ np.append(SEAT_WORLD[cube], 1.0))[:3]
+
+def _lowest(worlds, cubes):
+    return min(float((worlds[c] @ _REST_INV[c] @ cube_corners(c).T)[:, 2, :].min())
+               for c in cubes)
+
+def _final(source, dest, stages, parents):
+    """(error, drop) of the source seat over the destination seat at the end."""
+    final = {s.hinge: np.zeros((1, 3)) for s in stages}
+    for s in stages:
+        final[s.hinge][0, s.axis] = s.sign * np.radians(s.degrees)
+    worlds = chain_worlds(_REST, parents, final, 1)
+    src, dst = _seat(worlds, cube_name(source)), _seat(worlds, cube_name(dest))
+    return float(np.hypot(src[0] - dst[0], src[1] - dst[1])), float(src[2] - dst[2])
+
+def score(source, dest, stages):
+    """Plan for stages, or None if the candidate is not physically valid."""
+    parents = _carry(stages, source)
+    src_cube, dst_cube = cube_name(source), cube_name(dest)
+    if parents is None or dst_cube in parents:
+        return None   # the destination must stay put (T01: "fixed destination")
+
+    # Final pose first — cheap, and most candidates fail here
+    error, drop = _final(source, dest, stages, parents)
+    if drop <= TOL:
+        return None
+
+    # Swing: the source cube must never pass through the floor; the rest of
+    # the carried chain is only reported (a sign cannot fix it)
+    angles, count = _sweep(stages)
+    worlds = chain_worlds(_REST, parents, angles, count)
+    if _lowest(worlds, (src_cube,)) < FLOOR - TOL:
+        return None
+    return Plan(source, dest, tuple(stages), error, drop, _lowest(worlds, CUBE_NAMES))
+
+def _rank(plan):
+    # Closest first (all exact plans tie); then chains that clear the floor,
+    # fewer stages, less rotation
+    return (0.0 if plan.exact else round(plan.error, 6), plan.lowest < FLOOR - TOL,
+            len(plan.stages), sum(s.degrees for s in plan.stages))
+
+def _with_angle(stages, i, degrees):
+    return stages[:i] + (stages[i]._replace(degrees=degrees),) + stages[i + 1:]
+
+def refine(plan):
+    """plan with one stage's angle tuned to land the source seat; plan if none beats it."""
+    if plan.exact:
+        return plan
+    parents = _carry(plan.stages, plan.source)
+    best = plan
+    for i in range(len(plan.stages)):
+        def error(degrees):
+            stages = _with_angle(plan.stages, i, degrees)
+            error, drop = _final(plan.source, plan.dest, stages, parents)
+            return error if drop > TOL else np.inf   # lined up, but not above
+
+        # Coarse sweep over (0°, 180°], then golden-section around the best sample
+        grid = np.arange(REFINE_STEP, 180.0 + REFINE_STEP / 2, REFINE_STEP)
+        k  = int(np.argmin([error(d) for d in grid]))
+        lo = max(grid[k] - REFINE_STEP, 0.0)
+        hi = min(grid[k] + REFINE_STEP, 180.0)
+        while hi - lo > 10.0 ** -REFINE_DIGITS / 2:
+            a = hi - GOLDEN * (hi - lo)
+            b = lo + GOLDEN * (hi - lo)
+            if error(a) < error(b):
+                hi = b
+            else:
+                lo = a
+        degrees = round(float(lo + hi) / 2, REFINE_DIGITS)
+        tuned = score(plan.source, plan.dest, _with_angle(plan.stages, i, degrees))
+        if tuned is not None and _rank(tuned) < _rank(best):
+            best = tuned
+    return best
+
+################################################################################
+# SECTION 4: Solve
+################################################################################
+def solve_pair(source, dest, max_stages=MAX_STAGES, angles=ANGLES, axes=None):
+    """Valid plans for source → dest, best first."""
+    if source == dest:
+        raise ValueError(f"Transfer needs two different cubes, got {source}")
+    plans = []
+    for stages in candidates(source, max_stages, angles, axes):
+        plan = score(source, dest, stages)
+        if plan is not None:
+            plans.append(plan)
+    return sorted(plans, key=_rank)
+
+@lru_cache(maxsize=None)
+def best_plan(source, dest, max_stages=MAX_STAGES, angles=ANGLES, axes=None,
+              refined=False):
+    """Best plan for source → dest, or None when nothing is valid.
+
+    refined=True refines every plan when none lands exactly (refine()).
+    """
+    plans = solve_pair(source, dest, max_stages, angles, axes)
+    if refined and plans and not plans[0].exact:
+        plans = sorted((refine(p) for p in plans), key=_rank)
+    return plans[0] if plans else None
+
+def format_plan(plan):
+    if plan is None:
+        return "no valid plan"
+    stages = " then ".join(
+        f"{s.hinge} {'XYZ'[s.axis]} {s.sign:+.0f}×{s.degrees:g}°" for s in plan.stages)
+    return (f"{plan.source} → {plan.dest}: {stages} "
+            f"(off by {plan.error:.3f}, drop {plan.drop:.3f})")
@@ -0,0 +1,303 @@
+# ============================================================================
+# lorqb/specs.py
+# Transfer specs — one cube-to-cube transfer as a small table row.
+# Pure Python (no bpy) so specs can be planned and compiled offline.
+#
+# A transfer flips the source cube 180° over one hinge so its seat lands
+# above the destination seat, swaps the ball's latch at the hold frame and
+# swings back. Everything else (carry chain, seats, latches, keys) follows
+# from the hinge and the two cubes, so C12–C15 are just rows in TRANSFERS.
+#
+# Diagonal pairs (Blue↔Green, Red↔Yellow) have no single 180° flip. The
+# solver's plan for them (lorqb.plans) is one leg of several stages —
+# hinges turned one after another before the swap and unwound in reverse
+# after it; plan_transfer() still routes them as two legs through a
+# neighbouring cube when no plan table is at hand.
+# ============================================================================
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+from lorqb.canon import (
+    BALL, CHAIN_ORDER, COLORS, HINGE_AXIS, HINGE_NAMES, HINGE_WORLD,
+    SEAT_WORLD, cube_name, seat_name,
+)
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+# (start, mid, hold, swap, return, end)
+DEFAULT_FRAMES = (1, 60, 120, 121, 180, 240)
+
+SEAT_TOL = 1e-4
+
+################################################################################
+# SECTION 2: Spec + compiled form
+################################################################################
+@dataclass(frozen=True)
+class TransferSpec:
+    name: str
+    source: str                     # color, e.g. "Blue"
+    dest: str
+    hinge: str
+    axis: int                       # rotation_euler index
+    sign: float                     # lifts the source side above the floor
+    degrees: float = 180.0
+    frames: tuple = DEFAULT_FRAMES
+    latch: str = 'COPY_TRANSFORMS'  # or 'CHILD_OF' (identity inverse)
+    latch_prefix: str = "Latch"     # constraint names: <prefix>_<Color>
+    layout: str = "SEATED"          # "SEATED" or "PIVOT" (see lorqb.canon)
+    capture_source: bool = False    # source seat at the ball's current position
+    ball_start: bool = True         # move the ball to the source seat first
+    # ((hinge, axis, sign, degrees), ...) played in turn; () = the flip above
+    stages: tuple = ()
+
+class CompiledTransfer(NamedTuple):
+    legs: tuple
+    layout: str
+    carry: tuple            # ((child, parent), ...)
+    seats: tuple            # ((seat, cube, (x, y, z)), ...)
+    capture_seat: str       # seat placed at the ball instead, or None
+    ball_start: tuple       # ball world location, or None
+    latches: tuple          # ((constraint, seat, type), ...)
+    hinge_keys: tuple       # ((hinge, axis, sign, frame, degrees), ...)
+    influence_keys: tuple   # ((constraint, frame, value), ...)
+    frame_range: tuple      # (start, end)
+    objects: tuple          # every object the transfer needs
+
+def leg_stages(leg):
+    """((hinge, axis, sign, degrees), ...) a leg turns, in play order."""
+    return leg.stages or ((leg.hinge, leg.axis, leg.sign, leg.degrees),)
+
+def stage_frames(count, start=DEFAULT_FRAMES[0], hold=DEFAULT_FRAMES[2],
+                 swap=DEFAULT_FRAMES[3], end=DEFAULT_FRAMES[5]):
+    """[(go_start, go_end, back_start, back_end), ...] for count stages.
+
+    Going out, stage i owns the i-th slice of start..hold; coming back the
+    stages unwind in reverse order over swap..end.
+    """
+    def split(a, b):
+        edges = [round(a + (b - a) * i / count) for i in range(count + 1)]
+        return list(zip(edges[:-1], edges[1:]))
+    go   = split(start, hold)
+    back = split(swap, end)[::-1]
+    return [(*go[i], *back[i]) for i in range(count)]
+
+################################################################################
+# SECTION 3: Geometry — which hinge carries which cube where
+################################################################################
+def carry_links(hinge, source):
+    """Parent links that make the source side of hinge swing with it.
+
+    Walks CHAIN_ORDER outward from the hinge toward the source cube, each
+    object parented to the previous one. Returns ((child, parent), ...).
+    """
+    i = CHAIN_ORDER.index(hinge)
+    j = CHAIN_ORDER.index(cube_name(source))
+    step = 1 if j > i else -1
+    side = CHAIN_ORDER[i::step]
+    return tuple(zip(side[1:], side[:-1]))
+
+def flip_sign(hinge, axis, source):
+    """Rotation sign that lifts the source seat up (not through the floor)."""
+    hx, hy, _ = HINGE_WORLD[hinge]
+    sx, sy, _ = SEAT_WORLD[cube_name(source)]
+    if axis == 0:
+        return 1.0 if sy > hy else -1.0
+    return -1.0 if sx > hx else 1.0
+
+def flip_target(hinge, axis, source):
+    """Color whose seat lies under the source seat after a 180° flip."""
+    hx, hy, _ = HINGE_WORLD[hinge]
+    sx, sy, _ = SEAT_WORLD[cube_name(source)]
+    if axis == 0:
+        tx, ty = sx, 2.0 * hy - sy
+    else:
+        tx, ty = 2.0 * hx - sx, sy
+    for color in COLORS:
+        x, y, _ = SEAT_WORLD[cube_name(color)]
+        if abs(x - tx) < SEAT_TOL and abs(y - ty) < SEAT_TOL:
+            return color
+    return None
+
+def spec_for(source, dest, **overrides):
+    """Single-flip spec for source → dest, or None if no hinge reaches it.
+
+    The hinge closest to the source cube along the chain wins.
+    """
+    src = CHAIN_ORDER.index(cube_name(source))
+    candidates = [h for h in HINGE_NAMES
+                  if flip_target(h, HINGE_AXIS[h], source) == dest]
+    if not candidates:
+        return None
+    hinge = min(candidates, key=lambda h: abs(CHAIN_ORDER.index(h) - src))
+    axis  = HINGE_AXIS[hinge]
+    fields = {
+        "name":   f"{source}_to_{dest}",
+        "source": source,
+        "dest":   dest,
+        "hinge":  hinge,
+        "axis":   axis,
+        "sign":   flip_sign(hinge, axis, source),
+    }
+    fields.update(overrides)
+    return TransferSpec(**fields)
+
+def plan_transfer(source, dest, **overrides):
+    """Legs for any ordered cube pair: one flip, or two through a neighbour."""
+    if source == dest:
+        raise ValueError(f"Transfer needs two different cubes, got {source}")
+    spec = spec_for(source, dest, **overrides)
+    if spec is not None:
+        return (spec,)
+    for via in COLORS:
+        if via in (source, dest):
+            continue
+        first  = spec_for(source, via, **overrides)
+        second = spec_for(via, dest, **overrides)
+        if first is None or second is None:
+            continue
+        legs = (first, second)
+        try:
+            _merge_carry(legs)
+        except ValueError:
+            continue
+        return legs
+    raise ValueError(f"No hinge route from {source} to {dest}")
+
+################################################################################
+# SECTION 4: Compile
+################################################################################
+def _merge_carry(legs):
+    """Union of every leg's carry links; one parent per child, no cycles."""
+    parents = {}
+    order   = []
+    for leg in legs:
+        links = [link for hinge, *_ in leg_stages(leg) for link in carry_links(hinge, leg.source)]
+        for child, parent in links:
+            if parents.get(child, parent) != parent:
+                raise ValueError(
+                    f"{leg.name}: {child} needs parent {parent}, "
+                    f"already parented to {parents[child]}")
+            if child not in parents:
+                parents[child] = parent
+                order.append((child, parent))
+    for child in parents:
+        seen = {child}
+        node = parents[child]
+        while node in parents:
+            if node in seen:
+                raise ValueError(f"Carry links form a cycle through {node}")
+            seen.add(node)
+            node = parents[node]
+    return tuple(order)
+
+@lru_cache(maxsize=None)
+def compile_transfer(legs):
+    """Expand a tuple of TransferSpec legs into everything build needs.
+
+    Leg n runs on frames shifted by n full leg lengths.
+    """
+    if isinstance(legs, TransferSpec):
+        legs = (legs,)
+    first = legs[0]
+
+    seats    = []
+    latches  = []
+    hinges   = []
+    infl     = []
+    objects  = [BALL]
+    seen     = set()
+    offset   = 0
+    start    = first.frames[0]
+    end      = start
+
+    for leg in legs:
+        f_start, f_mid, f_hold, f_swap, f_ret, f_end = (f + offset for f in leg.frames)
+        half = leg.degrees / 2.0
+
+        for color in (leg.source, leg.dest):
+            if color in seen:
+                continue
+            seen.add(color)
+            cube = cube_name(color)
+            seats.append((seat_name(color), cube, SEAT_WORLD[cube]))
+            latches.append((f"{leg.latch_prefix}_{color}", seat_name(color), leg.latch))
+            objects.append(cube)
+        stages = leg_stages(leg)
+        for hinge, *_ in stages:
+            if hinge not in objects:
+                objects.append(hinge)
+
+        if len(stages) == 1:
+            for frame, deg in ((f_start, 0.0), (f_mid, half), (f_hold, leg.degrees),
+                               (f_swap, leg.degrees), (f_ret, half), (f_end, 0.0)):
+                hinges.append((leg.hinge, leg.axis, leg.sign, frame, deg))
+        else:
+            # Stage i turns over its slice of start..hold, back in reverse order
+            frames = stage_frames(len(stages), f_start, f_hold, f_swap, f_end)
+            for (hinge, axis, sign, degrees), (g0, g1, b0, b1) in zip(stages, frames):
+                for frame, deg in ((f_start, 0.0), (g0, 0.0), (g1, degrees),
+                                   (b0, degrees), (b1, 0.0), (f_end, 0.0)):
+                    hinges.append((hinge, axis, sign, frame, deg))
+
+        src = f"{leg.latch_prefix}_{leg.source}"
+        dst = f"{leg.latch_prefix}_{leg.dest}"
+        for frame, src_value in ((f_start, 1.0), (f_hold, 1.0),
+                                 (f_swap, 0.0), (f_end, 0.0)):
+            infl.append((src, frame, src_value))
+            infl.append((dst, frame, 1.0 - src_value))
+
+        end = f_end
+        offset += leg.frames[-1] - leg.frames[0] + 1
+
+    carry = _merge_carry(legs)
+    for child, parent in carry:
+        for name in (child, parent):
+            if name not in objects:
+                objects.append(name)
+
+    return CompiledTransfer(
+        legs=legs,
+        layout=first.layout,
+        carry=carry,
+        seats=tuple(seats),
+        capture_seat=seat_name(first.source) if first.capture_source else None,
+        ball_start=SEAT_WORLD[cube_name(first.source)] if first.ball_start else None,
+        latches=tuple(latches),
+        hinge_keys=tuple(hinges),
+        influence_keys=tuple(infl),
+        frame_range=(start, end),
+        objects=tuple(objects),
+    )
+
+################################################################################
+# SECTION 5: Transfer table — the existing C-series sequences
+################################################################################
+TRANSFERS = {
+    # C12 — Blue → Red: ball seat captured where C10 left it
+    "C12": TransferSpec(
+        name="C12", source="Blue", dest="Red",
+        hinge="Hinge_Blue_Red", axis=0, sign=+1.0,
+        capture_source=True, ball_start=False,
+    ),
+    # C13 — Red → Green: Red swings Hinge_BR + Blue with it
+    "C13": TransferSpec(
+        name="C13", source="Red", dest="Green",
+        hinge="Hinge_Red_Green", axis=1, sign=-1.0,
+        ball_start=False,
+    ),
+    # C14 — Green → Yellow: Green swings Red + Blue with it
+    "C14": TransferSpec(
+        name="C14", source="Green", dest="Yellow",
+        hinge="Hinge_Green_Yellow", axis=0, sign=-1.0,
+        capture_source=True,
+    ),
+    # C15 — Yellow → Blue: Green+Yellow swing as one unit over Blue+Red
+    "C15": TransferSpec(
+        name="C15", source="Yellow", dest="Blue",
+        hinge="Hinge_Red_Green", axis=1, sign=+1.0,
+        latch='CHILD_OF', latch_prefix="C15", layout="PIVOT",
+    ),
+}
@@ -0,0 +1,204 @@
+# ============================================================================
+# lorqb/stages.py
+# Staged (T-series) sequences — ordered hinge stages plus a transfer frame.
+# Pure Python (no bpy) so stage lists can be compiled and checked offline.
+#
+# T01–T03 each hand-wrote a six-key block per hinge (hold keys included)
+# for moves like "HBR 0°→180° over 1–80, hold, back over 200–240". Here a
+# T sequence is a list of stages — (target, axis, sign, degrees, start,
+# end): the target turns LINEAR from wherever it is to `degrees` between
+# start and end and holds there — plus the frame the ball swaps seats.
+# compile_stages() turns that into the rotation / influence keys, which
+# lorqb.staging writes in one KeyBatch flush.
+#
+# from_plan() takes the stages from the solver's plan for the pair
+# (lorqb.plans → lorqb.solver) and plays them on the T timeline; a plan
+# whose source seat ends more than SEAT_TOL off the destination seat is
+# rejected, since the ball would jump sideways at the swap.
+# ============================================================================
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+from lorqb.canon import BALL, SEAT_WORLD
+from lorqb.plans import plan_for, stage_frames
+from lorqb.specs import carry_links
+
+################################################################################
+# SECTION 1: Spec + compiled form
+################################################################################
+class Stage(NamedTuple):
+    label: str       # step name (console, T04 operators)
+    target: str      # hinge or cube that turns
+    axis: int        # rotation_euler index
+    sign: float
+    degrees: float   # angle reached at `end` (0 = back to rest)
+    start: int
+    end: int
+
+@dataclass(frozen=True)
+class StagedSpec:
+    name: str
+    source: str                  # color, e.g. "Blue"
+    dest: str
+    stages: tuple                # (Stage, ...) in play order
+    swap: int                    # ball switches seats on this frame
+    frames: tuple = (1, 240)
+    hierarchy: tuple = ()        # ((child, parent), ...) root first
+    layout: str = None           # reset positions ("PIVOT" / "SEATED"); None = keep
+    ball_start: tuple = None     # ball world location at the first frame
+    source_seat: str = None      # created at the ball, inside the source cube
+    dest_seat: str = None        # created at dest_world, inside the dest cube
+    dest_world: tuple = None
+
+class CompiledStages(NamedTuple):
+    rot_keys: tuple         # ((target, axis, sign, frame, degrees), ...)
+    influence_keys: tuple   # ((constraint, frame, value), ...)
+    seats: tuple            # ((seat, cube, world or None = at ball), ...)
+    latches: tuple          # ((constraint, seat), ...) source first
+    steps: tuple            # ((label, frame), ...) incl. Transfer / Return
+    frame_range: tuple
+    objects: tuple          # every object the sequence needs
+
+def latch_name(seat):
+    """Seat_Blue_Start → Latch_Blue_Start (the T-series naming)."""
+    return "Latch_" + seat[len("Seat_"):]
+
+################################################################################
+# SECTION 2: Compile
+################################################################################
+@lru_cache(maxsize=None)
+def compile_stages(spec):
+    start, end = spec.frames
+    motion  = {}   # target -> (axis, sign) of its first stage
+    angle   = {}   # target -> degrees reached so far
+    rot     = []
+    objects = [BALL]
+
+    for st in spec.stages:
+        if st.target not in motion:
+            motion[st.target] = (st.axis, st.sign)
+            angle[st.target]  = 0.0
+            objects.append(st.target)
+            rot.append((st.target, st.axis, st.sign, start, 0.0))
+        elif st.degrees and motion[st.target] != (st.axis, st.sign):
+            raise ValueError(f"{spec.name}: {st.target} turns on two axes/signs")
+        axis, sign = motion[st.target]
+        rot.append((st.target, axis, sign, st.start, angle[st.target]))   # hold
+        rot.append((st.target, axis, sign, st.end, st.degrees))
+        angle[st.target] = st.degrees
+    for target, (axis, sign) in motion.items():
+        rot.append((target, axis, sign, end, angle[target]))
+
+    src_cube, dst_cube = f"Cube_{spec.source}", f"Cube_{spec.dest}"
+    dest_world = spec.dest_world or SEAT_WORLD[dst_cube]
+    seats   = ((spec.source_seat, src_cube, None),
+               (spec.dest_seat, dst_cube, tuple(dest_world)))
+    src_con, dst_con = latch_name(spec.source_seat), latch_name(spec.dest_seat)
+    infl = []
+    for frame, value in ((start, 1.0), (spec.swap - 1, 1.0), (spec.swap, 0.0), (end, 0.0)):
+        infl.append((src_con, frame, value))
+        infl.append((dst_con, frame, 1.0 - value))
+
+    for name in (src_cube, dst_cube):
+        if name not in objects:
+            objects.append(name)
+    for child, parent in spec.hierarchy:
+        for name in (child, parent):
+            if name not in objects:
+                objects.append(name)
+
+    steps = tuple((st.label, st.end) for st in spec.stages if st.degrees)
+    steps += (("Transfer", spec.swap), ("Return", end))
+
+    return CompiledStages(
+        rot_keys=tuple(rot),
+        influence_keys=tuple(infl),
+        seats=seats,
+        latches=((src_con, spec.source_seat), (dst_con, spec.dest_seat)),
+        steps=steps,
+        frame_range=(start, end),
+        objects=tuple(objects),
+    )
+
+################################################################################
+# SECTION 3: Stages from a solver plan
+################################################################################
+_HBR, _HRG, _HGY = "Hinge_Blue_Red", "Hinge_Red_Green", "Hinge_Green_Yellow"
+_SHORT = {_HBR: "HBR", _HRG: "HRG", _HGY: "HGY"}
+
+# T timeline: stages up to 160, ball swaps on 161, stages unwind to 240
+T_START, T_HOLD, T_SWAP, T_END = 1, 160, 161, 240
+SEAT_TOL = 0.005   # metres the source seat may end off the destination seat
+
+def _root_first(links):
+    """(child, parent) links sorted so every parent comes before its children."""
+    parents = dict(links)
+
+    def depth(name):
+        return 0 if name not in parents else 1 + depth(parents[name])
+    return tuple(sorted(parents.items(), key=lambda link: depth(link[0])))
+
+def from_plan(name, source, dest, **fields):
+    """StagedSpec playing the solver's plan for source → dest on the T timeline."""
+    entry = plan_for(source, dest)
+    if entry is None or entry["error"] > SEAT_TOL:
+        off = "no valid plan" if entry is None else f"off by {entry['error']:.3f}"
+        raise ValueError(f"{name}: {source}'s seat does not land on {dest}'s ({off})")
+
+    plan   = entry["stages"]
+    frames = stage_frames(len(plan), T_START, T_HOLD, T_SWAP, T_END)
+    go, back, links = [], [], []
+    for st, (go_start, go_end, back_start, back_end) in zip(plan, frames):
+        short = _SHORT[st["hinge"]]
+        go.append(Stage(f"{short} {st['degrees']:g}°", st["hinge"], st["axis"],
+                        st["sign"], st["degrees"], go_start, go_end))
+        back.append(Stage(f"{short} back", st["hinge"], st["axis"],
+                          st["sign"], 0.0, back_start, back_end))
+        links.extend((child, parent) for child, parent in carry_links(st["hinge"], source)
+                     if (child, parent) not in links)
+    back.sort(key=lambda st: st.start)
+
+    return StagedSpec(
+        name=name, source=source, dest=dest,
+        stages=tuple(go + back), swap=T_SWAP, frames=(T_START, T_END),
+        hierarchy=_root_first(links), **fields)
+
+################################################################################
+# SECTION 4: Staged table — the T-series sequences
+################################################################################
+
+STAGED = {
+    # T01 — Blue → Green: HBR flips Blue over Red, HRG swings it onto Green
+    # HRG (root) → Red → HBR → Blue; Green fixed
+    "T01": from_plan(
+        "T01", "Blue", "Green",
+        layout="PIVOT",
+        ball_start=(0.51, 0.51, 0.25),
+        source_seat="Seat_Blue_Start", dest_seat="Seat_Green",
+    ),
+    # T02 — Yellow → Red (diagonal): HRG swings Yellow toward Red, HGY flips
+    # it over; HRG → Green → HGY → Yellow; Red fixed; transforms kept as found
+    "T02": from_plan(
+        "T02", "Yellow", "Red",
+        ball_start=(-0.51, 0.51, 0.25),
+        source_seat="Seat_Yellow_Start", dest_seat="Seat_Red",
+    ),
+    # T03 — Red → Yellow: HRG flips Red over Green, HGY tips it onto Yellow
+    # HGY (root) → Green → HRG → Red → HBR → Blue; Yellow fixed
+    "T03": from_plan(
+        "T03", "Red", "Yellow",
+        layout="PIVOT",
+        ball_start=(0.51, -0.51, 0.25),
+        source_seat="Seat_Red_Start", dest_seat="Seat_Yellow_Side",
+    ),
+    # T04 — Green → Blue: HRG flips Green over Red, HBR tips it onto Blue
+    # HBR (root) → Red → HRG → Green → HGY → Yellow; Blue fixed
+    "T04": from_plan(
+        "T04", "Green", "Blue",
+        layout="PIVOT",
+        ball_start=(-0.51, -0.51, 0.25),
+        source_seat="Seat_Green_Start", dest_seat="Seat_Blue",
+    ),
+}
@@ -0,0 +1,144 @@
+# ============================================================================
+# lorqb/staging.py  (Blender 5.1.1)
+# Staging engine — arms a StagedSpec (lorqb.stages) in the open scene.
+#
+# build_staged(spec) does what T01–T03 each did by hand:
+#   reset → hierarchy (closed form) → ball start → seats → latches →
+#   every stage's rotation keys + latch influences in one KeyBatch flush.
+# step(spec, label) jumps the timeline to the end of a stage (or to the
+# transfer / return frame), arming first if the scene holds another spec —
+# the T04 panel's stage buttons are just step() calls.
+# ============================================================================
+
+from functools import lru_cache
+
+import bpy
+import mathutils
+
+from lorqb.canon import BALL, LAYOUTS, SEAT_NAMES
+from lorqb.chain import apply_chain
+from lorqb.framecache import mark_armed
+from lorqb.keyframes import KeyBatch
+from lorqb.latches import LatchSet
+from lorqb.reset import ResetProfile, reset_scene
+from lorqb.sequence import create_seat, remove_rigid_body
+from lorqb.stages import compile_stages
+
+# Scene property naming the armed StagedSpec
+ARMED = "lorqb_staged"
+
+################################################################################
+# SECTION 1: Reset profile
+################################################################################
+@lru_cache(maxsize=None)
+def reset_profile(spec):
+    positions = tuple(LAYOUTS[spec.layout].items()) if spec.layout else None
+    return ResetProfile(
+        positions=positions,
+        seats=tuple(dict.fromkeys((spec.source_seat, spec.dest_seat, *SEAT_NAMES))),
+    )
+
+def reset_for(spec):
+    bpy.context.scene.pop(ARMED, None)
+    return reset_scene(reset_profile(spec))
+
+################################################################################
+# SECTION 2: Build
+################################################################################
+def build_staged(spec, reset=True):
+    """Arm spec in the open scene. Returns True on success.
+
+    reset=False keeps the scene as found (T02 under Run ALL).
+    """
+    c = compile_stages(spec)
+    scene = bpy.context.scene
+    start = c.frame_range[0]
+
+    # --- 2A: Standalone reset ---
+    if reset:
+        reset_for(spec)
+
+    # --- 2B: Validate all required objects ---
+    objs = {name: bpy.data.objects.get(name) for name in c.objects}
+    missing = [name for name, obj in objs.items() if obj is None]
+    if missing:
+        print("ERROR: Missing:", missing)
+        return False
+    ball = objs[BALL]
+
+    # --- 2C: Rest rotation on every stage target, hierarchy in closed form ---
+    scene.frame_set(start)
+    for target, *_ in c.rot_keys:
+        objs[target].rotation_mode  = 'XYZ'
+        objs[target].rotation_euler = (0.0, 0.0, 0.0)
+    bpy.context.view_layer.update()
+    apply_chain(spec.hierarchy)
+    print("Hierarchy: " + ", ".join(f"{child} → {parent}" for child, parent in spec.hierarchy))
+
+    # --- 2D: Ball start ---
+    remove_rigid_body(ball)
+    keys = KeyBatch()
+    if spec.ball_start is not None:
+        ball.location = mathutils.Vector(spec.ball_start)
+        keys.key_location(ball, start, ball.location)
+    bpy.context.view_layer.update()
+
+    # --- 2E: Seats (source at the ball — no jump on arm) ---
+    latches = LatchSet(ball)
+    latches.hold(None)
+    seats = {}
+    for name, cube, world in c.seats:
+        world = ball.matrix_world.translation.copy() if world is None else mathutils.Vector(world)
+        seats[name] = latches.seat_for(name, world) or create_seat(name, objs[cube], world)
+        print(f"{name} inside {cube} at {tuple(round(v, 4) for v in world)}.")
+    bpy.context.view_layer.update()
+
+    # --- 2F: Latches (persistent ones are reused) ---
+    for con_name, seat in c.latches:
+        if latches.latch_for(con_name, seats[seat]) is not None:
+            continue
+        con = ball.constraints.new(type='COPY_TRANSFORMS')
+        con.name   = con_name
+        con.target = seats[seat]
+
+    # --- 2G: Stage rotations (LINEAR) + latch influences (CONSTANT) ---
+    for target, axis, sign, frame, degrees in c.rot_keys:
+        keys.key_rot(objs[target], axis, sign, frame, degrees)
+    for con_name, frame, value in c.influence_keys:
+        keys.key_influence(ball, con_name, frame, value)
+    written = keys.flush()
+    print(f"{written} keys written.")
+
+    # --- 2H: Frame range ---
+    scene.frame_start, scene.frame_end = c.frame_range
+    scene.frame_set(start)
+    scene[ARMED] = spec.name
+    mark_armed(spec)
+    return True
+
+################################################################################
+# SECTION 3: Step
+################################################################################
+def is_armed(spec):
+    return bpy.context.scene.get(ARMED) == spec.name
+
+def step(spec, label):
+    """Jump to the end of stage label ("Transfer" / "Return" too).
+
+    Arms spec first when the scene is not already armed with it.
+    Returns the frame, or None on failure.
+    """
+    frames = dict(compile_stages(spec).steps)
+    if label not in frames:
+        raise KeyError(f"{spec.name} has no step {label!r}")
+    if not is_armed(spec) and not build_staged(spec):
+        return None
+    bpy.context.scene.frame_set(frames[label])
+    return frames[label]
+
+def describe(spec):
+    """Console lines for spec's stages and swap."""
+    lines = [f"{st.label:12} {st.target} {'XYZ'[st.axis]} → {st.degrees:g}° "
+             f"({st.start}–{st.end})" for st in spec.stages]
+    lines.append(f"Frame {spec.swap}: ball transfers {spec.source} → {spec.dest}")
+    return lines
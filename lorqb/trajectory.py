@@ -0,0 +1,46 @@
+# ============================================================================
+# lorqb/trajectory.py
+# Trajectory — world matrices of named objects over a frame range.
+# Pure Python + NumPy (no bpy): produced by lorqb.sampler (from Blender)
+# and lorqb.kinematics (closed form), consumed by the checks.
+# ============================================================================
+
+from typing import NamedTuple
+
+import numpy as np
+
+from lorqb.canon import BALL, CUBE_NAMES, HINGE_NAMES, SEAT_NAMES
+
+# Default object columns, in this order
+SAMPLE_NAMES = (BALL, *CUBE_NAMES, *SEAT_NAMES, *HINGE_NAMES)
+
+class Trajectory(NamedTuple):
+    frames:   np.ndarray   # (F,) frame numbers
+    names:    tuple        # (N,) object names, column order
+    matrices: np.ndarray   # (F, N, 4, 4) row-major world matrices; NaN = missing
+
+    def index(self, name):
+        return self.names.index(name)
+
+    def matrix(self, name):
+        """(F, 4, 4) world matrices of one object."""
+        return self.matrices[:, self.index(name)]
+
+    def locations(self):
+        """(F, N, 3) world translations."""
+        return self.matrices[:, :, :3, 3]
+
+    def location(self, name):
+        """(F, 3) world translation of one object."""
+        return self.matrices[:, self.index(name), :3, 3]
+
+    def distance(self, a, b):
+        """(F,) distance between the origins of a and b at every frame."""
+        return np.linalg.norm(self.location(a) - self.location(b), axis=-1)
+
+    def at(self, frame):
+        """{name: (4, 4)} at one sampled frame."""
+        i = int(np.searchsorted(self.frames, frame))
+        if i >= len(self.frames) or self.frames[i] != frame:
+            raise KeyError(f"frame {frame} was not sampled")
+        return dict(zip(self.names, self.matrices[i]))
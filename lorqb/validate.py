@@ -0,0 +1,132 @@
+# ============================================================================
+# lorqb/validate.py
+# Parallel validation across background Blender worker processes.
+# Pure Python (no bpy) — runs outside Blender, driven by lorqb_validate.py.
+#
+# Every sequence resets the same global scene, so one Blender session can
+# only run them one after another. Here the keys are split into chunks and
+# a pool of N threads each launches its own `blender -b` on the .blend with
+# lorqb_batch.py, so N sequences bake at once (one per core). Each worker
+# writes its lorqb.batch JSON to a temp file; the driver merges them.
+#
+# Cube-order permutations (the README's future shuffle) are expanded into
+# their cube-to-cube transfers. Each transfer resets the scene first, so
+# it does not depend on the order around it: the 24 orders share just 12
+# distinct transfers, which run once each and are then scored per order.
+# ============================================================================
+
+import itertools
+import json
+import os
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from lorqb.canon import COLORS
+from lorqb.paths import BLEND_FILE, REPO_ROOT
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+BATCH_SCRIPT = os.path.join(REPO_ROOT, "lorqb_batch.py")
+BLENDER      = os.environ.get("BLENDER", "blender")
+
+# Level 1 catalog entries (lorqb.loader.SEQUENCES without the C10 build)
+LEVEL1 = ("C12", "C13", "C14", "C15", "T01", "T02", "T03", "T04")
+
+STDERR_TAIL = 2000   # characters of a failed worker's output kept in results
+
+################################################################################
+# SECTION 2: Jobs
+################################################################################
+def transfer_key(source, dest):
+    return f"{source}>{dest}"   # same format as lorqb.batch.transfer_key
+
+def order_key(order):
+    return ">".join(order)
+
+def permutation_transfers(colors=COLORS, cyclic=True):
+    """{order key: [transfer keys]} for every ordering of colors.
+
+    cyclic adds the hand-back from the last cube to the first, as the Level 1
+    loop does (C15: Yellow → Blue).
+    """
+    orders = {}
+    for order in itertools.permutations(colors):
+        stops = order + order[:1] if cyclic else order
+        orders[order_key(order)] = [transfer_key(a, b) for a, b in zip(stops, stops[1:])]
+    return orders
+
+def unique_keys(*groups):
+    """Keys from every group, first occurrence wins."""
+    return list(dict.fromkeys(k for group in groups for k in group))
+
+def chunked(keys, size):
+    return [keys[i:i + size] for i in range(0, len(keys), size)]
+
+################################################################################
+# SECTION 3: Workers
+################################################################################
+def run_worker(keys, blender=BLENDER, blend=BLEND_FILE, frames=True, continuity=False,
+               clearance=False, workdir=None):
+    """Run keys in one background Blender; returns {key: lorqb.batch result}."""
+    fd, out = tempfile.mkstemp(prefix="lorqb_worker_", suffix=".json", dir=workdir)
+    os.close(fd)
+    cmd = [blender, "-b", "--factory-startup", blend, "--python", BATCH_SCRIPT,
+           "--", "--sequences", ",".join(keys), "--output", out]
+    if not frames:
+        cmd.append("--no-frames")
+    if continuity:
+        cmd.append("--continuity")
+    if clearance:
+        cmd.append("--clearance")
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        try:
+            with open(out, "r", encoding="utf-8") as f:
+                results = json.load(f)["sequences"]
+        except (OSError, ValueError, KeyError):
+            tail = (proc.stdout + proc.stderr)[-STDERR_TAIL:]
+            error = f"worker exited with {proc.returncode} without results:\n{tail}"
+            results = {k: {"ok": False, "error": error, "seconds": 0.0, "frame_range": None}
+                       for k in keys}
+    finally:
+        try:
+            os.remove(out)
+        except OSError:
+            pass
+    return results
+
+def validate(keys, workers=None, chunk=1, **worker_args):
+    """Run keys across a pool of Blender processes; merged {key: result}."""
+    workers = workers or os.cpu_count() or 1
+    jobs    = chunked(list(keys), max(1, chunk))
+    results = {}
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_worker, job, **worker_args): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                done = future.result()
+            except Exception as e:   # Blender missing, not executable, ...
+                done = {k: {"ok": False, "error": f"{type(e).__name__}: {e}",
+                            "seconds": 0.0, "frame_range": None} for k in job}
+            # The scene build (C10) a worker may add is not a requested key
+            for k in job:
+                results[k] = done.get(k) or {"ok": False, "error": "no result",
+                                             "seconds": 0.0, "frame_range": None}
+            passed = sum(results[k]["ok"] for k in job)
+            print(f"lorqb.validate: {', '.join(job)} — {passed}/{len(job)} ok")
+    print(f"lorqb.validate: {len(results)} keys on {workers} workers "
+          f"in {time.perf_counter() - t0:.1f}s")
+    return results
+
+def score_orders(orders, results):
+    """{order key: {"ok", "failed": [transfer keys]}} from per-transfer results."""
+    scored = {}
+    for order, keys in orders.items():
+        failed = [k for k in keys if not results.get(k, {}).get("ok")]
+        scored[order] = {"ok": not failed, "transfers": keys, "failed": failed}
+    return scored
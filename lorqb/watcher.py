@@ -0,0 +1,95 @@
+# ============================================================================
+# lorqb/watcher.py  (Blender 5.1.1)
+# Hot-reload watcher for the C and T scripts.
+#
+# A bpy.app.timers callback polls the mtimes of C_series/ and T_series/
+# with one os.scandir() per folder. When a script that lorqb.loader has
+# already loaded changes on disk, only that module is reloaded and only
+# its own classes are swapped — no Alt+P, no _unregister_all_lorqb().
+#
+# Usage (Text Editor / Python console):
+#   from lorqb import watcher; watcher.start()
+# ============================================================================
+
+import os
+
+import bpy
+
+from lorqb import loader
+from lorqb.paths import REPO_ROOT
+
+################################################################################
+# SECTION 1: Constants
+################################################################################
+WATCH_DIRS    = ("C_series", "T_series")
+POLL_INTERVAL = 1.0   # seconds
+
+# path -> st_mtime_ns from the previous poll
+_mtimes = {}
+
+################################################################################
+# SECTION 2: Scan
+################################################################################
+def scan():
+    """Current {path: (package, stem, mtime)} of every watched script."""
+    found = {}
+    for package in WATCH_DIRS:
+        folder = os.path.join(REPO_ROOT, package)
+        try:
+            entries = os.scandir(folder)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name.startswith("__"):
+                    continue
+                found[entry.path] = (package, entry.name[:-3], entry.stat().st_mtime_ns)
+    return found
+
+def poll():
+    """Reload changed, already-loaded modules. Returns the reloaded names."""
+    reloaded = []
+    current = scan()
+    for path, (package, stem, mtime) in current.items():
+        previous = _mtimes.get(path)
+        _mtimes[path] = mtime
+        if previous is None or previous == mtime:
+            continue
+        name = f"{package}.{stem}"
+        if not loader.is_loaded(name):
+            continue   # not loaded yet — the next run picks up the new file
+        try:
+            loader.load_module(package, stem)
+            reloaded.append(name)
+        except Exception as e:
+            print(f"lorqb.watcher: reload of {name} failed: {e!r}")
+    for path in [p for p in _mtimes if p not in current]:
+        del _mtimes[path]
+    return reloaded
+
+################################################################################
+# SECTION 3: Timer
+################################################################################
+def _tick():
+    reloaded = poll()
+    if reloaded:
+        print("lorqb.watcher: reloaded", ", ".join(reloaded))
+    return POLL_INTERVAL
+
+def is_running():
+    return bpy.app.timers.is_registered(_tick)
+
+def start():
+    if is_running():
+        return
+    # Baseline mtimes so files unchanged since start are not reloaded
+    _mtimes.clear()
+    for path, (_, _, mtime) in scan().items():
+        _mtimes[path] = mtime
+    bpy.app.timers.register(_tick, first_interval=POLL_INTERVAL, persistent=True)
+    print(f"lorqb.watcher: polling {', '.join(WATCH_DIRS)} every {POLL_INTERVAL}s")
+
+def stop():
+    if is_running():
+        bpy.app.timers.unregister(_tick)
+        print("lorqb.watcher: stopped")
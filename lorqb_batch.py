@@ -0,0 +1,84 @@
+# lorqb_batch.py
+# Headless batch runner — builds the scene, arms each sequence, evaluates
+# all frames and writes the results as JSON (lorqb.batch).
+#
+# Usage:
+#   blender -b C17_Master_Runner.blend --python lorqb_batch.py -- --sequences C12,C13,T01
+#
+# Options (after "--"):
+#   --sequences C12,T01   sequences to run (default: all except C10);
+#                         "Blue>Green" arms any cube pair from its spec
+#                         "Blue>Red>Green" composes a whole level
+#                         (quote them in the shell)
+#   --build               rebuild the scene with C10 first (automatic when
+#                         any LorQB object is missing)
+#   --output PATH         results file (default: lorqb_batch_results.json)
+#   --no-frames           skip the per-frame positions, keep pass/fail only
+#   --pairs               also run all 12 cube pairs ("Blue>Red", ...)
+#   --diagnose            also run the spec-driven checks (lorqb.diagnostics)
+#                         and fail a sequence when any check fails
+#   --continuity          check the ball does not jump at any latch swap beyond
+#                         its designed drop (lorqb.continuity)
+#   --clearance           per-frame ball vs. cube-wall clearance
+#                         (lorqb.clearance); fails on penetration
+#
+# Exit code is 1 when any sequence failed, so CI loops can check it.
+
+import argparse
+import os
+import sys
+
+import bpy
+
+# Shared lorqb package lives next to this file
+LORQB_ROOT = os.path.dirname(os.path.abspath(globals().get("__file__", "")))
+if LORQB_ROOT not in sys.path:
+    sys.path.insert(0, LORQB_ROOT)
+
+from lorqb import batch
+
+def parse_args(argv):
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="lorqb_batch.py")
+    parser.add_argument("--sequences", default="",
+                        help="comma-separated keys, e.g. C12,C13,T01,Blue>Green,Blue>Red>Green")
+    parser.add_argument("--build", action="store_true",
+                        help="rebuild the scene with C10 first")
+    parser.add_argument("--output", default="lorqb_batch_results.json")
+    parser.add_argument("--no-frames", action="store_true",
+                        help="do not record per-frame positions")
+    parser.add_argument("--pairs", action="store_true",
+                        help="append all 12 cube pairs to the sequences")
+    parser.add_argument("--diagnose", action="store_true",
+                        help="run the spec-driven checks for every sequence")
+    parser.add_argument("--continuity", action="store_true",
+                        help="check ball continuity at every latch swap")
+    parser.add_argument("--clearance", action="store_true",
+                        help="check ball clearance to the cube walls on every frame")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv)
+    keys = [k.strip() for k in args.sequences.split(",") if k.strip()]
+    keys = keys or batch.default_sequences()
+    if args.pairs:
+        keys += [k for k in batch.all_pairs() if k not in keys]
+
+    print(f"\n=== LorQB batch: {', '.join(keys)} ===")
+    results = batch.run_all(keys, build=args.build, frames=not args.no_frames,
+                            checks=args.diagnose, continuity=args.continuity,
+                            clearance=args.clearance)
+    report  = batch.write_results(args.output, results)
+
+    print("\n=== Summary ===")
+    for key, r in results.items():
+        status = "ok" if r["ok"] else f"FAILED — {r['error']}"
+        print(f"  {key}: {status}")
+    print(f"Results: {os.path.abspath(args.output)}")
+    return 0 if report["ok"] else 1
+
+if __name__ == "__main__":
+    code = main()
+    # Only headless runs exit — inside the UI this would close Blender
+    if bpy.app.background:
+        sys.exit(code)
@@ -0,0 +1,79 @@
+# lorqb_validate.py
+# Parallel sequence validation — runs lorqb_batch.py in N background
+# Blender processes at once and merges their results (lorqb.validate).
+# Plain Python: run it with any Python 3, not inside Blender.
+#
+# Usage:
+#   python lorqb_validate.py                        # C12–C15, T01–T03
+#   python lorqb_validate.py --permutations -j 8    # + every cube order
+#   python lorqb_validate.py --permutations --continuity
+#
+# Options:
+#   --blender PATH      Blender executable (default: $BLENDER or "blender")
+#   --blend PATH        scene file (default: C17_Master_Runner.blend)
+#   --sequences C12,T01 keys to run (default: Level 1 catalog)
+#   --permutations      also validate all 24 cube orders (README shuffle)
+#   -j / --workers N    Blender processes at once (default: CPU count)
+#   --chunk N           keys per Blender process (default: 1)
+#   --output PATH       merged results (default: lorqb_validate_results.json)
+#   --no-frames         pass/fail only, no per-frame trajectories
+#   --continuity        fail a key whose ball jumps at a latch swap
+#   --clearance         fail a key whose ball passes through a cube wall
+#
+# Exit code is 1 when any key or order failed.
+
+import argparse
+import json
+import os
+import sys
+
+# Shared lorqb package lives next to this file
+LORQB_ROOT = os.path.dirname(os.path.abspath(__file__))
+if LORQB_ROOT not in sys.path:
+    sys.path.insert(0, LORQB_ROOT)
+
+from lorqb import validate
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="lorqb_validate.py")
+    parser.add_argument("--blender", default=validate.BLENDER)
+    parser.add_argument("--blend", default=validate.BLEND_FILE)
+    parser.add_argument("--sequences", default=",".join(validate.LEVEL1))
+    parser.add_argument("--permutations", action="store_true")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=1)
+    parser.add_argument("--output", default="lorqb_validate_results.json")
+    parser.add_argument("--no-frames", action="store_true")
+    parser.add_argument("--continuity", action="store_true")
+    parser.add_argument("--clearance", action="store_true")
+    return parser.parse_args(argv)
+
+def main():
+    args   = parse_args()
+    keys   = [k.strip() for k in args.sequences.split(",") if k.strip()]
+    orders = validate.permutation_transfers() if args.permutations else {}
+    keys   = validate.unique_keys(keys, *orders.values())
+
+    print(f"=== LorQB validate: {len(keys)} keys ===")
+    results = validate.validate(keys, workers=args.workers, chunk=args.chunk,
+                                blender=args.blender, blend=args.blend,
+                                frames=not args.no_frames, continuity=args.continuity,
+                                clearance=args.clearance)
+    scored = validate.score_orders(orders, results)
+
+    ok = all(r["ok"] for r in results.values()) and all(o["ok"] for o in scored.values())
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"ok": ok, "sequences": results, "orders": scored}, f, indent=1)
+
+    print("\n=== Summary ===")
+    for key in keys:
+        r = results[key]
+        print(f"  {key}: {'ok' if r['ok'] else 'FAILED — ' + str(r['error']).splitlines()[0]}")
+    if scored:
+        passed = sum(o["ok"] for o in scored.values())
+        print(f"  orders: {passed}/{len(scored)} ok")
+    print(f"Results: {os.path.abspath(args.output)}")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())